@@ -0,0 +1,67 @@
+"""index quiz attempts and add user_quiz_best
+
+Revision ID: 0f4d3b8a2c71
+Revises: e7a94c2d1b60
+Create Date: 2026-10-19 16:58:12.330584
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0f4d3b8a2c71'
+down_revision = 'e7a94c2d1b60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_user_quiz_attempts_user_quiz_started", "user_quiz_attempts",
+        ["user_id", "quiz_id", "started_at"], unique=False,
+    )
+    op.create_index(
+        "ix_user_quiz_attempts_user_quiz_score", "user_quiz_attempts",
+        ["user_id", "quiz_id", "score"], unique=False,
+    )
+
+    op.create_table(
+        "user_quiz_best",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("quiz_id", sa.String(), nullable=False),
+        sa.Column("attempt_id", sa.String(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("passed", sa.Boolean(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["quiz_id"], ["quizzes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["attempt_id"], ["user_quiz_attempts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "quiz_id", name="pk_user_quiz_best"),
+    )
+
+    # Highest score wins; ties go to the earliest attempt, as they do on insert
+    op.execute(
+        """
+        INSERT INTO user_quiz_best (user_id, quiz_id, attempt_id, score, passed, attempts, updated_at)
+        SELECT user_id, quiz_id, id, score, ever_passed, attempts, NOW()
+        FROM (
+            SELECT
+                id, user_id, quiz_id, score,
+                ROW_NUMBER() OVER (
+                    PARTITION BY user_id, quiz_id ORDER BY score DESC, started_at ASC, id ASC
+                ) AS position,
+                BOOL_OR(COALESCE(passed, FALSE)) OVER (PARTITION BY user_id, quiz_id) AS ever_passed,
+                COUNT(*) OVER (PARTITION BY user_id, quiz_id) AS attempts
+            FROM user_quiz_attempts
+        ) ranked
+        WHERE position = 1
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("user_quiz_best")
+    op.drop_index("ix_user_quiz_attempts_user_quiz_score", table_name="user_quiz_attempts")
+    op.drop_index("ix_user_quiz_attempts_user_quiz_started", table_name="user_quiz_attempts")
@@ -0,0 +1,32 @@
+"""staging table for quiz analytics backfills
+
+Revision ID: 2d6b9f4e8a31
+Revises: a8d3f6c1e927
+Create Date: 2026-10-20 14:12:46.208415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d6b9f4e8a31'
+down_revision = 'a8d3f6c1e927'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "quiz_stat_backfills",
+        sa.Column("quiz_id", sa.String(), nullable=False),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["quiz_id"], ["quizzes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("quiz_id", "metric", "key", name="pk_quiz_stat_backfills"),
+    )
+
+
+def downgrade():
+    op.drop_table("quiz_stat_backfills")
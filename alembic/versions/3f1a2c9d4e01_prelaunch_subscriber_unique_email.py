@@ -0,0 +1,40 @@
+"""unique email per prelaunch campaign
+
+Revision ID: 3f1a2c9d4e01
+Revises: 
+Create Date: 2026-10-19 09:12:44.118203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a2c9d4e01'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the earliest subscription when the same email signed up twice
+    op.execute("""
+        DELETE FROM prelaunch_subscribers a
+        USING prelaunch_subscribers b
+        WHERE a.campaign_id = b.campaign_id
+          AND a.email = b.email
+          AND (a.subscribed_at, a.id) > (b.subscribed_at, b.id)
+    """)
+    op.create_unique_constraint(
+        "uq_prelaunch_subscribers_campaign_email",
+        "prelaunch_subscribers",
+        ["campaign_id", "email"],
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "uq_prelaunch_subscribers_campaign_email",
+        "prelaunch_subscribers",
+        type_="unique",
+    )
@@ -0,0 +1,29 @@
+"""add version to series and booklets for detail caching
+
+Revision ID: 5b9e2c7d4a18
+Revises: 0f4d3b8a2c71
+Create Date: 2026-10-19 18:21:43.207914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e2c7d4a18'
+down_revision = '0f4d3b8a2c71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ("series", "booklets"):
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+        )
+
+
+def downgrade():
+    for table in ("booklets", "series"):
+        op.drop_column(table, "version")
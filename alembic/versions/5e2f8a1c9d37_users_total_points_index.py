@@ -0,0 +1,24 @@
+"""index users by total points
+
+Revision ID: 5e2f8a1c9d37
+Revises: c41d9e7f2b58
+Create Date: 2026-10-19 12:40:51.287733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2f8a1c9d37'
+down_revision = 'c41d9e7f2b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f("ix_users_total_points"), "users", ["total_points"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_users_total_points"), table_name="users")
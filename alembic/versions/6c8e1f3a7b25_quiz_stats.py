@@ -0,0 +1,32 @@
+"""quiz analytics rollups
+
+Revision ID: 6c8e1f3a7b25
+Revises: d2b7a4e9c610
+Create Date: 2026-10-19 15:48:03.771942
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c8e1f3a7b25'
+down_revision = 'd2b7a4e9c610'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "quiz_stats",
+        sa.Column("quiz_id", sa.String(), nullable=False),
+        sa.Column("metric", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["quiz_id"], ["quizzes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("quiz_id", "metric", "key", name="pk_quiz_stats"),
+    )
+
+
+def downgrade():
+    op.drop_table("quiz_stats")
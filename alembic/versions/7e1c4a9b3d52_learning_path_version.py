@@ -0,0 +1,27 @@
+"""add version to learning paths for detail caching
+
+Revision ID: 7e1c4a9b3d52
+Revises: 2d6b9f4e8a31
+Create Date: 2026-10-20 16:05:32.914620
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e1c4a9b3d52'
+down_revision = '2d6b9f4e8a31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "learning_paths",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+
+
+def downgrade():
+    op.drop_column("learning_paths", "version")
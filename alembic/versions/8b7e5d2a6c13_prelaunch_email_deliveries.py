@@ -0,0 +1,47 @@
+"""prelaunch email delivery log
+
+Revision ID: 8b7e5d2a6c13
+Revises: 3f1a2c9d4e01
+Create Date: 2026-10-19 10:03:27.541860
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b7e5d2a6c13'
+down_revision = '3f1a2c9d4e01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "prelaunch_email_deliveries",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("email_id", sa.String(), nullable=False),
+        sa.Column("subscriber_id", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["email_id"], ["prelaunch_emails.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["subscriber_id"], ["prelaunch_subscribers.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email_id", "subscriber_id", name="uq_prelaunch_email_deliveries_email_subscriber"),
+    )
+    op.create_index(op.f("ix_prelaunch_email_deliveries_id"), "prelaunch_email_deliveries", ["id"], unique=False)
+    op.create_index(
+        op.f("ix_prelaunch_email_deliveries_subscriber_id"),
+        "prelaunch_email_deliveries",
+        ["subscriber_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_prelaunch_email_deliveries_subscriber_id"), table_name="prelaunch_email_deliveries")
+    op.drop_index(op.f("ix_prelaunch_email_deliveries_id"), table_name="prelaunch_email_deliveries")
+    op.drop_table("prelaunch_email_deliveries")
@@ -0,0 +1,52 @@
+"""append-only points ledger
+
+Revision ID: 9a3c6f0e2d14
+Revises: 5e2f8a1c9d37
+Create Date: 2026-10-19 13:52:18.660941
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3c6f0e2d14'
+down_revision = '5e2f8a1c9d37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "points_ledger",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("experience", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("reason", sa.String(), nullable=False),
+        sa.Column("source_type", sa.String(), nullable=True),
+        sa.Column("source_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "reason", "source_id", name="uq_points_ledger_user_reason_source"),
+    )
+    op.create_index(op.f("ix_points_ledger_id"), "points_ledger", ["id"], unique=False)
+    op.create_index(op.f("ix_points_ledger_created_at"), "points_ledger", ["created_at"], unique=False)
+    op.create_index("ix_points_ledger_user_created", "points_ledger", ["user_id", "created_at"], unique=False)
+
+    # Open the ledger with each user's current balance so it sums to what's stored
+    op.execute("""
+        INSERT INTO points_ledger (id, user_id, points, experience, reason, source_type, source_id)
+        SELECT 'opening-' || id, id, COALESCE(total_points, 0), COALESCE(experience, 0),
+               'opening_balance', 'user', id
+        FROM users
+        WHERE COALESCE(total_points, 0) <> 0 OR COALESCE(experience, 0) <> 0
+    """)
+
+
+def downgrade():
+    op.drop_index("ix_points_ledger_user_created", table_name="points_ledger")
+    op.drop_index(op.f("ix_points_ledger_created_at"), table_name="points_ledger")
+    op.drop_index(op.f("ix_points_ledger_id"), table_name="points_ledger")
+    op.drop_table("points_ledger")
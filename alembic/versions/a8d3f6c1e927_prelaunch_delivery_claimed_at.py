@@ -0,0 +1,29 @@
+"""claim time on prelaunch email deliveries
+
+Revision ID: a8d3f6c1e927
+Revises: 5b9e2c7d4a18
+Create Date: 2026-10-20 09:41:18.530127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3f6c1e927'
+down_revision = '5b9e2c7d4a18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "prelaunch_email_deliveries",
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Deliveries left pending by earlier crashes become reclaimable once their lease is up
+    op.execute("UPDATE prelaunch_email_deliveries SET claimed_at = created_at WHERE status = 'pending'")
+
+
+def downgrade():
+    op.drop_column("prelaunch_email_deliveries", "claimed_at")
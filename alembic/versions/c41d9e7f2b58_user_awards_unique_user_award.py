@@ -0,0 +1,40 @@
+"""unique award per user
+
+Revision ID: c41d9e7f2b58
+Revises: 8b7e5d2a6c13
+Create Date: 2026-10-19 11:26:05.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d9e7f2b58'
+down_revision = '8b7e5d2a6c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the earliest grant when a user was given the same award twice
+    op.execute("""
+        DELETE FROM user_awards a
+        USING user_awards b
+        WHERE a.user_id = b.user_id
+          AND a.award_id = b.award_id
+          AND (a.earned_at, a.id) > (b.earned_at, b.id)
+    """)
+    op.create_unique_constraint(
+        "uq_user_awards_user_award",
+        "user_awards",
+        ["user_id", "award_id"],
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "uq_user_awards_user_award",
+        "user_awards",
+        type_="unique",
+    )
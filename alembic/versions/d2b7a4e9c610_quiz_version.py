@@ -0,0 +1,27 @@
+"""add version to quizzes for answer-key caching
+
+Revision ID: d2b7a4e9c610
+Revises: 9a3c6f0e2d14
+Create Date: 2026-10-19 15:02:17.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b7a4e9c610'
+down_revision = '9a3c6f0e2d14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "quizzes",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+
+
+def downgrade():
+    op.drop_column("quizzes", "version")
@@ -0,0 +1,30 @@
+"""add client ids to quiz questions and answers for bulk import
+
+Revision ID: e7a94c2d1b60
+Revises: 6c8e1f3a7b25
+Create Date: 2026-10-19 16:21:44.902113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a94c2d1b60'
+down_revision = '6c8e1f3a7b25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("quiz_questions", sa.Column("client_id", sa.String(), nullable=True))
+    op.add_column("quiz_answers", sa.Column("client_id", sa.String(), nullable=True))
+    op.create_unique_constraint("uq_quiz_questions_quiz_client", "quiz_questions", ["quiz_id", "client_id"])
+    op.create_unique_constraint("uq_quiz_answers_question_client", "quiz_answers", ["question_id", "client_id"])
+
+
+def downgrade():
+    op.drop_constraint("uq_quiz_answers_question_client", "quiz_answers", type_="unique")
+    op.drop_constraint("uq_quiz_questions_quiz_client", "quiz_questions", type_="unique")
+    op.drop_column("quiz_answers", "client_id")
+    op.drop_column("quiz_questions", "client_id")
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import platform
@@ -5,12 +6,123 @@ import datetime
 import traceback
 import importlib
 import logging
-from fastapi import APIRouter
-from starlette.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from app.api import deps
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+SENSITIVE = ["secret", "password", "key", "token"]
+
+# Diagnostics expose environment and configuration: superusers only
+router = APIRouter(dependencies=[Depends(deps.get_current_active_superuser)])
+
+
+def sanitized_environment(redact: bool = False) -> dict:
+    """
+    Environment variables without sensitive values: redacted, or left out.
+    """
+    env_vars = {}
+    for key, value in os.environ.items():
+        if any(sensitive in key.lower() for sensitive in SENSITIVE):
+            if redact:
+                env_vars[key] = "[REDACTED]"
+        else:
+            env_vars[key] = value
+    return env_vars
+
+
+@router.get("/debug/environment")
+def debug_environment():
+    """Debug endpoint to show environment variables (sanitized)"""
+    return {"environment": sanitized_environment(redact=True)}
+
+
+@router.get("/debug/config")
+def debug_config():
+    """Debug endpoint to show application configuration"""
+    config_dict = {}
+    for key in dir(settings):
+        if not key.startswith("_") and not callable(getattr(settings, key)):
+            value = getattr(settings, key)
+            # Skip sensitive values
+            if any(sensitive in key.lower() for sensitive in SENSITIVE):
+                config_dict[key] = "[REDACTED]"
+            else:
+                config_dict[key] = str(value)
+    return {"config": config_dict}
+
+
+@router.get("/debug/slow-queries")
+def debug_slow_queries():
+    """
+    Recent slow queries, newest first (needs SLOW_QUERY_LOG_ENABLED).
+    """
+    from app.core.slow_queries import slow_query_log
+
+    return {
+        "enabled": settings.SLOW_QUERY_LOG_ENABLED,
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "queries": slow_query_log.entries(),
+    }
+
+
+@router.delete("/debug/slow-queries")
+def clear_slow_queries():
+    """
+    Empty the slow-query buffer.
+    """
+    from app.core.slow_queries import slow_query_log
+
+    slow_query_log.clear()
+    return {"cleared": True}
+
+
+@router.get("/debug/profiles")
+def debug_profiles():
+    """
+    Stored request profiles, newest first (needs PROFILING_ENABLED).
+    """
+    from app.core.request_profiler import profile_store
+
+    return {"enabled": settings.PROFILING_ENABLED, "profiles": profile_store.list()}
+
+
+@router.get("/debug/profiles/{name}")
+def debug_profile(name: str):
+    """
+    One profile as collapsed stacks, for flamegraph.pl or speedscope.
+    """
+    from app.core.request_profiler import profile_store
+
+    content = profile_store.read(name)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(content)
+
+
+@router.get("/debug/health")
+def debug_health():
+    """
+    The full diagnostic report formerly served at /health.
+    """
+    system = debug_system()
+    modules = debug_modules()
+    files = debug_files()
+    database = debug_database()
+
+    return JSONResponse({
+        "status": "healthy",
+        "message": "CodeSnippets API is running",
+        "system": json.loads(system.body),
+        "import_checks": json.loads(modules.body),
+        "file_checks": json.loads(files.body),
+        "database": json.loads(database.body),
+        "environment": sanitized_environment(),
+    })
+
 
 @router.get("/debug/system")
 def debug_system():
@@ -188,10 +300,10 @@ def debug_all():
     models = debug_models()
     
     return JSONResponse({
-        "system": system.body,
-        "modules": modules.body,
-        "files": files.body,
-        "database": database.body,
-        "models": models.body,
+        "system": json.loads(system.body),
+        "modules": json.loads(modules.body),
+        "files": json.loads(files.body),
+        "database": json.loads(database.body),
+        "models": json.loads(models.body),
         "timestamp": datetime.datetime.now().isoformat()
     })
@@ -1,15 +1,36 @@
 from fastapi import APIRouter
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+from app.core.health import pool_status, readiness_probe
 
 router = APIRouter()
 
+_LIVE_BODY = b'{"status":"ok"}'
+
+
+@router.get("/livez")
+async def livez():
+    """
+    Liveness: the process is up and serving. No I/O.
+    """
+    return Response(content=_LIVE_BODY, media_type="application/json")
+
+
+@router.get("/readyz")
+async def readyz():
+    """
+    Readiness: the database answers. The check is cached for a few seconds.
+    """
+    status = await readiness_probe.status()
+    status["pool"] = pool_status()
+    return JSONResponse(status, status_code=200 if status["status"] == "ready" else 503)
+
+
 @router.get("/health")
-def health_check():
+async def health():
     """
-    Simple health check endpoint that always returns a 200 status code.
-    This is used by Railway to determine if the application is healthy.
+    Kept for existing monitors: the /readyz body, but always 200 as before.
+    The full diagnostic report moved to /debug/health.
     """
-    return JSONResponse({
-        "status": "healthy",
-        "message": "CodeSnippets API is running"
-    })
+    status = await readiness_probe.status()
+    return JSONResponse(status)
@@ -0,0 +1,20 @@
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.instrumentation import registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str = Header("")):
+    """
+    Prometheus text exposition for this worker. Requires
+    ``Authorization: Bearer <METRICS_TOKEN>`` when a token is configured.
+    """
+    if settings.METRICS_TOKEN and not secrets.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(content=registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
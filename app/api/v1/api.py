@@ -2,7 +2,7 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     auth, users, categories, posts, series, booklets, learning_paths,
-    quizzes, awards, courses, marketing, prelaunch
+    quizzes, awards, leaderboard, points, courses, marketing, prelaunch, tracking, batch, home
 )
 
 api_router = APIRouter()
@@ -15,6 +15,11 @@ api_router.include_router(booklets.router, prefix="/booklets", tags=["booklets"]
 api_router.include_router(learning_paths.router, prefix="/learning-paths", tags=["learning paths"])
 api_router.include_router(quizzes.router, prefix="/quizzes", tags=["quizzes"])
 api_router.include_router(awards.router, prefix="/awards", tags=["awards"])
+api_router.include_router(leaderboard.router, prefix="/leaderboard", tags=["leaderboard"])
+api_router.include_router(points.router, prefix="/points", tags=["points"])
 api_router.include_router(courses.router, prefix="/courses", tags=["courses"])
 api_router.include_router(marketing.router, prefix="/marketing", tags=["marketing"])
 api_router.include_router(prelaunch.router, prefix="/prelaunch", tags=["prelaunch"])
+api_router.include_router(tracking.router, prefix="/track", tags=["tracking"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
+api_router.include_router(home.router, prefix="/home", tags=["home"])
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.utils.award_rules import POINTS_CHANGED, compile_requirements
 
 router = APIRouter()
 
@@ -35,9 +36,16 @@ def create_award(
     current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
-    Create new award.
+    Create new award. Users who already meet its requirements are granted it.
     """
+    try:
+        compile_requirements(award_in.requirements)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     award = crud.award.create(db, obj_in=award_in)
+    crud.user_award.evaluate(db, award_ids=[award.id])
+    db.refresh(award)
     return award
 
 
@@ -71,8 +79,16 @@ def update_award(
     award = crud.award.get(db, id=award_id)
     if not award:
         raise HTTPException(status_code=404, detail="Award not found")
+    if award_in.requirements is not None:
+        try:
+            compile_requirements(award_in.requirements)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     award = crud.award.update(db, db_obj=award, obj_in=award_in)
+    if award_in.requirements is not None:
+        crud.user_award.evaluate(db, award_ids=[award.id])
+        db.refresh(award)
     return award
 
 
@@ -144,10 +160,19 @@ def award_user(
         db, obj_in=user_award_in, user_id=user_id
     )
 
-    # Update user's points
-    user.total_points += award.points
-    db.add(user)
-    db.commit()
+    # Credit the award's points once per user award
+    crud.points_ledger.apply(
+        db,
+        user_id=user_id,
+        reason="award",
+        points=award.points or 0,
+        source_type="user_award",
+        source_id=user_award.id,
+    )
+
+    # The extra points may unlock points-based awards
+    crud.user_award.evaluate(db, user_ids=[user_id], event=POINTS_CHANGED)
+    db.refresh(user_award)
 
     return user_award
 
@@ -160,54 +185,21 @@ def check_user_awards(
 ) -> Any:
     """
     Check and award any new awards the user has earned.
+
+    Awards are also granted automatically when quizzes are passed and courses
+    completed, so clients don't need to poll this.
+    """
+    return crud.user_award.evaluate(db, user_ids=[current_user.id])
+
+
+@router.post("/evaluate", response_model=schemas.AwardEvaluationResult)
+def evaluate_awards(
+    *,
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Grant every rule-based award to all users who have earned it (admin only).
     """
-    # Get all awards
-    all_awards = crud.award.get_multi(db)
-    new_awards = []
-
-    # Check each award's requirements
-    for award in all_awards:
-        # Skip awards the user already has
-        if crud.user_award.check_user_has_award(db, user_id=current_user.id, award_id=award.id):
-            continue
-
-        # Check requirements (simplified example)
-        requirements = award.requirements or {}
-
-        # Check level requirement
-        if "min_level" in requirements and current_user.level >= requirements["min_level"]:
-            user_award = crud.user_award.create_with_user(
-                db,
-                obj_in=schemas.UserAwardCreate(
-                    award_id=award.id,
-                    award_metadata={"earned_by": "level_up"}
-                ),
-                user_id=current_user.id
-            )
-            new_awards.append(user_award)
-
-            # Update user's points
-            current_user.total_points += award.points
-            db.add(current_user)
-
-        # Check points requirement
-        elif "min_points" in requirements and current_user.total_points >= requirements["min_points"]:
-            user_award = crud.user_award.create_with_user(
-                db,
-                obj_in=schemas.UserAwardCreate(
-                    award_id=award.id,
-                    award_metadata={"earned_by": "points_milestone"}
-                ),
-                user_id=current_user.id
-            )
-            new_awards.append(user_award)
-
-            # Update user's points
-            current_user.total_points += award.points
-            db.add(current_user)
-
-    # Commit any changes
-    if new_awards:
-        db.commit()
-
-    return new_awards
+    granted = crud.user_award.evaluate(db)
+    return {"granted": len(granted)}
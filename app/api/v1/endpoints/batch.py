@@ -0,0 +1,36 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.api import deps
+from app.core.query_profiler import query_budget
+from app.crud.catalogue import CATALOGUE_TYPES, get_cards
+
+router = APIRouter()
+
+
+@router.post("/get", response_model=schemas.BatchGetResult)
+@query_budget(4)
+def batch_get(
+    *,
+    db: Session = Depends(deps.get_db),
+    batch_in: schemas.BatchGetRequest,
+) -> Any:
+    """
+    Fetch cards for many courses, posts, series and booklets by id.
+
+    One query per entity type at most; ids that don't exist are listed
+    under ``missing``.
+    """
+    result = {}
+    missing = {}
+    for entity_type in CATALOGUE_TYPES:
+        result[entity_type], missing[entity_type] = get_cards(
+            db, entity_type=entity_type, ids=getattr(batch_in, entity_type)
+        )
+    result["missing"] = missing
+    # Cards are serialized and validated when they are cached
+    return JSONResponse(content=result)
@@ -1,10 +1,13 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.query_profiler import query_budget
+from app.crud.catalogue import invalidate_card
 
 router = APIRouter()
 
@@ -43,6 +46,7 @@ def create_booklet(
 
 
 @router.get("/{slug}", response_model=schemas.BookletWithDetails)
+@query_budget(4)
 def read_booklet_by_slug(
     *,
     db: Session = Depends(deps.get_db),
@@ -51,24 +55,11 @@ def read_booklet_by_slug(
     """
     Get booklet by slug with details.
     """
-    booklet = crud.booklet.get_by_slug(db, slug=slug)
-    if not booklet:
+    details = crud.booklet.get_details_by_slug(db, slug=slug)
+    if details is None:
         raise HTTPException(status_code=404, detail="Booklet not found")
-    
-    # Get author, chapters, and updates
-    author = crud.author.get(db, id=booklet.author_id)
-    chapters = crud.booklet_chapter.get_multi_by_booklet(db, booklet_id=booklet.id)
-    updates = crud.booklet_update.get_multi_by_booklet(db, booklet_id=booklet.id)
-    
-    # Combine into response
-    result = {
-        **booklet.__dict__,
-        "author": author,
-        "chapters": chapters,
-        "updates": updates
-    }
-    
-    return result
+    # Already serialized and validated when it was cached
+    return JSONResponse(content=details)
 
 
 @router.put("/{booklet_id}", response_model=schemas.Booklet)
@@ -86,6 +77,7 @@ def update_booklet(
     if not booklet:
         raise HTTPException(status_code=404, detail="Booklet not found")
     booklet = crud.booklet.update(db, db_obj=booklet, obj_in=booklet_in)
+    invalidate_card("booklets", booklet.id)
     return booklet
 
 
@@ -103,6 +95,7 @@ def delete_booklet(
     if not booklet:
         raise HTTPException(status_code=404, detail="Booklet not found")
     booklet = crud.booklet.remove(db, id=booklet_id)
+    invalidate_card("booklets", booklet_id)
     return booklet
 
 
@@ -5,10 +5,20 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud.catalogue import invalidate_card
+from app.utils.award_rules import COURSE_COMPLETED
 
 router = APIRouter()
 
 
+def _column_dict(obj) -> dict:
+    """
+    Column values of a model for the free-form ``Dict[str, Any]`` fields;
+    ``__dict__`` also holds SQLAlchemy's instance state, which can't be serialized.
+    """
+    return {column.key: getattr(obj, column.key) for column in obj.__mapper__.column_attrs}
+
+
 # Course Category endpoints
 @router.get("/categories/", response_model=List[schemas.CourseCategory])
 def read_course_categories(
@@ -235,15 +245,15 @@ def read_course(
                     models.Quiz.content_id == lesson.id
                 ).first()
 
-                lesson_dict["quiz"] = quiz.__dict__ if quiz else None
+                lesson_dict["quiz"] = _column_dict(quiz) if quiz else None
                 topic_dict["lessons"].append(lesson_dict)
 
             module_dict["topics"].append(topic_dict)
 
         result["modules"].append(module_dict)
 
-    result["author"] = author.__dict__ if author else None
-    result["category"] = category.__dict__ if category else None
+    result["author"] = _column_dict(author) if author else None
+    result["category"] = _column_dict(category) if category else None
     result["enrollment"] = enrollment.__dict__ if enrollment else None
 
     return result
@@ -284,6 +294,7 @@ def update_course(
             )
 
     course = crud.course.update(db, db_obj=course, obj_in=course_in)
+    invalidate_card("courses", course.id)
     return course
 
 
@@ -312,6 +323,7 @@ def delete_course(
             )
 
     course = crud.course.remove(db, id=course_id)
+    invalidate_card("courses", course_id)
     return course
 
 
@@ -340,6 +352,7 @@ def publish_course(
             )
 
     course = crud.course.publish(db, db_obj=course)
+    invalidate_card("courses", course.id)
     return course
 
 
@@ -368,6 +381,7 @@ def unpublish_course(
             )
 
     course = crud.course.unpublish(db, db_obj=course)
+    invalidate_card("courses", course.id)
     return course
 
 
@@ -502,7 +516,7 @@ def read_course_module(
                 models.Quiz.content_id == lesson.id
             ).first()
 
-            lesson_dict["quiz"] = quiz.__dict__ if quiz else None
+            lesson_dict["quiz"] = _column_dict(quiz) if quiz else None
             topic_dict["lessons"].append(lesson_dict)
 
         result["topics"].append(topic_dict)
@@ -704,7 +718,7 @@ def read_course_topic(
             models.Quiz.content_id == lesson.id
         ).first()
 
-        lesson_dict["quiz"] = quiz.__dict__ if quiz else None
+        lesson_dict["quiz"] = _column_dict(quiz) if quiz else None
         result["lessons"].append(lesson_dict)
 
     return result
@@ -912,7 +926,7 @@ def read_topic_lesson(
 
     # Build response
     result = lesson.__dict__.copy()
-    result["quiz"] = quiz.__dict__ if quiz else None
+    result["quiz"] = _column_dict(quiz) if quiz else None
 
     return result
 
@@ -1219,17 +1233,19 @@ def complete_enrollment(
         }
         xp_gained = level_xp.get(course.level, 50)
 
-        # Update user's experience and level
-        current_user.experience += xp_gained
-        current_user.total_points += int(xp_gained * 0.5)  # Half of XP as points
-
-        # Calculate new level (simple level calculation)
-        new_level = 1 + (current_user.experience // 100)  # Level up every 100 XP
-        if new_level > current_user.level:
-            current_user.level = new_level
+        # Credit the enrollment's owner once per enrollment; level is recomputed in SQL
+        crud.points_ledger.apply(
+            db,
+            user_id=enrollment.user_id,
+            reason="course_completed",
+            points=int(xp_gained * 0.5),  # Half of XP as points
+            experience=xp_gained,
+            source_type="enrollment",
+            source_id=enrollment.id,
+        )
 
-        db.add(current_user)
-        db.commit()
+    crud.user_award.evaluate(db, user_ids=[enrollment.user_id], event=COURSE_COMPLETED)
+    db.refresh(enrollment)
 
     return enrollment
 
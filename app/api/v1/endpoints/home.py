@@ -0,0 +1,29 @@
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Header, Response
+
+from app import models, schemas
+from app.api import deps
+from app.utils.home import encode_payload, etag_matches, home_aggregator
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.HomePage)
+async def read_home(
+    *,
+    if_none_match: Optional[str] = Header(None),
+    current_user: Optional[models.User] = Depends(deps.get_current_user_optional),
+) -> Any:
+    """
+    Everything the homepage renders, in one response.
+
+    Sections are gathered concurrently and cached individually; the payload
+    carries an ETag so unchanged homepages revalidate with a 304.
+    """
+    payload = await home_aggregator.build(logged_in=current_user is not None)
+    body, etag = encode_payload(payload)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,80 @@
+from typing import Any, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.api import deps
+from app.utils.leaderboard import PERIODS, leaderboard
+
+router = APIRouter()
+
+
+def _check_period(period: str) -> str:
+    if period not in PERIODS:
+        raise HTTPException(status_code=400, detail=f"period must be one of: {', '.join(PERIODS)}")
+    return period
+
+
+def _entries(db: Session, rows: List[Tuple[int, str, int]]) -> List[dict]:
+    profiles = crud.user.get_public_profiles(db, user_ids=[user_id for _, user_id, _ in rows])
+    entries = []
+    for rank, user_id, score in rows:
+        profile = profiles.get(user_id)
+        if profile is None:
+            continue
+        entries.append({
+            "rank": rank,
+            "user_id": user_id,
+            "username": profile.username,
+            "score": score,
+            "level": profile.level or 1,
+            "experience": profile.experience or 0,
+        })
+    return entries
+
+
+@router.get("/", response_model=List[schemas.LeaderboardEntry])
+def read_leaderboard(
+    db: Session = Depends(deps.get_db),
+    period: str = "all_time",
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the top of the all-time, weekly or monthly leaderboard.
+    """
+    _check_period(period)
+    leaderboard.ensure_loaded(db)
+    return _entries(db, leaderboard.top(period, skip=skip, limit=limit))
+
+
+@router.get("/me", response_model=schemas.LeaderboardRank)
+def read_my_rank(
+    db: Session = Depends(deps.get_db),
+    period: str = "all_time",
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the current user's rank.
+    """
+    _check_period(period)
+    leaderboard.ensure_loaded(db)
+    rank, score, total = leaderboard.rank(period, current_user.id)
+    return {"period": period, "rank": rank, "score": score, "total_users": total}
+
+
+@router.get("/me/around", response_model=List[schemas.LeaderboardEntry])
+def read_users_around_me(
+    db: Session = Depends(deps.get_db),
+    period: str = "all_time",
+    radius: int = Query(5, ge=1, le=50),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the users ranked just above and below the current user.
+    """
+    _check_period(period)
+    leaderboard.ensure_loaded(db)
+    return _entries(db, leaderboard.around(period, current_user.id, radius=radius))
@@ -1,10 +1,12 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.query_profiler import query_budget
 
 router = APIRouter()
 
@@ -70,6 +72,7 @@ def read_learning_paths_by_tag(
 
 
 @router.get("/{slug}", response_model=schemas.LearningPathWithDetails)
+@query_budget(5)
 def read_learning_path_by_slug(
     *,
     db: Session = Depends(deps.get_db),
@@ -78,32 +81,11 @@ def read_learning_path_by_slug(
     """
     Get learning path by slug with details.
     """
-    learning_path = crud.learning_path.get_by_slug(db, slug=slug)
-    if not learning_path:
+    details = crud.learning_path.get_details_by_slug(db, slug=slug)
+    if details is None:
         raise HTTPException(status_code=404, detail="Learning path not found")
-    
-    # Get modules and resources
-    modules = crud.learning_path_module.get_multi_by_learning_path(db, learning_path_id=learning_path.id)
-    resources = crud.learning_path_resource.get_multi_by_learning_path(db, learning_path_id=learning_path.id)
-    
-    # Get content items for each module
-    modules_with_items = []
-    for module in modules:
-        content_items = crud.learning_path_content_item.get_multi_by_module(db, module_id=module.id)
-        module_dict = {
-            **module.__dict__,
-            "content_items": content_items
-        }
-        modules_with_items.append(module_dict)
-    
-    # Combine into response
-    result = {
-        **learning_path.__dict__,
-        "modules": modules_with_items,
-        "resources": resources
-    }
-    
-    return result
+    # Already serialized and validated when it was cached
+    return JSONResponse(content=details)
 
 
 @router.put("/{learning_path_id}", response_model=schemas.LearningPath)
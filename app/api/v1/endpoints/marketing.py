@@ -1,10 +1,12 @@
+import csv
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, File, UploadFile
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.utils.subscriber_import import detect_format, iter_rows
 
 router = APIRouter()
 
@@ -71,6 +73,35 @@ def read_newsletter_subscriptions(
     return subscriptions
 
 
+@router.post("/newsletter/import", response_model=schemas.SubscriberImportResult)
+def import_newsletter_subscriptions(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="'csv' or 'ndjson'; detected from the upload if omitted"),
+    source: Optional[str] = Query(None, description="Default source for rows without one"),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Bulk import newsletter subscriptions from a CSV or NDJSON upload.
+    """
+    fmt = detect_format(file.filename, file.content_type, format)
+    if not fmt:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported import format. Upload a .csv or .ndjson file.",
+        )
+
+    try:
+        result = crud.newsletter_subscription.bulk_import(
+            db, rows=iter_rows(file.file, fmt), source=source
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Could not parse import file: {e}")
+    return result
+
+
 @router.post("/newsletter/sync", response_model=dict)
 def sync_newsletter_subscriptions(
     *,
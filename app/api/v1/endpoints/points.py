@@ -0,0 +1,62 @@
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.api import deps
+
+router = APIRouter()
+
+
+@router.get("/me", response_model=schemas.PointsBalance)
+def read_my_balance(
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the current user's points, experience and level.
+    """
+    return {
+        "user_id": current_user.id,
+        "total_points": current_user.total_points or 0,
+        "experience": current_user.experience or 0,
+        "level": current_user.level or 1,
+    }
+
+
+@router.get("/me/history", response_model=List[schemas.PointsLedgerEntry])
+def read_my_points_history(
+    db: Session = Depends(deps.get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get the current user's points ledger, newest first.
+    """
+    return crud.points_ledger.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
+
+
+@router.get("/audit", response_model=schemas.PointsRebuildResult)
+def audit_balances(
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    List users whose balance doesn't match their ledger (admin only).
+    """
+    mismatches = crud.points_ledger.audit(db)
+    return {"mismatched": len(mismatches), "rebuilt": False, "mismatches": mismatches}
+
+
+@router.post("/rebuild", response_model=schemas.PointsRebuildResult)
+def rebuild_balances(
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Reset every mismatched balance to the sum of its ledger (admin only).
+    """
+    mismatches = crud.points_ledger.rebuild_balances(db)
+    return {"mismatched": len(mismatches), "rebuilt": True, "mismatches": mismatches}
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud.catalogue import invalidate_card
 
 router = APIRouter()
 
@@ -74,6 +75,7 @@ def update_post(
     if post.author != current_user.id and not crud.user.is_superuser(current_user):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     post = crud.post.update(db, db_obj=post, obj_in=post_in)
+    invalidate_card("posts", post.id)
     return post
 
 
@@ -93,6 +95,7 @@ def delete_post(
     if post.author != current_user.id and not crud.user.is_superuser(current_user):
         raise HTTPException(status_code=403, detail="Not enough permissions")
     post = crud.post.remove(db, id=post_id)
+    invalidate_card("posts", post_id)
     return post
 
 
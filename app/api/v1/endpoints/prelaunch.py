@@ -1,10 +1,14 @@
+import csv
 from typing import Any, List, Optional, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, File, UploadFile
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.email import get_email_transport
+from app.utils.drip_dispatcher import dispatch_due_emails
+from app.utils.subscriber_import import detect_format, iter_rows
 
 router = APIRouter()
 
@@ -366,6 +370,40 @@ def read_campaign_subscribers(
     return subscribers
 
 
+@router.post("/campaigns/{campaign_id}/subscribers/import", response_model=schemas.SubscriberImportResult)
+def import_campaign_subscribers(
+    *,
+    db: Session = Depends(deps.get_db),
+    campaign_id: str = Path(..., title="The ID of the campaign"),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="'csv' or 'ndjson'; detected from the upload if omitted"),
+    source: Optional[str] = Query(None, description="Default source for rows without one"),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Bulk import subscribers for a campaign from a CSV or NDJSON upload.
+    """
+    campaign = crud.course_prelaunch_campaign.get(db, id=campaign_id)
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    fmt = detect_format(file.filename, file.content_type, format)
+    if not fmt:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported import format. Upload a .csv or .ndjson file.",
+        )
+
+    try:
+        result = crud.prelaunch_subscriber.bulk_import(
+            db, campaign_id=campaign_id, rows=iter_rows(file.file, fmt), source=source
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Could not parse import file: {e}")
+    return result
+
+
 @router.post("/subscribers/{subscriber_id}/lead-magnet-sent", response_model=schemas.PrelaunchSubscriber)
 def mark_lead_magnet_sent(
     *,
@@ -599,3 +637,38 @@ def update_email_statistics(
     if not email:
         raise HTTPException(status_code=404, detail="Email not found")
     return email
+
+
+@router.get("/emails/{email_id}/deliveries", response_model=List[schemas.PrelaunchEmailDelivery])
+def read_email_deliveries(
+    *,
+    db: Session = Depends(deps.get_db),
+    email_id: str = Path(..., title="The ID of the email"),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Get the delivery log of a sequence email.
+    """
+    email = crud.prelaunch_email.get(db, id=email_id)
+    if not email:
+        raise HTTPException(status_code=404, detail="Email not found")
+    return crud.prelaunch_email_delivery.get_by_email(db, email_id=email_id, skip=skip, limit=limit)
+
+
+@router.post("/dispatch", response_model=schemas.DripDispatchResult)
+async def dispatch_drip_emails(
+    *,
+    db: Session = Depends(deps.get_db),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Run one drip dispatcher tick now and send every email that is due.
+    """
+    try:
+        transport = get_email_transport()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return await dispatch_due_emails(db, transport, batch_size=batch_size)
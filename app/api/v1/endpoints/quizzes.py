@@ -1,15 +1,42 @@
-from typing import Any, List, Optional
+import secrets
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.utils.award_rules import QUIZ_PASSED
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
+from app.utils.quiz_delivery import build_quiz_blob, quiz_blob_cache
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[schemas.Quiz])
+def _quiz_blob_response(db: Session, quiz_id: str, *, include_answers: bool, seed: Optional[str]) -> Response:
+    """
+    The quiz pre-serialized for delivery, from the per-version blob cache.
+    """
+    version = crud.quiz.get_version(db, id=quiz_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+
+    blob = quiz_blob_cache.get(quiz_id, version, include_answers)
+    if blob is None:
+        quiz = crud.quiz.get_with_questions(db, id=quiz_id)
+        if not quiz:
+            raise HTTPException(status_code=404, detail="Quiz not found")
+        blob = build_quiz_blob(quiz, include_answers=include_answers)
+        quiz_blob_cache.put(quiz_id, include_answers, blob)
+
+    return Response(
+        content=blob.render(seed or secrets.token_urlsafe(8)),
+        media_type="application/json",
+        headers={"Cache-Control": "private, no-store"},
+    )
+
+
+@router.get("/", response_model=List[Union[schemas.Quiz, schemas.QuizSummary]])
 def read_quizzes(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
@@ -19,14 +46,17 @@ def read_quizzes(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Retrieve quizzes.
+    Retrieve quizzes. Superusers get each quiz with its questions and
+    answers; learners get quiz summaries and take a quiz via /delivery.
     """
     if content_type and content_id:
         quiz = crud.quiz.get_by_content(db, content_type=content_type, content_id=content_id)
-        return [quiz] if quiz else []
-    
-    quizzes = crud.quiz.get_multi(db, skip=skip, limit=limit)
-    return quizzes
+        quizzes = [quiz] if quiz else []
+    else:
+        quizzes = crud.quiz.get_multi(db, skip=skip, limit=limit)
+
+    schema = schemas.Quiz if crud.user.is_superuser(current_user) else schemas.QuizSummary
+    return [schema.model_validate(quiz) for quiz in quizzes]
 
 
 @router.post("/", response_model=schemas.Quiz)
@@ -34,7 +64,7 @@ def create_quiz(
     *,
     db: Session = Depends(deps.get_db),
     quiz_in: schemas.QuizCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Create new quiz.
@@ -53,6 +83,24 @@ def create_quiz(
     return quiz
 
 
+@router.post("/import", response_model=schemas.QuizDocumentResult)
+def import_quiz_document(
+    *,
+    db: Session = Depends(deps.get_db),
+    document: schemas.QuizDocument,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Create or update the quiz for a piece of content from a full quiz
+    document. Re-importing the same document is a no-op.
+    """
+    try:
+        return crud.quiz.import_document(db, document=document)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{quiz_id}", response_model=schemas.Quiz)
 def read_quiz(
     *,
@@ -61,21 +109,82 @@ def read_quiz(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get quiz by ID.
+    Get quiz by ID. Superusers get the quiz with its answer key; learners
+    get the /delivery view, without correct answers or explanations.
     """
-    quiz = crud.quiz.get(db, id=quiz_id)
+    if not crud.user.is_superuser(current_user):
+        return _quiz_blob_response(db, quiz_id, include_answers=False, seed=None)
+    quiz = crud.quiz.get_with_questions(db, id=quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
     return quiz
 
 
+@router.get("/{quiz_id}/delivery")
+def deliver_quiz(
+    *,
+    db: Session = Depends(deps.get_db),
+    quiz_id: str,
+    seed: Optional[str] = Query(None, max_length=64),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get a quiz ready to take.
+
+    Correct answers and explanations are only included for superusers. If
+    the quiz randomizes, questions and answers are shuffled by ``seed``;
+    pass back the ``seed`` from the response to get the same order again.
+    """
+    return _quiz_blob_response(
+        db, quiz_id, include_answers=crud.user.is_superuser(current_user), seed=seed
+    )
+
+
+@router.get("/{quiz_id}/document", response_model=schemas.QuizDocument)
+def read_quiz_document(
+    *,
+    db: Session = Depends(deps.get_db),
+    quiz_id: str,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Export a quiz, answer key included, as a document that can be edited
+    and put back.
+    """
+    quiz = crud.quiz.get_with_questions(db, id=quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return crud.quiz.get_document(db, quiz=quiz)
+
+
+@router.put("/{quiz_id}/document", response_model=schemas.QuizDocumentResult)
+def replace_quiz_document(
+    *,
+    db: Session = Depends(deps.get_db),
+    quiz_id: str,
+    document: schemas.QuizDocument,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Replace a quiz's settings, questions and answers with a document.
+    Questions and answers are matched by client_id; missing ones are deleted.
+    """
+    quiz = crud.quiz.get(db, id=quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    try:
+        return crud.quiz.apply_document(db, quiz=quiz, document=document)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.put("/{quiz_id}", response_model=schemas.Quiz)
 def update_quiz(
     *,
     db: Session = Depends(deps.get_db),
     quiz_id: str,
     quiz_in: schemas.QuizUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Update a quiz.
@@ -93,7 +202,7 @@ def delete_quiz(
     *,
     db: Session = Depends(deps.get_db),
     quiz_id: str,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Delete a quiz.
@@ -112,7 +221,7 @@ def create_quiz_question(
     db: Session = Depends(deps.get_db),
     quiz_id: str,
     question_in: schemas.QuizQuestionCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Add a question to a quiz.
@@ -133,7 +242,7 @@ def update_quiz_question(
     db: Session = Depends(deps.get_db),
     question_id: str,
     question_in: schemas.QuizQuestionUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Update a quiz question.
@@ -151,7 +260,7 @@ def delete_quiz_question(
     *,
     db: Session = Depends(deps.get_db),
     question_id: str,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: models.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Delete a quiz question.
@@ -173,38 +282,36 @@ def create_quiz_attempt(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Submit a quiz attempt.
+    Submit a quiz attempt. The score is computed server-side.
     """
     quiz = crud.quiz.get(db, id=quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
-    # Ensure the quiz_id in the path matches the one in the request body
-    if attempt_in.quiz_id != quiz_id:
-        attempt_in.quiz_id = quiz_id
-    
-    # Create the attempt
-    attempt = crud.user_quiz_attempt.create_with_user(
-        db, obj_in=attempt_in, user_id=current_user.id
+    # Grade against the answer key; the client's score and pass flag aren't trusted
+    attempt = crud.user_quiz_attempt.create_graded(
+        db, quiz=quiz, obj_in=attempt_in, user_id=current_user.id
     )
     
     # Update user's experience and points based on quiz performance
     if attempt.passed:
         # Award experience points based on quiz score
         experience_gained = int(quiz.passing_score * (attempt.score / 100))
-        current_user.experience += experience_gained
-        
-        # Award points
         points_gained = int(experience_gained * 0.5)  # Half of experience as points
-        current_user.total_points += points_gained
-        
-        # Check if user leveled up (simple level calculation)
-        new_level = 1 + (current_user.experience // 100)  # Level up every 100 XP
-        if new_level > current_user.level:
-            current_user.level = new_level
-        
-        db.add(current_user)
-        db.commit()
+
+        # Atomically add to the user's balance; level is recomputed in SQL
+        crud.points_ledger.apply(
+            db,
+            user_id=current_user.id,
+            reason="quiz_passed",
+            points=points_gained,
+            experience=experience_gained,
+            source_type="quiz_attempt",
+            source_id=attempt.id,
+        )
+
+        crud.user_award.evaluate(db, user_ids=[current_user.id], event=QUIZ_PASSED)
+        db.refresh(attempt)
     
     return attempt
 
@@ -229,6 +336,36 @@ def read_quiz_attempts(
     return attempts
 
 
+@router.get("/{quiz_id}/attempts/history", response_model=schemas.UserQuizAttemptPage)
+def read_quiz_attempt_history(
+    *,
+    db: Session = Depends(deps.get_db),
+    quiz_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    The current user's attempts at a quiz, newest first, one page at a time.
+    """
+    before = None
+    if cursor:
+        try:
+            started_at, attempt_id = decode_cursor(cursor, 2)
+            before = (decode_datetime(started_at), str(attempt_id))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    attempts = crud.user_quiz_attempt.get_history(
+        db, user_id=current_user.id, quiz_id=quiz_id, limit=limit + 1, before=before
+    )
+    next_cursor = None
+    if len(attempts) > limit:
+        attempts = attempts[:limit]
+        next_cursor = encode_cursor(attempts[-1].started_at, attempts[-1].id)
+    return {"items": attempts, "next_cursor": next_cursor}
+
+
 @router.get("/{quiz_id}/attempts/best", response_model=schemas.UserQuizAttempt)
 def read_best_quiz_attempt(
     *,
@@ -250,3 +387,20 @@ def read_best_quiz_attempt(
         raise HTTPException(status_code=404, detail="No attempts found for this quiz")
     
     return attempt
+
+
+@router.get("/{quiz_id}/analytics", response_model=schemas.QuizAnalytics)
+def read_quiz_analytics(
+    *,
+    db: Session = Depends(deps.get_db),
+    quiz_id: str,
+    current_user: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Per-question correct rates, answer distribution, score histogram and
+    time-taken percentiles for a quiz.
+    """
+    quiz = crud.quiz.get_with_questions(db, id=quiz_id)
+    if not quiz:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return crud.quiz_stat.get_analytics(db, quiz=quiz)
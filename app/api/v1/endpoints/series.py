@@ -1,10 +1,13 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.query_profiler import query_budget
+from app.crud.catalogue import invalidate_card
 
 router = APIRouter()
 
@@ -105,6 +108,7 @@ def create_series(
 
 
 @router.get("/{slug}", response_model=schemas.SeriesWithDetails)
+@query_budget(3)
 def read_series_by_slug(
     *,
     db: Session = Depends(deps.get_db),
@@ -113,22 +117,11 @@ def read_series_by_slug(
     """
     Get series by slug with details.
     """
-    series = crud.series.get_by_slug(db, slug=slug)
-    if not series:
+    details = crud.series.get_details_by_slug(db, slug=slug)
+    if details is None:
         raise HTTPException(status_code=404, detail="Series not found")
-    
-    # Get author and articles
-    author = crud.author.get(db, id=series.author_id)
-    articles = crud.series_article.get_multi_by_series(db, series_id=series.id)
-    
-    # Combine into response
-    result = {
-        **series.__dict__,
-        "author": author,
-        "articles": articles
-    }
-    
-    return result
+    # Already serialized and validated when it was cached
+    return JSONResponse(content=details)
 
 
 @router.put("/{series_id}", response_model=schemas.Series)
@@ -146,6 +139,7 @@ def update_series(
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     series = crud.series.update(db, db_obj=series, obj_in=series_in)
+    invalidate_card("series", series.id)
     return series
 
 
@@ -163,6 +157,7 @@ def delete_series(
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
     series = crud.series.remove(db, id=series_id)
+    invalidate_card("series", series_id)
     return series
 
 
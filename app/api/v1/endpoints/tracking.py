@@ -0,0 +1,53 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import RedirectResponse, Response
+
+from app.core.tracking import (
+    BANNER_CLICK, EMAIL_CLICK, EMAIL_OPEN, PIXEL_GIF, read_token, tracking_buffer
+)
+
+router = APIRouter()
+
+# These handlers are async and take no DB session: they verify the token,
+# append to the in-memory buffer and return. The background flusher writes
+# the counters in batches.
+
+PIXEL_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+}
+
+
+@router.get("/o/{token}.gif", include_in_schema=False)
+async def track_email_open(token: str) -> Response:
+    """
+    Open-tracking pixel. Always returns the GIF so a bad token never shows a
+    broken image in the email.
+    """
+    ids = read_token(EMAIL_OPEN, token)
+    if ids and len(ids) == 2:
+        tracking_buffer.record(EMAIL_OPEN, ids[0])
+    return Response(content=PIXEL_GIF, media_type="image/gif", headers=PIXEL_HEADERS)
+
+
+@router.get("/c/{token}", include_in_schema=False)
+async def track_email_click(token: str, url: str = Query(...)) -> RedirectResponse:
+    """
+    Record a link click in a sequence email and redirect to the link.
+    """
+    ids = read_token(EMAIL_CLICK, token, url)
+    if not ids or len(ids) != 2:
+        raise HTTPException(status_code=404, detail="Link not found")
+    tracking_buffer.record(EMAIL_CLICK, ids[0])
+    return RedirectResponse(url, status_code=302, headers={"Referrer-Policy": "no-referrer"})
+
+
+@router.get("/b/{token}", include_in_schema=False)
+async def track_banner_click(token: str, url: str = Query(...)) -> RedirectResponse:
+    """
+    Record a banner CTA click and redirect to the CTA link.
+    """
+    ids = read_token(BANNER_CLICK, token, url)
+    if not ids or len(ids) != 1:
+        raise HTTPException(status_code=404, detail="Link not found")
+    tracking_buffer.record(BANNER_CLICK, ids[0])
+    return RedirectResponse(url, status_code=302, headers={"Referrer-Policy": "no-referrer"})
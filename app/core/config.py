@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional, Union, Annotated
+from typing import Annotated, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, PostgresDsn, field_validator, BeforeValidator
 from pydantic_settings import BaseSettings
@@ -43,6 +43,104 @@ class Settings(BaseSettings):
 
     # Server
     PORT: int = 8000
+    # Worker processes for run.py in production; WEB_CONCURRENCY (the platform convention)
+    # overrides it, and unset means one per available CPU that the connection budget allows
+    WEB_WORKERS: Optional[int] = None
+    # Recycle a worker after this many requests (plus jitter), bounding slow leaks
+    WEB_MAX_REQUESTS: int = 10000
+    WEB_MAX_REQUESTS_JITTER: int = 1000
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    WEB_KEEPALIVE_SECONDS: int = 5
+
+    # Connection budget: the server's max_connections minus what other clients
+    # (release step, psql, cron) need, split across workers; DB_POOL_SIZE overrides it
+    DB_MAX_CONNECTIONS: int = 100
+    DB_RESERVED_CONNECTIONS: int = 10
+    DB_POOL_SIZE: Optional[int] = None
+    # No worker's pool is smaller than this: /home loads its 6 sections concurrently,
+    # each in its own session, next to the request's own. run.py starts fewer
+    # workers rather than split the budget below it
+    DB_MIN_POOL_SIZE: int = 8
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+
+    # Email delivery
+    # EMAIL_TRANSPORT is "smtp" in production or "file" to write .eml files locally
+    EMAIL_TRANSPORT: str = "file"
+    EMAIL_FILE_SINK_DIR: str = "sent_emails"
+    EMAILS_FROM_EMAIL: str = "noreply@codesnippets.dev"
+    EMAILS_FROM_NAME: Optional[str] = None
+    SMTP_HOST: Optional[str] = None
+    SMTP_PORT: int = 587
+    SMTP_USER: Optional[str] = None
+    SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT: int = 30
+
+    # Prelaunch drip dispatcher
+    DRIP_DISPATCHER_ENABLED: bool = False
+    DRIP_DISPATCH_INTERVAL_SECONDS: int = 300
+    DRIP_DISPATCH_BATCH_SIZE: int = 500
+    DRIP_DISPATCH_CONCURRENCY: int = 8
+    DRIP_MAX_ATTEMPTS: int = 3
+    # A claimed delivery still pending after this long is treated as a failed attempt (the
+    # dispatcher died or was stopped mid-send); keep it well above the time to send one batch
+    DRIP_CLAIM_LEASE_SECONDS: int = 900
+
+    # Open/click tracking
+    # PUBLIC_BASE_URL is prefixed to tracking links in emails, e.g. "https://api.codesnippets.dev"
+    PUBLIC_BASE_URL: Optional[str] = None
+    TRACKING_BUFFER_SIZE: int = 100_000
+    TRACKING_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # Leaderboard
+    # Each worker keeps its own in-memory board and re-syncs it from the database on this interval
+    LEADERBOARD_RESYNC_SECONDS: int = 60
+
+    # Read-through caches for content detail pages (per worker)
+    CONTENT_CACHE_TTL_SECONDS: int = 300
+    CONTENT_CACHE_MAX_ENTRIES: int = 512
+
+    # Homepage aggregate: a section slower than this is served stale (or empty) instead
+    HOME_SECTION_TIMEOUT_SECONDS: float = 1.5
+
+    # /readyz re-checks the database at most this often, giving up after the timeout
+    READINESS_CACHE_SECONDS: float = 5.0
+    READINESS_TIMEOUT_SECONDS: float = 2.0
+
+    # Per-worker request/SQL metrics served at /metrics; set a token to require a bearer header
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None
+
+    # Per-request SQL profiling: warn when a request runs more statements than its route's
+    # budget or repeats one statement this often (N+1); strict mode raises instead (tests)
+    SQL_QUERY_BUDGET: int = 50
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 10
+    SQL_QUERY_BUDGET_STRICT: bool = False
+
+    # Opt-in slow-query log, served at /debug/slow-queries. Slow statements are kept at the
+    # sample rate; a further sample of slow SELECTs gets EXPLAIN (ANALYZE, BUFFERS) on PostgreSQL
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_SAMPLE_RATE: float = 1.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+
+    # Opt-in request profiling: superusers send "X-Profile: 1", or a fraction of requests is
+    # sampled; collapsed-stack files are kept in PROFILING_DIR and served at /debug/profiles
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_FILES: int = 50
+
+    # Logging: JSON lines (or "text") written by a background thread. LOG_LEVELS overrides
+    # single loggers, e.g. {"sqlalchemy.pool": "DEBUG"}; LOG_SAMPLE_RATES keeps that fraction
+    # of a logger's sub-WARNING lines, whole requests at a time, e.g. {"uvicorn.access": 0.1}
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_LEVELS: Dict[str, str] = {}
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+    LOG_QUEUE_SIZE: int = 10_000
 
     model_config = {
         "case_sensitive": True,
@@ -1,35 +1,34 @@
 from typing import Generator
 import logging
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.engine import Engine
 
 from app.core.config import settings
+from app.core.server import pool_limits, worker_count
 
 logger = logging.getLogger(__name__)
 
-# Create SQLAlchemy engine with connection pool settings
+# Each worker gets its share of the server's connection limit
+pool_size, max_overflow = pool_limits(worker_count())
+
+# Create SQLAlchemy engine with connection pool settings. Connects and checkouts are
+# logged by SQLAlchemy itself: LOG_LEVELS={"sqlalchemy.pool": "DEBUG"}
 engine = create_engine(
     str(settings.DATABASE_URL),
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
     pool_pre_ping=True,  # Test connections before using them
     pool_recycle=3600,   # Recycle connections after 1 hour
     connect_args={"connect_timeout": 10}  # Connection timeout of 10 seconds
 )
 
-# Add event listeners for connection debugging
-@event.listens_for(Engine, "connect")
-def connect(dbapi_connection, connection_record):
-    logger.debug("Database connection established")
-
-@event.listens_for(Engine, "checkout")
-def checkout(dbapi_connection, connection_record, connection_proxy):
-    logger.debug("Database connection checked out")
+if settings.SLOW_QUERY_LOG_ENABLED:
+    from app.core.slow_queries import attach_slow_query_log
 
-@event.listens_for(Engine, "checkin")
-def checkin(dbapi_connection, connection_record):
-    logger.debug("Database connection checked in")
+    attach_slow_query_log(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,118 @@
+import logging
+import os
+import smtplib
+import threading
+import uuid
+from datetime import datetime
+from email.message import EmailMessage
+from email.utils import formataddr, make_msgid
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def build_message(
+    *, to: str, subject: str, html_body: str, headers: Optional[Dict[str, str]] = None
+) -> EmailMessage:
+    """
+    Build an HTML email with the configured sender.
+    """
+    message = EmailMessage()
+    message["From"] = formataddr((settings.EMAILS_FROM_NAME or "", settings.EMAILS_FROM_EMAIL))
+    message["To"] = to
+    message["Subject"] = subject
+    message["Message-ID"] = make_msgid()
+    for name, value in (headers or {}).items():
+        message[name] = value
+    message.set_content(html_body, subtype="html")
+    return message
+
+
+class EmailTransport:
+    """
+    Base class for email transports. Implementations must be safe to call
+    from several threads at once.
+    """
+
+    def send(self, message: EmailMessage) -> None:
+        raise NotImplementedError
+
+
+class SMTPTransport(EmailTransport):
+    """
+    Sends email over SMTP, keeping one connection open per thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        timeout: int = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password or "")
+        return connection
+
+    def send(self, message: EmailMessage) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        try:
+            connection.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped an idle connection; reconnect once and retry
+            connection = self._local.connection = self._connect()
+            connection.send_message(message)
+
+
+class FileTransport(EmailTransport):
+    """
+    Writes each email to an .eml file instead of sending it. Used for local
+    development and tests.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def send(self, message: EmailMessage) -> None:
+        filename = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex}.eml"
+        with open(os.path.join(self.directory, filename), "wb") as f:
+            f.write(bytes(message))
+
+
+def get_email_transport() -> EmailTransport:
+    """
+    Create the transport selected by EMAIL_TRANSPORT.
+    """
+    if settings.EMAIL_TRANSPORT == "smtp":
+        if not settings.SMTP_HOST:
+            raise ValueError("SMTP_HOST must be set when EMAIL_TRANSPORT is 'smtp'")
+        return SMTPTransport(
+            settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+        )
+    if settings.EMAIL_TRANSPORT == "file":
+        return FileTransport(settings.EMAIL_FILE_SINK_DIR)
+    raise ValueError(f"Unknown EMAIL_TRANSPORT: {settings.EMAIL_TRANSPORT}")
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+def check_database() -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def pool_status() -> Dict[str, Any]:
+    """
+    Connection pool counters, without touching the database.
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {}
+    for name in ("size", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if counter is not None:
+            status[name] = counter()
+    return status
+
+
+class ReadinessProbe:
+    """
+    Runs ``check`` at most once per ``ttl`` seconds and caches the outcome,
+    so frequent probes never compete with requests for pool connections.
+    The check runs in a worker thread and is abandoned after ``timeout``
+    seconds; concurrent probes share one check.
+    """
+
+    def __init__(self, check: Callable[[], None], *, ttl: float, timeout: float):
+        self.check = check
+        self.ttl = ttl
+        self.timeout = timeout
+        self._ready: Optional[bool] = None
+        self._detail = "not_checked"
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self._ready is not None and time.monotonic() < self._expires_at
+
+    async def status(self) -> Dict[str, Any]:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    await self._run()
+        return {"status": "ready" if self._ready else "unavailable", "database": self._detail}
+
+    async def _run(self) -> None:
+        try:
+            await asyncio.wait_for(asyncio.to_thread(self.check), self.timeout)
+            self._ready, self._detail = True, "ok"
+        except asyncio.TimeoutError:
+            logger.warning(f"Readiness check timed out after {self.timeout}s")
+            self._ready, self._detail = False, "timeout"
+        except Exception as e:
+            logger.warning(f"Readiness check failed: {e}")
+            self._ready, self._detail = False, "error"
+        self._expires_at = time.monotonic() + self.ttl
+
+
+readiness_probe = ReadinessProbe(
+    check_database, ttl=settings.READINESS_CACHE_SECONDS, timeout=settings.READINESS_TIMEOUT_SECONDS
+)
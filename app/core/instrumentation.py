@@ -0,0 +1,136 @@
+import time
+from typing import Dict, Tuple
+
+from app.core.metrics import (
+    COUNT_BUCKETS,
+    LATENCY_BUCKETS,
+    SIZE_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+)
+from app.core.query_profiler import RequestStats, current_request_stats, route_template
+
+
+def _threadpool_threads() -> Dict[Tuple[str, ...], float]:
+    # anyio's limiter runs sync endpoints and dependencies
+    from anyio import to_thread
+
+    try:
+        limiter = to_thread.current_default_thread_limiter()
+    except RuntimeError:  # no event loop (scraped outside the app)
+        return {}
+    statistics = limiter.statistics()
+    return {
+        ("limit",): limiter.total_tokens,
+        ("busy",): statistics.borrowed_tokens,
+        ("waiting",): statistics.tasks_waiting,
+    }
+
+
+def _db_pool_connections() -> Dict[Tuple[str, ...], float]:
+    from app.core.health import pool_status
+
+    return {(state,): value for state, value in pool_status().items()}
+
+
+registry = Registry()
+
+http_requests = registry.register(
+    Counter("http_requests_total", "HTTP requests by route and status.", ("method", "route", "status"))
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds", "HTTP request latency.", ("method", "route"), buckets=LATENCY_BUCKETS
+    )
+)
+http_response_size = registry.register(
+    Histogram("http_response_size_bytes", "HTTP response body size.", ("method", "route"), buckets=SIZE_BUCKETS)
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+)
+db_queries = registry.register(Counter("db_queries_total", "SQL statements executed while serving requests."))
+db_queries_per_request = registry.register(
+    Histogram("db_queries_per_request", "SQL statements per request.", ("method", "route"), buckets=COUNT_BUCKETS)
+)
+db_time_per_request = registry.register(
+    Histogram(
+        "db_query_seconds_per_request", "Time spent in SQL per request.", ("method", "route"), buckets=LATENCY_BUCKETS
+    )
+)
+threadpool_threads = registry.register(
+    Gauge("threadpool_threads", "Sync endpoint threadpool: limit, busy and waiting.", ("state",), _threadpool_threads)
+)
+db_pool_connections = registry.register(
+    Gauge("db_pool_connections", "SQLAlchemy connection pool counters.", ("state",), _db_pool_connections)
+)
+
+
+class _RouteChildren:
+    __slots__ = ("requests", "duration", "size", "queries", "query_seconds")
+
+    def __init__(self, method: str, route: str, status: str):
+        self.requests = http_requests.labels(method, route, status)
+        self.duration = http_request_duration.labels(method, route)
+        self.size = http_response_size.labels(method, route)
+        self.queries = db_queries_per_request.labels(method, route)
+        self.query_seconds = db_time_per_request.labels(method, route)
+
+
+_route_children: Dict[Tuple[str, str, int], _RouteChildren] = {}
+
+
+def record_request(
+    method: str, route: str, status: int, seconds: float, size: int, stats: RequestStats
+) -> None:
+    key = (method, route, status)
+    children = _route_children.get(key)
+    if children is None:
+        children = _route_children.setdefault(key, _RouteChildren(method, route, str(status)))
+    children.requests.inc()
+    children.duration.observe(seconds)
+    children.size.observe(size)
+    children.queries.observe(stats.queries)
+    children.query_seconds.observe(stats.query_seconds)
+    db_queries.inc(stats.queries)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, status, response size, in-flight
+    requests and per-request SQL totals, labelled by route template.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status = 500
+        size = 0
+
+        async def send_and_measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            http_requests_in_flight.dec()
+            current_request_stats.reset(token)
+            record_request(
+                scope["method"], route_template(scope), status, time.perf_counter() - started, size, stats
+            )
@@ -0,0 +1,178 @@
+"""
+Request-scoped SQL profiling: statement counts, time, and repeated
+statements (the N+1 signature), checked against a per-route query budget.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Raised instead of logging when ``SQL_QUERY_BUDGET_STRICT`` is set, so
+    test runs fail on query-count regressions.
+    """
+
+
+class RequestStats:
+    """
+    SQL statements run while serving one request. Shared by reference with
+    the threadpool, so queries from sync endpoints are counted too.
+    """
+
+    __slots__ = ("queries", "query_seconds", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        # Parameterized SQL text -> executions; identical text is one query shape
+        self.statements: Dict[str, int] = {}
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements executed at least ``threshold`` times, most repeated first.
+        """
+        return sorted(
+            ((statement, count) for statement, count in self.statements.items() if count >= threshold),
+            key=lambda item: -item[1],
+        )
+
+
+# Route label for requests that matched no route, so scanners can't blow up cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope) -> str:
+    """
+    The matched route's path template, e.g. ``/api/v1/series/{slug}``.
+
+    Rebuilt from the request path and its path parameters, since routes
+    from included routers only know their own suffix.
+    """
+    if scope.get("route") is None:
+        return UNMATCHED_ROUTE
+    path_params = scope.get("path_params")
+    if not path_params:
+        return scope["path"]
+    segments = scope["path"].split("/")
+    pending = {str(value): name for name, value in path_params.items()}
+    for index in range(len(segments) - 1, -1, -1):
+        name = pending.pop(segments[index], None)
+        if name is not None:
+            segments[index] = "{" + name + "}"
+            if not pending:
+                break
+    return "/".join(segments)
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+# ASGI scope of the request being served, for attributing queries to routes
+current_request_scope: ContextVar[Optional[dict]] = ContextVar("current_request_scope", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_request_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.queries += 1
+    stats.query_seconds += time.perf_counter() - started.pop()
+    stats.statements[statement] = stats.statements.get(statement, 0) + 1
+
+
+@contextmanager
+def count_queries() -> Iterator[RequestStats]:
+    """
+    Profile the statements run inside the block, e.g. in tests::
+
+        with count_queries() as stats:
+            crud.series.get_details_by_slug(db, slug="intro")
+        assert stats.queries <= 3
+    """
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_request_stats.reset(token)
+
+
+def query_budget(limit: int) -> Callable:
+    """
+    Endpoint decorator overriding ``SQL_QUERY_BUDGET`` for one route.
+    """
+
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = limit
+        return endpoint
+
+    return decorate
+
+
+def check_query_budget(route: str, endpoint: Optional[Callable], stats: RequestStats) -> None:
+    """
+    Log (or, in strict mode, raise) when a request ran more statements than
+    its route's budget or repeated one statement past the N+1 threshold.
+    """
+    budget = getattr(endpoint, "__query_budget__", settings.SQL_QUERY_BUDGET)
+    repeated = stats.repeated(settings.SQL_REPEATED_STATEMENT_THRESHOLD)
+    if stats.queries <= budget and not repeated:
+        return
+
+    problems = []
+    if stats.queries > budget:
+        problems.append(f"{stats.queries} queries (budget {budget})")
+    for statement, count in repeated[:3]:
+        problems.append(f"repeated {count}x: {' '.join(statement.split())[:200]}")
+    message = f"SQL profile for {route}: " + "; ".join(problems)
+    if settings.SQL_QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class QueryProfilerMiddleware:
+    """
+    Pure ASGI middleware that profiles each request's SQL and checks it
+    against the route's budget. Reuses the stats of an outer middleware
+    (metrics) when there is one.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+        scope_token = current_request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_request_scope.reset(scope_token)
+            if token is not None:
+                current_request_stats.reset(token)
+        route = scope.get("route")
+        if route is not None:
+            check_query_budget(route_template(scope), getattr(route, "endpoint", None), stats)
@@ -0,0 +1,200 @@
+"""
+Opt-in profiling of individual requests with a pure-Python stack sampler.
+
+Profiles are written as collapsed stacks (``frame;frame;frame count``), the
+input format of flamegraph.pl and speedscope, to a capped local directory.
+"""
+import asyncio
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from jose import jwt
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+PROFILE_NAME = re.compile(r"^[0-9TZ-]+-[0-9a-f]{8}\.collapsed$")
+
+# Innermost frames of a thread with nothing to do; their samples are dropped
+_IDLE_MODULES = ("threading", "queue", "selectors", "concurrent.futures.thread")
+
+
+def _frame_label(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    """
+    Samples the stacks of every other thread in the process every
+    ``interval`` seconds until stopped.
+
+    Sync endpoints run in the threadpool, so all threads are sampled;
+    requests served concurrently by the same worker show up as well, which
+    makes profiles clearest on a quiet worker.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or frame.f_globals.get("__name__") in _IDLE_MODULES:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                if thread_id not in names:
+                    names.update((thread.ident, thread.name) for thread in threading.enumerate())
+                labels.append(names.get(thread_id, str(thread_id)).replace(" ", "_"))
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """
+    Collapsed-stack files in ``directory``, keeping the newest ``max_files``.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_name() -> str:
+        return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}.collapsed"
+
+    def save(self, name: str, content: str) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, name), "w") as f:
+                f.write(content)
+            for old in self.list()[self.max_files:]:
+                os.remove(os.path.join(self.directory, old["name"]))
+
+    def list(self) -> List[Dict[str, Any]]:
+        """
+        Stored profiles, newest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        names = sorted((name for name in os.listdir(self.directory) if PROFILE_NAME.match(name)), reverse=True)
+        return [
+            {"name": name, "size": os.path.getsize(os.path.join(self.directory, name))} for name in names
+        ]
+
+    def read(self, name: str) -> Optional[str]:
+        path = os.path.join(self.directory, name)
+        if not PROFILE_NAME.match(name) or not os.path.isfile(path):
+            return None
+        with open(path) as f:
+            return f.read()
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+def _bearer_subject(scope) -> Optional[str]:
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]).get("sub")
+            except jwt.JWTError:
+                return None
+    return None
+
+
+def _is_superuser(user_id: str) -> bool:
+    from app import crud
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = crud.user.get(db, id=user_id)
+        return bool(user and user.is_active and user.is_superuser)
+    finally:
+        db.close()
+
+
+async def _requested_by_superuser(scope) -> bool:
+    if not any(name == PROFILE_HEADER for name, _ in scope.get("headers", [])):
+        return False
+    user_id = _bearer_subject(scope)
+    return user_id is not None and await asyncio.to_thread(_is_superuser, user_id)
+
+
+class RequestProfilerMiddleware:
+    """
+    Profiles a request when a superuser sends ``X-Profile: 1``, or at
+    ``PROFILING_SAMPLE_RATE``. The profile id is returned in ``X-Profile-Id``
+    and the file is served from /debug/profiles.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        sampled = random.random() < settings.PROFILING_SAMPLE_RATE
+        if not sampled and not await _requested_by_superuser(scope):
+            await self.app(scope, receive, send)
+            return
+
+        name = profile_store.new_name()
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (PROFILE_ID_HEADER, name.encode())]}
+            await send(message)
+
+        sampler = StackSampler(settings.PROFILING_INTERVAL_MS / 1000.0)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            try:
+                await asyncio.to_thread(profile_store.save, name, sampler.collapsed())
+                logger.info(
+                    f"Profiled {scope['method']} {scope['path']} ({elapsed_ms:.1f}ms, "
+                    f"{sampler.samples} samples): {name}"
+                )
+            except OSError as e:
+                logger.error(f"Could not store profile {name}: {e}")
@@ -0,0 +1,72 @@
+"""
+Process sizing for production: how many workers to run, and each worker's
+share of the database's connection limit.
+"""
+import math
+import os
+from typing import Tuple
+
+from app.core.config import settings
+
+# cgroup v2 CPU limit of the container: "<quota> <period>" or "max <period>"
+_CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process may use: the container's CPU quota when one is set,
+    else the affinity mask, else the machine's count.
+    """
+    try:
+        with open(_CGROUP_CPU_MAX) as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    """
+    How many workers share the connection budget: ``WEB_CONCURRENCY``, which
+    run.py exports to the workers it starts, else 1. Any other process
+    (release step, scripts, the dev server) runs alone.
+    """
+    concurrency = os.environ.get("WEB_CONCURRENCY")
+    if concurrency:
+        return max(1, int(concurrency))
+    return 1
+
+
+def production_worker_count() -> int:
+    """
+    Workers for run.py to start: ``WEB_CONCURRENCY``, else ``WEB_WORKERS``,
+    else one per CPU, but no more than can each get ``DB_MIN_POOL_SIZE``
+    connections out of the budget.
+    """
+    concurrency = os.environ.get("WEB_CONCURRENCY")
+    if concurrency:
+        return max(1, int(concurrency))
+    if settings.WEB_WORKERS:
+        return settings.WEB_WORKERS
+    budget = settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS
+    return max(1, min(available_cpus(), budget // settings.DB_MIN_POOL_SIZE))
+
+
+def pool_limits(workers: int) -> Tuple[int, int]:
+    """
+    ``(pool_size, max_overflow)`` for one worker, so that all workers together
+    stay within ``DB_MAX_CONNECTIONS - DB_RESERVED_CONNECTIONS``. Half of the
+    share is kept open; the rest is overflow, opened only under bursts. The
+    pool never drops below ``DB_MIN_POOL_SIZE``, even if that overshoots the
+    budget; run.py logs a warning when it does.
+    """
+    floor = settings.DB_MIN_POOL_SIZE
+    if settings.DB_POOL_SIZE:
+        return max(floor, settings.DB_POOL_SIZE), 0
+    share = max(floor, (settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS) // workers)
+    pool_size = max(floor, math.ceil(share / 2))
+    return pool_size, share - pool_size
@@ -0,0 +1,177 @@
+"""
+Opt-in slow-query log: statements slower than a threshold are kept, with
+their shape but never their values, in a bounded in-memory buffer.
+"""
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.query_profiler import current_request_scope, route_template
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Expanded IN lists: (?, ?, ?) / (%(id_1)s, %(id_2)s) / (:a, :b)
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%\(\w+\)s|%s|\?|:\w+)(?:\s*,\s*(?:%\(\w+\)s|%s|\?|:\w+))+\s*\)")
+# Row locks and SELECT ... INTO have side effects when ANALYZE runs the statement again
+_SIDE_EFFECT_CLAUSE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE)\b|\bFOR\s+KEY\s+SHARE\b|\bINTO\b")
+_LEADING_KEYWORD = re.compile(r"[\s(]*(\w+)")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "VALUES", "TABLE")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    One line per query shape: literals become ``?`` and IN lists ``(...)``.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Bind parameter names and types, without values.
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": parameter_shape(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {name: _type_name(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_type_name(value) for value in parameters]
+    return None
+
+
+def calling_function() -> Optional[str]:
+    """
+    The innermost frame in the app's CRUD (or, failing that, any app code
+    outside app/core), as ``path:line function``.
+    """
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        if "/app/" in filename and "/app/core/" not in filename:
+            location = f"app/{filename.rsplit('/app/', 1)[1]}:{frame.f_lineno} {frame.f_code.co_name}"
+            if "/app/crud/" in filename:
+                return location
+            fallback = fallback or location
+        frame = frame.f_back
+    return fallback
+
+
+def explain_command(statement: str) -> Optional[str]:
+    """
+    The EXPLAIN to run for a statement: ``EXPLAIN (ANALYZE, BUFFERS)`` only
+    for a plain SELECT, since ANALYZE executes it again; plain ``EXPLAIN``
+    for other DML, including WITH (its CTEs may modify data) and locking
+    reads; None for anything EXPLAIN doesn't take.
+    """
+    match = _LEADING_KEYWORD.match(statement)
+    keyword = match.group(1).upper() if match else ""
+    if keyword not in _EXPLAINABLE:
+        return None
+    if keyword == "SELECT" and not _SIDE_EFFECT_CLAUSE.search(_STRING_LITERAL.sub("?", statement.upper())):
+        return "EXPLAIN (ANALYZE, BUFFERS)"
+    return "EXPLAIN"
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[List[str]]:
+    """
+    The PostgreSQL plan for a statement (see ``explain_command``), run on the
+    same connection inside a savepoint so a failure can't abort the caller's
+    transaction. ANALYZE executes the query again, hence the sampling.
+    """
+    command = explain_command(statement) if conn.dialect.name == "postgresql" else None
+    if command is None:
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(f"{command} {statement}", parameters)
+            plan = [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            plan = [f"EXPLAIN failed: {e}"]
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    """
+    Thread-safe ring buffer of the most recent slow queries.
+    """
+
+    def __init__(self, maxlen: int):
+        self._entries: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Newest first.
+        """
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_BUFFER_SIZE)
+
+
+def attach_slow_query_log(engine) -> None:
+    """
+    Time every statement on ``engine``; record those over
+    ``SLOW_QUERY_THRESHOLD_MS`` at ``SLOW_QUERY_SAMPLE_RATE``, with a plan at
+    ``SLOW_QUERY_EXPLAIN_SAMPLE_RATE``.
+    """
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS / 1000.0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("slow_query_started_at")
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        if elapsed < threshold or random.random() >= settings.SLOW_QUERY_SAMPLE_RATE:
+            return
+
+        scope = current_request_scope.get()
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed * 1000, 2),
+            "statement": normalize_sql(statement),
+            "parameters": parameter_shape(parameters, executemany),
+            "caller": calling_function(),
+            "route": route_template(scope) if scope is not None else None,
+            "explain": None,
+        }
+        if not executemany and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE:
+            entry["explain"] = explain(conn, statement, parameters)
+        slow_query_log.record(entry)
@@ -0,0 +1,261 @@
+"""
+Structured logging: JSON lines written by a background thread, per-logger
+levels and sampling from settings, and a request id on every record.
+
+Request threads only put records on a bounded queue; a ``QueueListener``
+thread formats and writes them, so a slow stdout never stalls a request.
+When the queue is full, records are dropped and counted rather than blocking.
+"""
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import traceback
+import uuid
+import zlib
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+REQUEST_ID_HEADER = b"x-request-id"
+# Incoming ids are echoed into logs and headers, so only short, plain ones are trusted
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+# Id of the request being served; copied into threadpool calls with the rest of the context
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+# Attributes every LogRecord has; anything else came from ``extra=`` and is logged as a field.
+# uvicorn adds an ANSI-coloured copy of its messages, which is never wanted in JSON
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "color_message",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ``timestamp``, ``level``, ``logger``,
+    ``message``, ``request_id`` when set, ``extra=`` fields, and
+    ``exception`` with the traceback.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """
+    The previous plain-text layout, with the request id when there is one.
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{line} [{request_id}]" if request_id else line
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Stamps records with the current request id. Runs on the logging
+    thread's caller, where the request's context is still visible.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            request_id = current_request_id.get()
+            if request_id is not None:
+                record.request_id = request_id
+        return True
+
+
+def _matching_rate(rates: Dict[str, float], name: str) -> Optional[float]:
+    """
+    Rate of the most specific configured logger that ``name`` is, or is under.
+    """
+    while name:
+        if name in rates:
+            return rates[name]
+        name = name.rpartition(".")[0]
+    return None
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a fraction of the sub-WARNING records of high-volume loggers, e.g.
+    ``{"uvicorn.access": 0.1}``. WARNING and above are always kept.
+
+    Records with a request id are sampled per request, so a kept request
+    keeps all of its lines.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = _matching_rate(self.rates, record.name)
+        if rate is None or rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        request_id = getattr(record, "request_id", None)
+        if request_id is None:
+            return random.random() < rate
+        return zlib.crc32(request_id.encode()) / 0xFFFFFFFF < rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queues records for the listener thread, dropping (and counting) them
+    when the queue is full instead of blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and traceback here: args and exc_info may not survive the hand-off
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info)).rstrip()
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_level(level) -> int:
+    """
+    ``"info"``, ``"WARNING"`` or ``10`` as a logging level.
+    """
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level!r}")
+    return value
+
+
+_listener: Optional[QueueListener] = None
+queue_handler: Optional[NonBlockingQueueHandler] = None
+
+
+def configure_logging() -> None:
+    """
+    Route all logging through the queue and the listener thread. Replaces
+    any handlers already on the root logger, including uvicorn's own, so
+    server and application lines share one format. Safe to call again.
+    """
+    global _listener, queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter())
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    # Request id first, so sampling can keep or drop whole requests
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(parse_level(settings.LOG_LEVEL))
+
+    # uvicorn configures its loggers before importing the app; send them to the root instead
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        server_logger = logging.getLogger(name)
+        server_logger.handlers.clear()
+        server_logger.propagate = True
+    for name, level in settings.LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(parse_level(level))
+
+    _listener = QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """
+    Flush queued records and stop the listener thread.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+class RequestIdMiddleware:
+    """
+    Takes the request id from ``X-Request-ID`` (or makes one), exposes it
+    to logging for the rest of the request, and returns it in the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = new_request_id()
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (REQUEST_ID_HEADER, request_id.encode())],
+                }
+            await send(message)
+
+        token = current_request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            current_request_id.reset(token)
@@ -0,0 +1,124 @@
+import base64
+import hashlib
+import hmac
+import re
+import threading
+from collections import Counter, deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from app.core.config import settings
+
+# Smallest transparent 1x1 GIF
+PIXEL_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+EMAIL_OPEN = "email_open"
+EMAIL_CLICK = "email_click"
+BANNER_CLICK = "banner_click"
+
+_HREF_RE = re.compile(r"""href=(["'])(https?://[^"']+)\1""", re.IGNORECASE)
+
+
+def _signature(kind: str, *parts: str) -> str:
+    message = "\n".join((kind,) + parts).encode()
+    digest = hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:12]).decode()
+
+
+def make_token(kind: str, ids: Tuple[str, ...], url: str = "") -> str:
+    """
+    Sign ``ids`` (and the redirect target, for clicks) into a URL-safe token.
+
+    Tokens are ``id[.id].signature``; ids are UUIDs so they never contain dots.
+    """
+    return ".".join(ids + (_signature(kind, *ids, url),))
+
+
+def read_token(kind: str, token: str, url: str = "") -> Optional[Tuple[str, ...]]:
+    """
+    Return the ids signed into ``token``, or None if the signature is wrong.
+    """
+    *ids, signature = token.split(".")
+    if not ids or not hmac.compare_digest(signature, _signature(kind, *ids, url)):
+        return None
+    return tuple(ids)
+
+
+def _tracking_url(path: str) -> str:
+    base = (settings.PUBLIC_BASE_URL or "").rstrip("/")
+    return f"{base}{settings.API_V1_STR}/track{path}"
+
+
+def email_open_url(email_id: str, delivery_id: str) -> str:
+    return _tracking_url(f"/o/{make_token(EMAIL_OPEN, (email_id, delivery_id))}.gif")
+
+
+def email_click_url(email_id: str, delivery_id: str, url: str) -> str:
+    token = make_token(EMAIL_CLICK, (email_id, delivery_id), url)
+    return _tracking_url(f"/c/{token}?{urlencode({'url': url})}")
+
+
+def banner_click_url(banner_id: str, url: str) -> str:
+    token = make_token(BANNER_CLICK, (banner_id,), url)
+    return _tracking_url(f"/b/{token}?{urlencode({'url': url})}")
+
+
+def add_email_tracking(html: str, *, email_id: str, delivery_id: str) -> str:
+    """
+    Rewrite absolute links through the click tracker and append the open pixel.
+
+    Emails need absolute URLs, so nothing is rewritten unless PUBLIC_BASE_URL is set.
+    """
+    if not settings.PUBLIC_BASE_URL:
+        return html
+
+    def rewrite(match: "re.Match[str]") -> str:
+        quote_char, url = match.groups()
+        tracked = email_click_url(email_id, delivery_id, url).replace("&", "&amp;")
+        return f"href={quote_char}{tracked}{quote_char}"
+
+    pixel = (
+        f'<img src="{email_open_url(email_id, delivery_id)}" '
+        'width="1" height="1" alt="" style="display:none">'
+    )
+    return _HREF_RE.sub(rewrite, html) + pixel
+
+
+class TrackingBuffer:
+    """
+    Fixed-size ring buffer of (kind, target_id) tracking events.
+
+    Request handlers only append, which is atomic on a deque, so recording an
+    event never takes a lock or touches the database. When the buffer is full
+    the oldest events are overwritten and counted as dropped.
+    """
+
+    def __init__(self, maxlen: int):
+        self._events: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, kind: str, target_id: str) -> None:
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append((kind, target_id))
+
+    def drain(self) -> Dict[str, Counter]:
+        """
+        Remove all buffered events and aggregate them into per-kind counts.
+        """
+        counts: Dict[str, Counter] = {}
+        with self._lock:
+            for _ in range(len(self._events)):
+                try:
+                    kind, target_id = self._events.popleft()
+                except IndexError:
+                    break
+                counts.setdefault(kind, Counter())[target_id] += 1
+        return counts
+
+
+tracking_buffer = TrackingBuffer(settings.TRACKING_BUFFER_SIZE)
@@ -9,8 +9,9 @@ from app.crud.learning_path import (
     learning_path_content_item,
     learning_path_resource,
 )
-from app.crud.quiz import quiz, user_quiz_attempt
+from app.crud.quiz import quiz, user_quiz_attempt, quiz_stat
 from app.crud.award import award, user_award
+from app.crud.points import points_ledger
 from app.crud.course import (
     course_category,
     course,
@@ -25,5 +26,6 @@ from app.crud.prelaunch import (
     course_prelaunch_campaign,
     prelaunch_subscriber,
     prelaunch_email_sequence,
-    prelaunch_email
+    prelaunch_email,
+    prelaunch_email_delivery,
 )
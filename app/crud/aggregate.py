@@ -0,0 +1,76 @@
+from typing import Any, Dict, Optional, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+def bump_content_version(db: Session, model: Type[Any], *criteria: Any) -> None:
+    """
+    Mark the content roots matching ``criteria`` as changed so their cached
+    aggregates are rebuilt. Part of the caller's transaction.
+    """
+    db.query(model).filter(*criteria).update(
+        {model.version: func.coalesce(model.version, 1) + 1}, synchronize_session=False
+    )
+
+
+class ContentAggregateLoader:
+    """
+    Loads a content root (series, booklet, learning path) by slug together
+    with its author and ordered children, serialized with ``schema``.
+
+    Results are cached per slug with the root's ``id`` and ``version``; every
+    read checks both with one indexed query, so edits made through any
+    worker are seen immediately. A miss loads the aggregate in a fixed number
+    of queries: ``joined`` relationships in the root query, each ``selected``
+    one in a single extra query. A dotted ``selected`` path such as
+    ``"modules.content_items"`` loads grandchildren, one query per level.
+    """
+
+    def __init__(
+        self,
+        model: Type[Any],
+        schema: Type[BaseModel],
+        *,
+        joined: Sequence[str] = (),
+        selected: Sequence[str] = (),
+    ):
+        self.model = model
+        self.schema = schema
+        self.joined = joined
+        self.selected = selected
+        self.cache = TTLCache(
+            maxsize=settings.CONTENT_CACHE_MAX_ENTRIES, ttl=settings.CONTENT_CACHE_TTL_SECONDS
+        )
+
+    def _selectin(self, path: str) -> Any:
+        model, option = self.model, None
+        for name in path.split("."):
+            attribute = getattr(model, name)
+            option = selectinload(attribute) if option is None else option.selectinload(attribute)
+            model = attribute.property.mapper.class_
+        return option
+
+    def get_by_slug(self, db: Session, *, slug: str) -> Optional[Dict[str, Any]]:
+        row = db.query(self.model.id, self.model.version).filter(self.model.slug == slug).first()
+        if row is None:
+            return None
+        # The ID too: a root created with a deleted or renamed root's slug starts at version 1 again
+        cached = self.cache.get(slug)
+        if cached is not None and cached[:2] == (row.id, row.version):
+            return cached[2]
+
+        # Built per load so importing the CRUD modules doesn't configure the mappers
+        options = [joinedload(getattr(self.model, name)) for name in self.joined] + [
+            self._selectin(path) for path in self.selected
+        ]
+        root = db.query(self.model).options(*options).filter(self.model.id == row.id).first()
+        if root is None:
+            return None
+        data = self.schema.model_validate(root).model_dump(mode="json")
+        self.cache.set(slug, (root.id, root.version, data))
+        return data
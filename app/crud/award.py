@@ -1,11 +1,21 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterable, Tuple
+import logging
 import uuid
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, exists, literal, select, union_all
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, dialect_insert
+from app.crud.points import points_ledger
 from app.models.award import Award, UserAward
+from app.models.user import User
 from app.schemas.award import AwardCreate, AwardUpdate, UserAwardCreate, UserAwardUpdate
+from app.utils.award_rules import POINTS_CHANGED, compile_requirements, triggered_by
+from app.utils.leaderboard import leaderboard
+
+logger = logging.getLogger(__name__)
+
+# Awards evaluated per query
+AWARD_BATCH_SIZE = 50
 
 
 class CRUDAward(CRUDBase[Award, AwardCreate, AwardUpdate]):
@@ -42,6 +52,20 @@ class CRUDAward(CRUDBase[Award, AwardCreate, AwardUpdate]):
         
         return result
 
+    def get_rule_awards(
+        self, db: Session, *, award_ids: Optional[List[str]] = None, event: Optional[str] = None
+    ) -> List[Award]:
+        """
+        Get awards that have requirements, optionally only those ``event`` can affect.
+        """
+        query = db.query(Award).filter(Award.requirements.isnot(None))
+        if award_ids is not None:
+            query = query.filter(Award.id.in_(award_ids))
+        awards = [award for award in query.all() if award.requirements]
+        if event:
+            awards = [award for award in awards if triggered_by(award.requirements, event)]
+        return awards
+
 
 class CRUDUserAward(CRUDBase[UserAward, UserAwardCreate, UserAwardUpdate]):
     def create_with_user(
@@ -99,6 +123,134 @@ class CRUDUserAward(CRUDBase[UserAward, UserAwardCreate, UserAwardUpdate]):
             )
         ).first() is not None
 
+    def find_earned(
+        self, db: Session, *, awards: List[Award], user_ids: Optional[List[str]] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Find (user_id, award_id) pairs whose requirements are met but that
+        haven't been granted yet.
+
+        Each batch of awards is evaluated in a single UNION ALL query, for one
+        user, a list of users or all active users.
+        """
+        earned = []
+        for start in range(0, len(awards), AWARD_BATCH_SIZE):
+            selects = []
+            for award in awards[start:start + AWARD_BATCH_SIZE]:
+                try:
+                    predicate = compile_requirements(award.requirements)
+                except ValueError as e:
+                    logger.warning(f"Skipping award {award.id}: {e}")
+                    continue
+                if predicate is None:
+                    continue
+                already_granted = exists().where(
+                    UserAward.user_id == User.id, UserAward.award_id == award.id
+                )
+                stmt = select(
+                    User.id.label("user_id"), literal(award.id).label("award_id")
+                ).where(User.is_active == True, predicate, ~already_granted)
+                if user_ids is not None:
+                    stmt = stmt.where(User.id.in_(user_ids))
+                selects.append(stmt)
+            if selects:
+                query = selects[0] if len(selects) == 1 else union_all(*selects)
+                earned.extend((row.user_id, row.award_id) for row in db.execute(query))
+        return earned
+
+    def grant_many(
+        self,
+        db: Session,
+        *,
+        grants: Iterable[Tuple[str, str]],
+        points: Dict[str, int],
+        award_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        """
+        Insert user awards in one statement and add each award's points to
+        its user. Pairs the user already has are skipped. Does not commit.
+
+        Returns (id, user_id, award_id) rows for the user awards that were created.
+        """
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "award_id": award_id,
+                "progress": 100,
+                "award_metadata": award_metadata or {},
+            }
+            for user_id, award_id in grants
+        ]
+        if not rows:
+            return []
+
+        table = UserAward.__table__
+        stmt = dialect_insert(db, table).values(rows).on_conflict_do_nothing(
+            index_elements=[table.c.user_id, table.c.award_id]
+        ).returning(table.c.id, table.c.user_id, table.c.award_id)
+        inserted = db.execute(stmt).all()
+
+        points_ledger.apply_many(db, entries=[
+            {
+                "user_id": row.user_id,
+                "points": points.get(row.award_id) or 0,
+                "reason": "award",
+                "source_type": "user_award",
+                "source_id": row.id,
+            }
+            for row in inserted
+            if points.get(row.award_id)
+        ])
+        return inserted
+
+    def evaluate(
+        self,
+        db: Session,
+        *,
+        user_ids: Optional[List[str]] = None,
+        award_ids: Optional[List[str]] = None,
+        event: Optional[str] = None,
+    ) -> List[UserAward]:
+        """
+        Grant every rule-based award the given users (or all users) have earned.
+
+        Granting points can unlock further ``min_points`` awards, so evaluation
+        repeats until nothing new is granted. Everything is committed in one
+        transaction. Returns the new user awards.
+        """
+        awards = award.get_rule_awards(db, award_ids=award_ids, event=event)
+        if not awards:
+            return []
+        points = {a.id: a.points for a in awards}
+        points_awards = award.get_rule_awards(db, event=POINTS_CHANGED)
+        for a in points_awards:
+            points.setdefault(a.id, a.points)
+
+        granted = []
+        pending = awards
+        for _ in range(len(points) + 1):
+            earned = self.find_earned(db, awards=pending, user_ids=user_ids)
+            inserted = self.grant_many(
+                db,
+                grants=earned,
+                points=points,
+                award_metadata={"earned_by": "rules", "event": event},
+            )
+            granted.extend(inserted)
+            if not inserted or not points_awards or not any(points[a] for _, a in earned):
+                break
+            # Points went up; re-check the points-based awards for those users
+            pending = points_awards
+            user_ids = list({user_id for user_id, _ in earned})
+        db.commit()
+
+        if not granted:
+            return []
+        for row in granted:
+            leaderboard.add_points(row.user_id, points.get(row.award_id) or 0)
+        return db.query(UserAward).filter(UserAward.id.in_([row.id for row in granted])).all()
+
 
 award = CRUDAward(Award)
 user_award = CRUDUserAward(UserAward)
@@ -1,8 +1,10 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import bindparam, func, update
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Insert
 
 from app.core.database import Base
 
@@ -11,6 +13,21 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def dialect_insert(db: Session, table: Any) -> Insert:
+    """
+    Build an INSERT for the session's dialect so callers can use
+    ``on_conflict_do_nothing``/``on_conflict_do_update``.
+
+    Production runs on PostgreSQL, the test suite on SQLite; both dialects
+    expose the same ON CONFLICT API.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
@@ -31,6 +48,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> List[ModelType]:
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    def get_many(self, db: Session, ids: Sequence[Any]) -> List[ModelType]:
+        """
+        Rows for ``ids`` in one ``WHERE id IN (...)`` query, in the order the
+        ids were given. Duplicates are returned once; missing ids are skipped.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        found = {obj.id: obj for obj in db.query(self.model).filter(self.model.id.in_(ids))}
+        return [found[id] for id in ids if id in found]
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
@@ -64,3 +92,18 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.delete(obj)
         db.commit()
         return obj
+
+    def increment_counters(self, db: Session, *, column: str, counts: Dict[Any, int]) -> None:
+        """
+        Add ``counts[id]`` to ``column`` for each row in one executemany
+        UPDATE, without loading any objects. Does not commit.
+        """
+        if not counts:
+            return
+        table = self.model.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values({column: func.coalesce(table.c[column], 0) + bindparam("b_amount")}),
+            [{"b_id": id, "b_amount": amount} for id, amount in counts.items()],
+        )
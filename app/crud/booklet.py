@@ -1,14 +1,24 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
 from sqlalchemy.orm import Session
 
+from app.crud.aggregate import ContentAggregateLoader, bump_content_version
 from app.crud.base import CRUDBase
 from app.models.booklet import Booklet, BookletChapter, BookletUpdate
 from app.schemas.booklet import (
     BookletCreate, BookletUpdate as BookletUpdateSchema,
     BookletChapterCreate, BookletChapterUpdate,
-    BookletUpdateCreate, BookletUpdateUpdate
+    BookletUpdateCreate, BookletUpdateUpdate,
+    BookletWithDetails
+)
+
+# Booklet with author, ordered chapters and newest-first updates: three queries on a cache miss
+booklet_details = ContentAggregateLoader(
+    Booklet,
+    BookletWithDetails,
+    joined=("author_relation",),
+    selected=("chapters", "updates"),
 )
 
 
@@ -21,6 +31,18 @@ class CRUDBooklet(CRUDBase[Booklet, BookletCreate, BookletUpdateSchema]):
     ) -> List[Booklet]:
         return db.query(Booklet).offset(skip).limit(limit).all()
 
+    def get_details_by_slug(self, db: Session, *, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON-ready ``BookletWithDetails`` for a slug, children in order.
+        """
+        return booklet_details.get_by_slug(db, slug=slug)
+
+    def update(
+        self, db: Session, *, db_obj: Booklet, obj_in: Union[BookletUpdateSchema, Dict[str, Any]]
+    ) -> Booklet:
+        bump_content_version(db, Booklet, Booklet.id == db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
     def create(self, db: Session, *, obj_in: BookletCreate) -> Booklet:
         # Convert tags, learning_outcomes, and prerequisites to JSON if provided
         tags = obj_in.tags if obj_in.tags else []
@@ -75,10 +97,22 @@ class CRUDBookletChapter(CRUDBase[BookletChapter, BookletChapterCreate, BookletC
             booklet_id=obj_in.booklet_id,
         )
         db.add(db_obj)
+        bump_content_version(db, Booklet, Booklet.id == obj_in.booklet_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: BookletChapter, obj_in: Union[BookletChapterUpdate, Dict[str, Any]]
+    ) -> BookletChapter:
+        bump_content_version(db, Booklet, Booklet.id == db_obj.booklet_id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> BookletChapter:
+        booklet_id = db.query(BookletChapter.booklet_id).filter(BookletChapter.id == id).scalar()
+        bump_content_version(db, Booklet, Booklet.id == booklet_id)
+        return super().remove(db, id=id)
+
 
 class CRUDBookletUpdate(CRUDBase[BookletUpdate, BookletUpdateCreate, BookletUpdateUpdate]):
     def get_multi_by_booklet(
@@ -102,10 +136,22 @@ class CRUDBookletUpdate(CRUDBase[BookletUpdate, BookletUpdateCreate, BookletUpda
             booklet_id=obj_in.booklet_id,
         )
         db.add(db_obj)
+        bump_content_version(db, Booklet, Booklet.id == obj_in.booklet_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: BookletUpdate, obj_in: Union[BookletUpdateUpdate, Dict[str, Any]]
+    ) -> BookletUpdate:
+        bump_content_version(db, Booklet, Booklet.id == db_obj.booklet_id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> BookletUpdate:
+        booklet_id = db.query(BookletUpdate.booklet_id).filter(BookletUpdate.id == id).scalar()
+        bump_content_version(db, Booklet, Booklet.id == booklet_id)
+        return super().remove(db, id=id)
+
 
 booklet = CRUDBooklet(Booklet)
 booklet_chapter = CRUDBookletChapter(BookletChapter)
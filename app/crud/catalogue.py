@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.booklet import booklet
+from app.crud.course import course
+from app.crud.post import post
+from app.crud.series import series
+from app.schemas.booklet import Booklet
+from app.schemas.course import Course
+from app.schemas.post import PostList
+from app.schemas.series import Series
+
+# Entity type -> (CRUD object, card schema) for the batch fetch API
+CATALOGUE_TYPES = {
+    "courses": (course, Course),
+    "posts": (post, PostList),
+    "series": (series, Series),
+    "booklets": (booklet, Booklet),
+}
+
+# Serialized cards keyed by (entity type, id), per worker
+catalogue_card_cache = TTLCache(
+    maxsize=settings.CONTENT_CACHE_MAX_ENTRIES * len(CATALOGUE_TYPES),
+    ttl=settings.CONTENT_CACHE_TTL_SECONDS,
+)
+
+
+def get_cards(
+    db: Session, *, entity_type: str, ids: Sequence[str]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    JSON-ready cards for ``ids`` in request order, plus the ids that don't
+    exist. Cached cards are served first; the rest are loaded with a single
+    ``get_many`` query.
+    """
+    crud_obj, schema = CATALOGUE_TYPES[entity_type]
+    ids = list(dict.fromkeys(ids))
+    cards: Dict[str, Dict[str, Any]] = {}
+    for id in ids:
+        card = catalogue_card_cache.get((entity_type, id))
+        if card is not None:
+            cards[id] = card
+
+    uncached = [id for id in ids if id not in cards]
+    for obj in crud_obj.get_many(db, uncached):
+        card = schema.model_validate(obj).model_dump(mode="json")
+        catalogue_card_cache.set((entity_type, obj.id), card)
+        cards[obj.id] = card
+
+    return [cards[id] for id in ids if id in cards], [id for id in ids if id not in cards]
+
+
+def invalidate_card(entity_type: str, id: str) -> None:
+    catalogue_card_cache.invalidate((entity_type, id))
@@ -1,10 +1,12 @@
 from typing import List, Optional
 import uuid
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
 from app.models.category import Category
+from app.models.post import Post
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
 
@@ -15,19 +17,29 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
     def get_multi_with_post_count(
         self, db: Session, *, skip: int = 0, limit: int = 100
     ) -> List[dict]:
-        categories = db.query(Category).offset(skip).limit(limit).all()
-        result = []
-        for category in categories:
-            post_count = len(category.posts)
-            category_dict = {
+        # Count in the database instead of loading every category's posts
+        post_counts = (
+            db.query(Post.category_id, func.count(Post.id).label("post_count"))
+            .group_by(Post.category_id)
+            .subquery()
+        )
+        rows = (
+            db.query(Category, func.coalesce(post_counts.c.post_count, 0))
+            .outerjoin(post_counts, post_counts.c.category_id == Category.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
                 "id": category.id,
                 "name": category.name,
                 "slug": category.slug,
                 "description": category.description,
                 "post_count": post_count
             }
-            result.append(category_dict)
-        return result
+            for category, post_count in rows
+        ]
 
     def create(self, db: Session, *, obj_in: CategoryCreate) -> Category:
         db_obj = Category(
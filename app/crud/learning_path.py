@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.crud.aggregate import ContentAggregateLoader, bump_content_version
 from app.crud.base import CRUDBase
 from app.models.learning_path import (
     LearningPath, LearningPathModule, 
@@ -12,14 +14,40 @@ from app.schemas.learning_path import (
     LearningPathCreate, LearningPathUpdate,
     LearningPathModuleCreate, LearningPathModuleUpdate,
     LearningPathContentItemCreate, LearningPathContentItemUpdate,
-    LearningPathResourceCreate, LearningPathResourceUpdate
+    LearningPathResourceCreate, LearningPathResourceUpdate,
+    LearningPathWithDetails
 )
 
+# Path with modules, their content items and resources: four queries on a cache miss
+learning_path_details = ContentAggregateLoader(
+    LearningPath, LearningPathWithDetails, selected=("modules.content_items", "resources")
+)
+
+
+def _paths_of_modules(*module_ids: Optional[str]) -> Any:
+    # Criterion for the learning paths that own these modules
+    return LearningPath.id.in_(
+        select(LearningPathModule.learning_path_id).where(LearningPathModule.id.in_(module_ids))
+    )
+
 
 class CRUDLearningPath(CRUDBase[LearningPath, LearningPathCreate, LearningPathUpdate]):
     def get_by_slug(self, db: Session, *, slug: str) -> Optional[LearningPath]:
         return db.query(LearningPath).filter(LearningPath.slug == slug).first()
 
+    def get_details_by_slug(self, db: Session, *, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON-ready ``LearningPathWithDetails`` for a slug, with modules,
+        content items and resources.
+        """
+        return learning_path_details.get_by_slug(db, slug=slug)
+
+    def update(
+        self, db: Session, *, db_obj: LearningPath, obj_in: Union[LearningPathUpdate, Dict[str, Any]]
+    ) -> LearningPath:
+        bump_content_version(db, LearningPath, LearningPath.id == db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
     def get_multi_with_details(
         self, db: Session, *, skip: int = 0, limit: int = 100
     ) -> List[LearningPath]:
@@ -103,10 +131,24 @@ class CRUDLearningPathModule(CRUDBase[LearningPathModule, LearningPathModuleCrea
             learning_path_id=obj_in.learning_path_id,
         )
         db.add(db_obj)
+        bump_content_version(db, LearningPath, LearningPath.id == obj_in.learning_path_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: LearningPathModule, obj_in: Union[LearningPathModuleUpdate, Dict[str, Any]]
+    ) -> LearningPathModule:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+        # A module moved to another path changes both
+        path_ids = {db_obj.learning_path_id, update_data.get("learning_path_id", db_obj.learning_path_id)}
+        bump_content_version(db, LearningPath, LearningPath.id.in_(path_ids))
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> LearningPathModule:
+        bump_content_version(db, LearningPath, _paths_of_modules(id))
+        return super().remove(db, id=id)
+
 
 class CRUDLearningPathContentItem(CRUDBase[LearningPathContentItem, LearningPathContentItemCreate, LearningPathContentItemUpdate]):
     def get_multi_by_module(
@@ -129,10 +171,29 @@ class CRUDLearningPathContentItem(CRUDBase[LearningPathContentItem, LearningPath
             module_id=obj_in.module_id,
         )
         db.add(db_obj)
+        bump_content_version(db, LearningPath, _paths_of_modules(obj_in.module_id))
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: LearningPathContentItem,
+        obj_in: Union[LearningPathContentItemUpdate, Dict[str, Any]],
+    ) -> LearningPathContentItem:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+        bump_content_version(
+            db, LearningPath, _paths_of_modules(db_obj.module_id, update_data.get("module_id", db_obj.module_id))
+        )
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> LearningPathContentItem:
+        module_id = db.query(LearningPathContentItem.module_id).filter(LearningPathContentItem.id == id).scalar()
+        bump_content_version(db, LearningPath, _paths_of_modules(module_id))
+        return super().remove(db, id=id)
+
 
 class CRUDLearningPathResource(CRUDBase[LearningPathResource, LearningPathResourceCreate, LearningPathResourceUpdate]):
     def get_multi_by_learning_path(
@@ -156,10 +217,30 @@ class CRUDLearningPathResource(CRUDBase[LearningPathResource, LearningPathResour
             learning_path_id=obj_in.learning_path_id,
         )
         db.add(db_obj)
+        bump_content_version(db, LearningPath, LearningPath.id == obj_in.learning_path_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: LearningPathResource,
+        obj_in: Union[LearningPathResourceUpdate, Dict[str, Any]],
+    ) -> LearningPathResource:
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+        path_ids = {db_obj.learning_path_id, update_data.get("learning_path_id", db_obj.learning_path_id)}
+        bump_content_version(db, LearningPath, LearningPath.id.in_(path_ids))
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> LearningPathResource:
+        learning_path_id = db.query(LearningPathResource.learning_path_id).filter(
+            LearningPathResource.id == id
+        ).scalar()
+        bump_content_version(db, LearningPath, LearningPath.id == learning_path_id)
+        return super().remove(db, id=id)
+
 
 learning_path = CRUDLearningPath(LearningPath)
 learning_path_module = CRUDLearningPathModule(LearningPathModule)
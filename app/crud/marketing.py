@@ -1,19 +1,21 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterable
 import uuid
 from datetime import datetime
-import httpx
 import json
 import os
 
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, dialect_insert
 from app.models.marketing import NewsletterSubscription, MarketingBanner
 from app.schemas.marketing import (
     NewsletterSubscriptionCreate, NewsletterSubscriptionUpdate,
     MarketingBannerCreate, MarketingBannerUpdate, BannerStatisticsUpdate
 )
+from app.utils.subscriber_import import chunked, prepare_chunk, extra_fields
+
+NEWSLETTER_IMPORT_FIELDS = ("email", "name", "source")
 
 
 class CRUDNewsletterSubscription(CRUDBase[NewsletterSubscription, NewsletterSubscriptionCreate, NewsletterSubscriptionUpdate]):
@@ -65,6 +67,62 @@ class CRUDNewsletterSubscription(CRUDBase[NewsletterSubscription, NewsletterSubs
 
         return db_obj
 
+    def bulk_import(
+        self,
+        db: Session,
+        *,
+        rows: Iterable[Optional[Dict[str, Any]]],
+        source: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Dict[str, int]:
+        """
+        Import newsletter subscriptions from a stream of row dicts.
+
+        Works like the prelaunch import: one INSERT ... ON CONFLICT (email) per
+        chunk, reactivating unsubscribed rows. Imported rows are left unsynced
+        so they go out with the next /newsletter/sync.
+        """
+        table = NewsletterSubscription.__table__
+        stats = {"total": 0, "inserted": 0, "reactivated": 0, "skipped": 0, "invalid": 0}
+
+        for chunk in chunked(rows, chunk_size):
+            prepared = prepare_chunk(chunk)
+            stats["total"] += len(chunk)
+            stats["invalid"] += prepared["invalid"]
+            stats["skipped"] += prepared["duplicates"]
+            if not prepared["rows"]:
+                continue
+
+            values = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "email": email,
+                    "name": row.get("name") or None,
+                    "source": row.get("source") or source,
+                    "is_active": True,
+                    "synced_to_kit": False,
+                    "subscription_metadata": extra_fields(row, NEWSLETTER_IMPORT_FIELDS),
+                }
+                for email, row in prepared["rows"]
+            ]
+            new_ids = {value["id"] for value in values}
+
+            stmt = dialect_insert(db, table).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.email],
+                set_={"is_active": True, "unsubscribed_at": None},
+                where=table.c.is_active == False,
+            ).returning(table.c.id)
+
+            returned = db.execute(stmt).scalars().all()
+            inserted = sum(1 for returned_id in returned if returned_id in new_ids)
+            stats["inserted"] += inserted
+            stats["reactivated"] += len(returned) - inserted
+            stats["skipped"] += len(values) - len(returned)
+
+        db.commit()
+        return stats
+
     def unsubscribe(self, db: Session, *, email: str) -> Optional[NewsletterSubscription]:
         subscription = self.get_by_email(db, email=email)
         if subscription:
@@ -106,7 +164,9 @@ class CRUDNewsletterSubscription(CRUDBase[NewsletterSubscription, NewsletterSubs
             # Placeholder URL - replace with actual Kit.com API endpoint
             url = f"https://api.kit.com/lists/{list_name}/subscribers"
 
-            # Uncomment this when ready to make actual API calls
+            # Uncomment this when ready to make actual API calls (import httpx here, not at
+            # module level: it is slow to import and nothing else on the request path needs it)
+            # import httpx
             # response = httpx.post(url, json=data, headers=headers)
             # if response.status_code in (200, 201):
             #     # Update subscription as synced
@@ -0,0 +1,216 @@
+from typing import Any, Dict, List, Optional
+from collections import Counter
+import uuid
+
+from sqlalchemy import Integer, bindparam, case, desc, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase, dialect_insert
+from app.models.points import PointsLedgerEntry
+from app.models.user import User
+from app.schemas.points import PointsLedgerEntryCreate, PointsLedgerEntryUpdate
+from app.utils.leaderboard import leaderboard
+
+# Level up every 100 XP
+EXPERIENCE_PER_LEVEL = 100
+
+
+def level_for(experience: Any) -> Any:
+    """
+    Level for an amount of experience; works on ints and SQL expressions.
+    """
+    return 1 + experience // EXPERIENCE_PER_LEVEL
+
+
+class CRUDPointsLedger(CRUDBase[PointsLedgerEntry, PointsLedgerEntryCreate, PointsLedgerEntryUpdate]):
+    def get_by_user(
+        self, db: Session, *, user_id: str, skip: int = 0, limit: int = 100
+    ) -> List[PointsLedgerEntry]:
+        return db.query(PointsLedgerEntry).filter(
+            PointsLedgerEntry.user_id == user_id
+        ).order_by(desc(PointsLedgerEntry.created_at)).offset(skip).limit(limit).all()
+
+    def _append(self, db: Session, entries: List[Dict[str, Any]]) -> List[Any]:
+        # Insert entries, skipping sources that already paid out; returns the inserted rows
+        table = PointsLedgerEntry.__table__
+        stmt = dialect_insert(db, table).values([
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": entry["user_id"],
+                "points": entry.get("points") or 0,
+                "experience": entry.get("experience") or 0,
+                "reason": entry["reason"],
+                "source_type": entry.get("source_type"),
+                "source_id": entry.get("source_id"),
+            }
+            for entry in entries
+        ]).on_conflict_do_nothing(
+            index_elements=[table.c.user_id, table.c.reason, table.c.source_id]
+        ).returning(table.c.user_id, table.c.points, table.c.experience)
+        return db.execute(stmt).all()
+
+    def _balance_values(self, points: Any, experience: Any) -> Dict[str, Any]:
+        # SET clause adding deltas to a user; the right-hand side sees the old
+        # row values, so level is computed from the new experience in SQL.
+        table = User.__table__
+        new_experience = func.coalesce(table.c.experience, 0) + experience
+        new_level = level_for(new_experience)
+        return {
+            "total_points": func.coalesce(table.c.total_points, 0) + points,
+            "experience": new_experience,
+            "level": case(
+                (new_level > func.coalesce(table.c.level, 1), new_level),
+                else_=func.coalesce(table.c.level, 1),
+            ),
+        }
+
+    def apply_many(self, db: Session, *, entries: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Append ledger entries and apply their deltas to user balances with
+        atomic UPDATEs, one executemany for all users. Does not commit.
+
+        Each entry has ``user_id``, ``reason`` and optionally ``points``,
+        ``experience``, ``source_type`` and ``source_id``. Entries whose
+        (user, reason, source) was already recorded are skipped. Returns
+        (user_id, points, experience) rows for the entries that were applied.
+        """
+        if not entries:
+            return []
+        applied = self._append(db, entries)
+
+        points = Counter()
+        experience = Counter()
+        for row in applied:
+            points[row.user_id] += row.points
+            experience[row.user_id] += row.experience
+        users = [user_id for user_id in points if points[user_id] or experience[user_id]]
+        if users:
+            table = User.__table__
+            db.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_user_id"))
+                .values(self._balance_values(
+                    bindparam("b_points", type_=Integer), bindparam("b_experience", type_=Integer)
+                )),
+                [
+                    {"b_user_id": user_id, "b_points": points[user_id], "b_experience": experience[user_id]}
+                    for user_id in users
+                ],
+            )
+        return applied
+
+    def apply(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        reason: str,
+        points: int = 0,
+        experience: int = 0,
+        source_type: Optional[str] = None,
+        source_id: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        """
+        Record one points/experience change for a user and commit.
+
+        Returns the user's new balance, or None if this source had already
+        paid out.
+        """
+        applied = self._append(db, [{
+            "user_id": user_id,
+            "reason": reason,
+            "points": points,
+            "experience": experience,
+            "source_type": source_type,
+            "source_id": source_id,
+        }])
+        if not applied:
+            return None
+
+        table = User.__table__
+        balance = db.execute(
+            update(table)
+            .where(table.c.id == user_id)
+            .values(self._balance_values(points, experience))
+            .returning(table.c.total_points, table.c.experience, table.c.level)
+        ).one()
+        db.commit()
+        leaderboard.add_points(user_id, points)
+        return {
+            "user_id": user_id,
+            "total_points": balance.total_points,
+            "experience": balance.experience,
+            "level": balance.level,
+        }
+
+    def _ledger_totals(self) -> Any:
+        return (
+            select(
+                PointsLedgerEntry.user_id.label("user_id"),
+                func.sum(PointsLedgerEntry.points).label("points"),
+                func.sum(PointsLedgerEntry.experience).label("experience"),
+            )
+            .group_by(PointsLedgerEntry.user_id)
+            .subquery()
+        )
+
+    def audit(self, db: Session, *, user_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find users whose stored balance differs from the sum of their ledger.
+        """
+        totals = self._ledger_totals()
+        ledger_points = func.coalesce(totals.c.points, 0)
+        ledger_experience = func.coalesce(totals.c.experience, 0)
+        query = (
+            db.query(
+                User.id.label("user_id"),
+                func.coalesce(User.total_points, 0).label("total_points"),
+                ledger_points.label("ledger_points"),
+                func.coalesce(User.experience, 0).label("experience"),
+                ledger_experience.label("ledger_experience"),
+            )
+            .outerjoin(totals, totals.c.user_id == User.id)
+            .filter(
+                or_(
+                    func.coalesce(User.total_points, 0) != ledger_points,
+                    func.coalesce(User.experience, 0) != ledger_experience,
+                )
+            )
+        )
+        if user_ids is not None:
+            query = query.filter(User.id.in_(user_ids))
+        return [dict(row._mapping) for row in query.all()]
+
+    def rebuild_balances(self, db: Session, *, user_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Reset mismatched users' points, experience and level to what their
+        ledger says, in one transaction. Returns the mismatches that were fixed.
+        """
+        mismatches = self.audit(db, user_ids=user_ids)
+        if not mismatches:
+            return []
+        table = User.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_user_id"))
+            .values(
+                total_points=bindparam("b_points"),
+                experience=bindparam("b_experience"),
+                level=bindparam("b_level"),
+            ),
+            [
+                {
+                    "b_user_id": row["user_id"],
+                    "b_points": row["ledger_points"],
+                    "b_experience": row["ledger_experience"],
+                    "b_level": level_for(row["ledger_experience"]),
+                }
+                for row in mismatches
+            ],
+        )
+        db.commit()
+        leaderboard.load(db)
+        return mismatches
+
+
+points_ledger = CRUDPointsLedger(PointsLedgerEntry)
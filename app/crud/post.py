@@ -34,6 +34,9 @@ class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
             .all()
         )
 
+    def get_latest(self, db: Session, *, limit: int = 10) -> List[Post]:
+        return db.query(Post).order_by(Post.date.desc()).limit(limit).all()
+
     def get_related_posts(
         self, db: Session, *, current_slug: str, category_id: str, limit: int = 2
     ) -> List[Post]:
@@ -1,22 +1,27 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Iterable
+from collections import Counter
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, case, update, exists
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, dialect_insert
 from app.models.prelaunch import (
     CoursePrelaunchCampaign, PrelaunchSubscriber, 
-    PrelaunchEmailSequence, PrelaunchEmail
+    PrelaunchEmailSequence, PrelaunchEmail, PrelaunchEmailDelivery
 )
 from app.schemas.prelaunch import (
     CoursePrelaunchCampaignCreate, CoursePrelaunchCampaignUpdate,
     PrelaunchSubscriberCreate, PrelaunchSubscriberUpdate,
     PrelaunchEmailSequenceCreate, PrelaunchEmailSequenceUpdate,
     PrelaunchEmailCreate, PrelaunchEmailUpdate,
+    PrelaunchEmailDeliveryCreate, PrelaunchEmailDeliveryUpdate,
     CampaignStatisticsUpdate
 )
+from app.utils.subscriber_import import chunked, prepare_chunk, extra_fields
+
+SUBSCRIBER_IMPORT_FIELDS = ("email", "name", "source", "referrer")
 
 
 class CRUDCoursePrelaunchCampaign(CRUDBase[CoursePrelaunchCampaign, CoursePrelaunchCampaignCreate, CoursePrelaunchCampaignUpdate]):
@@ -298,6 +303,84 @@ class CRUDPrelaunchSubscriber(CRUDBase[PrelaunchSubscriber, PrelaunchSubscriberC
         
         return db_obj
     
+    def bulk_import(
+        self,
+        db: Session,
+        *,
+        campaign_id: str,
+        rows: Iterable[Optional[Dict[str, Any]]],
+        source: Optional[str] = None,
+        user_id: Optional[str] = None,
+        chunk_size: int = 1000,
+    ) -> Dict[str, int]:
+        """
+        Import subscribers for a campaign from a stream of row dicts.
+
+        Each chunk is de-duplicated in memory and written with a single
+        INSERT ... ON CONFLICT (campaign_id, email). Unsubscribed rows are
+        reactivated, active ones are skipped. The campaign counters are bumped
+        once at the end and the whole import commits as one transaction.
+        """
+        table = PrelaunchSubscriber.__table__
+        stats = {"total": 0, "inserted": 0, "reactivated": 0, "skipped": 0, "invalid": 0}
+
+        for chunk in chunked(rows, chunk_size):
+            prepared = prepare_chunk(chunk)
+            stats["total"] += len(chunk)
+            stats["invalid"] += prepared["invalid"]
+            stats["skipped"] += prepared["duplicates"]
+            if not prepared["rows"]:
+                continue
+
+            values = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "email": email,
+                    "name": row.get("name") or None,
+                    "campaign_id": campaign_id,
+                    "is_active": True,
+                    "lead_magnet_sent": False,
+                    "user_id": user_id,
+                    "source": row.get("source") or source,
+                    "referrer": row.get("referrer") or None,
+                    "custom_fields": extra_fields(row, SUBSCRIBER_IMPORT_FIELDS),
+                }
+                for email, row in prepared["rows"]
+            ]
+            new_ids = {value["id"] for value in values}
+
+            stmt = dialect_insert(db, table).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.campaign_id, table.c.email],
+                set_={"is_active": True, "unsubscribed_at": None},
+                where=table.c.is_active == False,
+            ).returning(table.c.id)
+
+            # Freshly inserted rows come back with the id we generated,
+            # reactivated rows with their existing id, skipped rows not at all
+            returned = db.execute(stmt).scalars().all()
+            inserted = sum(1 for returned_id in returned if returned_id in new_ids)
+            stats["inserted"] += inserted
+            stats["reactivated"] += len(returned) - inserted
+            stats["skipped"] += len(values) - len(returned)
+
+        if stats["inserted"]:
+            signup_count = func.coalesce(CoursePrelaunchCampaign.signup_count, 0) + stats["inserted"]
+            db.execute(
+                update(CoursePrelaunchCampaign)
+                .where(CoursePrelaunchCampaign.id == campaign_id)
+                .values(
+                    signup_count=signup_count,
+                    conversion_rate=case(
+                        (CoursePrelaunchCampaign.view_count > 0,
+                         signup_count * 100 // CoursePrelaunchCampaign.view_count),
+                        else_=CoursePrelaunchCampaign.conversion_rate,
+                    ),
+                )
+            )
+        db.commit()
+        return stats
+
     def unsubscribe(self, db: Session, *, email: str, campaign_id: str) -> Optional[PrelaunchSubscriber]:
         subscriber = self.get_by_email_and_campaign(db, email=email, campaign_id=campaign_id)
         if subscriber:
@@ -406,7 +489,158 @@ class CRUDPrelaunchEmail(CRUDBase[PrelaunchEmail, PrelaunchEmailCreate, Prelaunc
         return email
 
 
+class CRUDPrelaunchEmailDelivery(CRUDBase[PrelaunchEmailDelivery, PrelaunchEmailDeliveryCreate, PrelaunchEmailDeliveryUpdate]):
+    def get_by_email(self, db: Session, *, email_id: str, skip: int = 0, limit: int = 100) -> List[PrelaunchEmailDelivery]:
+        return db.query(PrelaunchEmailDelivery).filter(
+            PrelaunchEmailDelivery.email_id == email_id
+        ).order_by(desc(PrelaunchEmailDelivery.created_at)).offset(skip).limit(limit).all()
+
+    def _due_condition(self, db: Session):
+        delay_days = func.coalesce(PrelaunchEmail.delay_days, 0)
+        if db.get_bind().dialect.name == "sqlite":
+            return func.julianday("now") - func.julianday(PrelaunchSubscriber.subscribed_at) >= delay_days
+        return PrelaunchSubscriber.subscribed_at + func.make_interval(0, 0, 0, delay_days) <= func.now()
+
+    def get_due(self, db: Session, *, limit: int = 500, max_attempts: int = 3) -> List[Dict[str, Any]]:
+        """
+        Find (subscriber, email) pairs that are due in a single query.
+
+        A pair is due when the subscriber, sequence and email are active, the
+        email's delay has elapsed since the subscription and there is no
+        delivery yet, or only a failed one with attempts left.
+        """
+        delivered = exists().where(
+            and_(
+                PrelaunchEmailDelivery.email_id == PrelaunchEmail.id,
+                PrelaunchEmailDelivery.subscriber_id == PrelaunchSubscriber.id,
+                or_(
+                    PrelaunchEmailDelivery.status != "failed",
+                    PrelaunchEmailDelivery.attempts >= max_attempts,
+                ),
+            )
+        )
+        rows = (
+            db.query(
+                PrelaunchSubscriber.id.label("subscriber_id"),
+                PrelaunchSubscriber.email.label("to"),
+                PrelaunchSubscriber.name.label("name"),
+                PrelaunchEmail.id.label("email_id"),
+                PrelaunchEmail.subject.label("subject"),
+                PrelaunchEmail.body.label("body"),
+            )
+            .join(PrelaunchEmailSequence, PrelaunchEmailSequence.campaign_id == PrelaunchSubscriber.campaign_id)
+            .join(PrelaunchEmail, PrelaunchEmail.sequence_id == PrelaunchEmailSequence.id)
+            .filter(
+                PrelaunchSubscriber.is_active == True,
+                PrelaunchEmailSequence.is_active == True,
+                PrelaunchEmail.is_active == True,
+                self._due_condition(db),
+                ~delivered,
+            )
+            .order_by(PrelaunchSubscriber.subscribed_at, PrelaunchEmail.delay_days)
+            .limit(limit)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def expire_stale_claims(self, db: Session, *, lease_seconds: int) -> int:
+        """
+        Mark deliveries still pending ``lease_seconds`` after being claimed
+        as failed, so they are retried like any failed send.
+
+        A claim is committed before anything is sent; if the dispatcher dies,
+        is cancelled or cannot record its results, nothing else would ever
+        move those deliveries on. Does not commit.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=lease_seconds)
+        result = db.execute(
+            update(self.model)
+            .where(self.model.status == "pending", self.model.claimed_at < cutoff)
+            .values(status="failed", error="Claim expired before a result was recorded")
+        )
+        return result.rowcount
+
+    def claim_due(
+        self, db: Session, *, limit: int = 500, max_attempts: int = 3, lease_seconds: int = 900
+    ) -> List[Dict[str, Any]]:
+        """
+        Find due pairs and claim them by inserting pending deliveries.
+
+        The INSERT ... ON CONFLICT only returns pairs this call claimed, so two
+        dispatchers running at once never send the same email twice. Failed
+        deliveries with attempts left, including expired claims, are moved
+        back to pending; each claim counts as an attempt.
+        """
+        self.expire_stale_claims(db, lease_seconds=lease_seconds)
+        due = self.get_due(db, limit=limit, max_attempts=max_attempts)
+        if not due:
+            db.commit()
+            return []
+
+        now = datetime.now(timezone.utc)
+        table = self.model.__table__
+        stmt = dialect_insert(db, table).values([
+            {
+                "id": str(uuid.uuid4()),
+                "email_id": row["email_id"],
+                "subscriber_id": row["subscriber_id"],
+                "status": "pending",
+                "attempts": 1,
+                "claimed_at": now,
+            }
+            for row in due
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.email_id, table.c.subscriber_id],
+            set_={"status": "pending", "attempts": table.c.attempts + 1, "error": None, "claimed_at": now},
+            where=and_(table.c.status == "failed", table.c.attempts < max_attempts),
+        ).returning(table.c.id, table.c.email_id, table.c.subscriber_id)
+        claimed = {
+            (row.email_id, row.subscriber_id): row.id
+            for row in db.execute(stmt)
+        }
+        db.commit()
+
+        deliveries = []
+        for row in due:
+            delivery_id = claimed.get((row["email_id"], row["subscriber_id"]))
+            if delivery_id:
+                deliveries.append({**row, "delivery_id": delivery_id})
+        return deliveries
+
+    def record_results(self, db: Session, *, results: List[Dict[str, Any]]) -> None:
+        """
+        Store send results and bump each email's sent_count once.
+
+        ``results`` holds dicts with ``delivery_id``, ``email_id``, ``status``
+        and ``error``.
+        """
+        if not results:
+            return
+
+        now = datetime.now(timezone.utc)
+        db.execute(
+            update(self.model),
+            [
+                {
+                    "id": result["delivery_id"],
+                    "status": result["status"],
+                    "error": result.get("error"),
+                    "sent_at": now if result["status"] == "sent" else None,
+                }
+                for result in results
+            ],
+        )
+
+        sent_per_email = Counter(
+            result["email_id"] for result in results if result["status"] == "sent"
+        )
+        prelaunch_email.increment_counters(db, column="sent_count", counts=sent_per_email)
+        db.commit()
+
+
 course_prelaunch_campaign = CRUDCoursePrelaunchCampaign(CoursePrelaunchCampaign)
 prelaunch_subscriber = CRUDPrelaunchSubscriber(PrelaunchSubscriber)
 prelaunch_email_sequence = CRUDPrelaunchEmailSequence(PrelaunchEmailSequence)
 prelaunch_email = CRUDPrelaunchEmail(PrelaunchEmail)
+prelaunch_email_delivery = CRUDPrelaunchEmailDelivery(PrelaunchEmailDelivery)
@@ -1,16 +1,27 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
+from collections import Counter, defaultdict
 import uuid
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, case, func, or_, text
 
-from app.crud.base import CRUDBase
-from app.models.quiz import Quiz, QuizQuestion, QuizAnswer, UserQuizAttempt
+from app.crud.base import CRUDBase, dialect_insert
+from app.models.quiz import Quiz, QuizQuestion, QuizAnswer, UserQuizAttempt, UserQuizBest, QuizStat, QuizStatBackfill
 from app.schemas.quiz import (
     QuizCreate, QuizUpdate,
     QuizQuestionCreate, QuizQuestionUpdate,
     QuizAnswerCreate, QuizAnswerUpdate,
-    UserQuizAttemptCreate, UserQuizAttemptUpdate
+    UserQuizAttemptCreate, UserQuizAttemptUpdate,
+    QuizStatCreate, QuizStatUpdate,
+    QuizBase, QuizDocument
 )
+from app.utils import quiz_analytics
+from app.utils.quiz_delivery import quiz_blob_cache
+from app.utils.quiz_grading import answer_key_cache
+
+# Fields compared when diffing a quiz document against stored rows
+QUESTION_FIELDS = ("question_text", "question_type", "points", "explanation", "order")
+ANSWER_FIELDS = ("answer_text", "is_correct", "explanation", "order")
 
 
 class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
@@ -25,14 +36,36 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         db.add(db_obj)
         db.flush()  # Flush to get the ID
         
-        # Create questions
+        # Create questions and answers with one executemany each
+        question_rows = []
+        answer_rows = []
         for question_data in questions_data:
-            self.create_question(db, quiz_id=db_obj.id, obj_in=question_data)
+            question_id = str(uuid.uuid4())
+            question_rows.append({
+                "id": question_id, "quiz_id": db_obj.id, **question_data.dict(exclude={"answers"})
+            })
+            answer_rows.extend(
+                {"id": str(uuid.uuid4()), "question_id": question_id, **answer_data.dict()}
+                for answer_data in question_data.answers or []
+            )
+        db.bulk_insert_mappings(QuizQuestion, question_rows)
+        db.bulk_insert_mappings(QuizAnswer, answer_rows)
         
         db.commit()
         db.refresh(db_obj)
         return db_obj
     
+    def bump_version(self, db: Session, *, quiz_id: str) -> None:
+        """
+        Mark a quiz as changed so its cached answer key and serialized
+        payload are rebuilt. Part of the caller's transaction.
+        """
+        db.query(Quiz).filter(Quiz.id == quiz_id).update(
+            {Quiz.version: func.coalesce(Quiz.version, 1) + 1}, synchronize_session=False
+        )
+        answer_key_cache.invalidate(quiz_id)
+        quiz_blob_cache.invalidate(quiz_id)
+
     def create_question(
         self, db: Session, *, quiz_id: str, obj_in: QuizQuestionCreate
     ) -> QuizQuestion:
@@ -48,6 +81,7 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         for answer_data in answers_data:
             self.create_answer(db, question_id=db_obj.id, obj_in=answer_data)
         
+        self.bump_version(db, quiz_id=quiz_id)
         return db_obj
     
     def create_answer(
@@ -73,7 +107,14 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
     def get_with_questions(
         self, db: Session, *, id: str
     ) -> Optional[Quiz]:
-        return db.query(Quiz).filter(Quiz.id == id).first()
+        # Questions and answers in two extra queries rather than one per question
+        return db.query(Quiz).options(
+            selectinload(Quiz.questions).selectinload(QuizQuestion.answers)
+        ).filter(Quiz.id == id).first()
+
+    def get_version(self, db: Session, *, id: str) -> Optional[int]:
+        version = db.query(Quiz.version).filter(Quiz.id == id).scalar()
+        return None if version is None else version or 1
     
     def update_question(
         self, db: Session, *, db_obj: QuizQuestion, obj_in: Union[QuizQuestionUpdate, Dict[str, Any]]
@@ -93,11 +134,19 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         
         # Update answers if provided
         if answers_data:
+            # Load every answer being updated in one query
+            answer_ids = [answer_data["id"] for answer_data in answers_data if "id" in answer_data]
+            db_answers = {
+                answer.id: answer
+                for answer in db.query(QuizAnswer).filter(
+                    QuizAnswer.question_id == db_obj.id, QuizAnswer.id.in_(answer_ids)
+                )
+            } if answer_ids else {}
             for answer_data in answers_data:
                 if "id" in answer_data:
                     # Update existing answer
                     answer_id = answer_data.pop("id")
-                    db_answer = db.query(QuizAnswer).filter(QuizAnswer.id == answer_id).first()
+                    db_answer = db_answers.get(answer_id)
                     if db_answer:
                         for field in answer_data:
                             if hasattr(db_answer, field):
@@ -107,6 +156,7 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
                     self.create_answer(db, question_id=db_obj.id, obj_in=QuizAnswerCreate(**answer_data))
         
         db.add(db_obj)
+        self.bump_version(db, quiz_id=db_obj.quiz_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -115,6 +165,7 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         self, db: Session, *, id: str
     ) -> QuizQuestion:
         obj = db.query(QuizQuestion).filter(QuizQuestion.id == id).first()
+        self.bump_version(db, quiz_id=obj.quiz_id)
         db.delete(obj)
         db.commit()
         return obj
@@ -123,10 +174,169 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         self, db: Session, *, id: str
     ) -> QuizAnswer:
         obj = db.query(QuizAnswer).filter(QuizAnswer.id == id).first()
+        self.bump_version(db, quiz_id=obj.question.quiz_id)
         db.delete(obj)
         db.commit()
         return obj
 
+    def _document_rows(self, db: Session, quiz_id: str) -> Any:
+        # Stored questions and answers keyed by client ID, falling back to the
+        # row ID for ones created through the single-question endpoints
+        questions = {
+            row.client_id or row.id: row
+            for row in db.query(
+                QuizQuestion.id, QuizQuestion.client_id, *(getattr(QuizQuestion, f) for f in QUESTION_FIELDS)
+            ).filter(QuizQuestion.quiz_id == quiz_id)
+        }
+        answers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for row in db.query(
+            QuizAnswer.id, QuizAnswer.question_id, QuizAnswer.client_id,
+            *(getattr(QuizAnswer, f) for f in ANSWER_FIELDS)
+        ).join(QuizQuestion, QuizQuestion.id == QuizAnswer.question_id).filter(QuizQuestion.quiz_id == quiz_id):
+            answers[row.question_id][row.client_id or row.id] = row
+        return questions, answers
+
+    def apply_document(self, db: Session, *, quiz: Quiz, document: QuizDocument) -> Dict[str, Any]:
+        """
+        Make a quiz match a full quiz document and commit.
+
+        Questions and answers are matched by ``client_id``; the difference is
+        applied with bulk inserts, executemany updates and set-based deletes.
+        Re-importing the same document changes nothing and keeps the quiz
+        version. Raises ValueError for duplicate client IDs.
+        """
+        question_keys = [question.client_id for question in document.questions]
+        if len(set(question_keys)) != len(question_keys):
+            raise ValueError("Question client_id values must be unique")
+        for question in document.questions:
+            answer_keys = [answer.client_id for answer in question.answers]
+            if len(set(answer_keys)) != len(answer_keys):
+                raise ValueError(f"Answer client_id values must be unique in question '{question.client_id}'")
+
+        stored_questions, stored_answers = self._document_rows(db, quiz.id)
+        now = datetime.now(timezone.utc)
+        question_inserts, question_updates, answer_inserts, answer_updates = [], [], [], []
+        answer_deletes: List[str] = []
+        kept_questions = set()
+
+        for position, question in enumerate(document.questions):
+            values = question.dict(include=set(QUESTION_FIELDS))
+            if values["order"] is None:
+                values["order"] = position
+            stored = stored_questions.get(question.client_id)
+            if stored is None:
+                question_id = str(uuid.uuid4())
+                question_inserts.append({"id": question_id, "quiz_id": quiz.id, "client_id": question.client_id, **values})
+                existing_answers = {}
+            else:
+                question_id = stored.id
+                kept_questions.add(question_id)
+                if stored.client_id != question.client_id or any(getattr(stored, f) != values[f] for f in QUESTION_FIELDS):
+                    question_updates.append({"id": question_id, "client_id": question.client_id, "updated_at": now, **values})
+                existing_answers = stored_answers.get(question_id, {})
+
+            kept_answers = set()
+            for answer_position, answer in enumerate(question.answers):
+                answer_values = answer.dict(include=set(ANSWER_FIELDS))
+                if answer_values["order"] is None:
+                    answer_values["order"] = answer_position
+                stored_answer = existing_answers.get(answer.client_id)
+                if stored_answer is None:
+                    answer_inserts.append({
+                        "id": str(uuid.uuid4()), "question_id": question_id, "client_id": answer.client_id, **answer_values
+                    })
+                    continue
+                kept_answers.add(stored_answer.id)
+                if stored_answer.client_id != answer.client_id or any(
+                    getattr(stored_answer, f) != answer_values[f] for f in ANSWER_FIELDS
+                ):
+                    answer_updates.append({
+                        "id": stored_answer.id, "client_id": answer.client_id, "updated_at": now, **answer_values
+                    })
+            answer_deletes.extend(row.id for row in existing_answers.values() if row.id not in kept_answers)
+
+        question_deletes = [row.id for row in stored_questions.values() if row.id not in kept_questions]
+
+        quiz_changed = False
+        for field, value in document.dict(exclude={"questions"}).items():
+            if getattr(quiz, field) != value:
+                setattr(quiz, field, value)
+                quiz_changed = True
+
+        if answer_deletes:
+            db.query(QuizAnswer).filter(QuizAnswer.id.in_(answer_deletes)).delete(synchronize_session=False)
+        answers_deleted = len(answer_deletes)
+        if question_deletes:
+            answers_deleted += db.query(QuizAnswer).filter(
+                QuizAnswer.question_id.in_(question_deletes)
+            ).delete(synchronize_session=False)
+            db.query(QuizQuestion).filter(QuizQuestion.id.in_(question_deletes)).delete(synchronize_session=False)
+        db.bulk_update_mappings(QuizQuestion, question_updates)
+        db.bulk_update_mappings(QuizAnswer, answer_updates)
+        db.bulk_insert_mappings(QuizQuestion, question_inserts)
+        db.bulk_insert_mappings(QuizAnswer, answer_inserts)
+
+        result = {
+            "questions_created": len(question_inserts),
+            "questions_updated": len(question_updates),
+            "questions_deleted": len(question_deletes),
+            "answers_created": len(answer_inserts),
+            "answers_updated": len(answer_updates),
+            "answers_deleted": answers_deleted,
+        }
+        if quiz_changed or any(result.values()):
+            self.bump_version(db, quiz_id=quiz.id)
+        db.commit()
+        db.refresh(quiz)
+        return {"quiz_id": quiz.id, "version": quiz.version, **result}
+
+    def import_document(self, db: Session, *, document: QuizDocument) -> Dict[str, Any]:
+        """
+        Create or update the quiz for the document's content from a quiz
+        document, in one transaction.
+        """
+        quiz = self.get_by_content(db, content_type=document.content_type, content_id=document.content_id)
+        if quiz is None:
+            quiz = Quiz(id=str(uuid.uuid4()), **document.dict(exclude={"questions"}))
+            db.add(quiz)
+            db.flush()
+        return self.apply_document(db, quiz=quiz, document=document)
+
+    def get_document(self, db: Session, *, quiz: Quiz) -> Dict[str, Any]:
+        """
+        A quiz (with questions and answers loaded) as a quiz document that
+        can be edited and re-imported.
+        """
+        return {
+            **{field: getattr(quiz, field) for field in QuizBase.model_fields},
+            "questions": [
+                {
+                    "client_id": question.client_id or question.id,
+                    **{field: getattr(question, field) for field in QUESTION_FIELDS},
+                    "answers": [
+                        {
+                            "client_id": answer.client_id or answer.id,
+                            **{field: getattr(answer, field) for field in ANSWER_FIELDS},
+                        }
+                        for answer in sorted(question.answers, key=lambda a: (a.order or 0, a.id))
+                    ],
+                }
+                for question in sorted(quiz.questions, key=lambda q: (q.order or 0, q.id))
+            ],
+        }
+
+    def update(
+        self, db: Session, *, db_obj: Quiz, obj_in: Union[QuizUpdate, Dict[str, Any]]
+    ) -> Quiz:
+        self.bump_version(db, quiz_id=db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> Quiz:
+        obj = super().remove(db, id=id)
+        answer_key_cache.invalidate(id)
+        quiz_blob_cache.invalidate(id)
+        return obj
+
 
 class CRUDUserQuizAttempt(CRUDBase[UserQuizAttempt, UserQuizAttemptCreate, UserQuizAttemptUpdate]):
     def create_with_user(
@@ -137,6 +347,68 @@ class CRUDUserQuizAttempt(CRUDBase[UserQuizAttempt, UserQuizAttemptCreate, UserQ
         # Generate UUID for the attempt
         db_obj = UserQuizAttempt(id=str(uuid.uuid4()), user_id=user_id, **obj_in_data)
         db.add(db_obj)
+        db.flush()
+        self._record_best(db, db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def _record_best(self, db: Session, attempt: UserQuizAttempt) -> None:
+        # Upsert the user's best attempt for the quiz; a new attempt replaces
+        # it only with a strictly higher score. Does not commit.
+        table = UserQuizBest.__table__
+        stmt = dialect_insert(db, table).values(
+            user_id=attempt.user_id,
+            quiz_id=attempt.quiz_id,
+            attempt_id=attempt.id,
+            score=attempt.score,
+            passed=bool(attempt.passed),
+            attempts=1,
+            updated_at=datetime.now(timezone.utc),
+        )
+        better = stmt.excluded.score > table.c.score
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.quiz_id],
+            set_={
+                "attempt_id": case((better, stmt.excluded.attempt_id), else_=table.c.attempt_id),
+                "score": case((better, stmt.excluded.score), else_=table.c.score),
+                "passed": or_(table.c.passed, stmt.excluded.passed),
+                "attempts": table.c.attempts + 1,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ))
+
+    def create_graded(
+        self, db: Session, *, quiz: Quiz, obj_in: UserQuizAttemptCreate, user_id: str
+    ) -> UserQuizAttempt:
+        """
+        Grade the submitted answers against the quiz's cached answer key and
+        store the attempt with the computed score; any score or pass flag sent
+        by the client is ignored.
+        """
+        answers = obj_in.answers or {}
+        key = answer_key_cache.get(db, quiz)
+        result = key.grade(answers, quiz.passing_score)
+
+        db_obj = UserQuizAttempt(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            quiz_id=quiz.id,
+            score=result["score"],
+            passed=result["passed"],
+            time_taken=obj_in.time_taken,
+            answers=answers,
+            completed_at=datetime.now(timezone.utc),
+        )
+        db.add(db_obj)
+        db.flush()
+        self._record_best(db, db_obj)
+        # Analytics rollups are updated in the same transaction as the attempt
+        quiz_stat.record(
+            db,
+            quiz_id=quiz.id,
+            counters=quiz_analytics.attempt_counters(key, answers, result, obj_in.time_taken),
+        )
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -164,13 +436,230 @@ class CRUDUserQuizAttempt(CRUDBase[UserQuizAttempt, UserQuizAttemptCreate, UserQ
     def get_best_by_user_and_quiz(
         self, db: Session, *, user_id: str, quiz_id: str
     ) -> Optional[UserQuizAttempt]:
-        return db.query(UserQuizAttempt).filter(
+        # Primary-key lookup in user_quiz_best, then the attempt by ID
+        return db.query(UserQuizAttempt).join(
+            UserQuizBest, UserQuizBest.attempt_id == UserQuizAttempt.id
+        ).filter(
             and_(
-                UserQuizAttempt.user_id == user_id,
-                UserQuizAttempt.quiz_id == quiz_id
+                UserQuizBest.user_id == user_id,
+                UserQuizBest.quiz_id == quiz_id
+            )
+        ).first()
+
+    def get_history(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        quiz_id: str,
+        limit: int = 20,
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> List[UserQuizAttempt]:
+        """
+        A user's attempts at a quiz, newest first, starting after the
+        (started_at, id) keyset ``before``.
+        """
+        query = db.query(UserQuizAttempt).filter(
+            UserQuizAttempt.user_id == user_id,
+            UserQuizAttempt.quiz_id == quiz_id,
+        )
+        if before is not None:
+            started_at, attempt_id = before
+            query = query.filter(
+                or_(
+                    UserQuizAttempt.started_at < started_at,
+                    and_(UserQuizAttempt.started_at == started_at, UserQuizAttempt.id < attempt_id),
+                )
             )
-        ).order_by(UserQuizAttempt.score.desc()).first()
+        return query.order_by(
+            UserQuizAttempt.started_at.desc(), UserQuizAttempt.id.desc()
+        ).limit(limit).all()
+
+
+class CRUDQuizStat(CRUDBase[QuizStat, QuizStatCreate, QuizStatUpdate]):
+    def _upsert(self, db: Session, rows: List[Dict[str, Any]], *, table: Any = QuizStat.__table__) -> None:
+        if not rows:
+            return
+        stmt = dialect_insert(db, table).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.quiz_id, table.c.metric, table.c.key],
+            set_={"count": table.c.count + stmt.excluded.count},
+        ))
+
+    def record(self, db: Session, *, quiz_id: str, counters: Counter) -> None:
+        """
+        Add (metric, key) -> count increments to a quiz's rollups in one
+        statement. Does not commit.
+        """
+        self._upsert(db, [
+            {"quiz_id": quiz_id, "metric": metric, "key": key, "count": count}
+            for (metric, key), count in counters.items()
+        ])
+
+    def get_counts(self, db: Session, *, quiz_id: str) -> Dict[str, Dict[str, int]]:
+        counts: Dict[str, Dict[str, int]] = defaultdict(dict)
+        rows = db.query(QuizStat.metric, QuizStat.key, QuizStat.count).filter(
+            QuizStat.quiz_id == quiz_id
+        ).all()
+        for metric, key, count in rows:
+            counts[metric][key] = count
+        return counts
+
+    def get_analytics(self, db: Session, *, quiz: Quiz) -> Dict[str, Any]:
+        """
+        Item difficulty, answer distribution, score histogram and time-taken
+        percentiles for a quiz whose questions and answers are loaded.
+        """
+        counts = self.get_counts(db, quiz_id=quiz.id)
+        attempts = counts[quiz_analytics.ATTEMPTS].get("", 0)
+        passed = counts[quiz_analytics.PASSED].get("", 0)
+        answered = counts[quiz_analytics.QUESTION_ANSWERED]
+        correct = counts[quiz_analytics.QUESTION_CORRECT]
+        selected = counts[quiz_analytics.ANSWER_SELECTED]
+        scores = counts[quiz_analytics.SCORE_BUCKET]
+
+        questions = []
+        for question in sorted(quiz.questions, key=lambda q: (q.order or 0, q.id)):
+            question_answered = answered.get(question.id, 0)
+            questions.append({
+                "question_id": question.id,
+                "question_text": question.question_text,
+                "answered": question_answered,
+                "correct": correct.get(question.id, 0),
+                "correct_rate": (
+                    round(correct.get(question.id, 0) / question_answered, 4) if question_answered else None
+                ),
+                "answers": [
+                    {
+                        "answer_id": answer.id,
+                        "answer_text": answer.answer_text,
+                        "is_correct": bool(answer.is_correct),
+                        "selected": selected.get(answer.id, 0),
+                        "selection_rate": (
+                            round(selected.get(answer.id, 0) / question_answered, 4) if question_answered else 0.0
+                        ),
+                    }
+                    for answer in sorted(question.answers, key=lambda a: (a.order or 0, a.id))
+                ],
+            })
+
+        return {
+            "quiz_id": quiz.id,
+            "attempts": attempts,
+            "passed": passed,
+            "pass_rate": round(passed / attempts, 4) if attempts else None,
+            "questions": questions,
+            "score_histogram": [
+                {
+                    "min_score": decile * 10,
+                    "max_score": 100 if decile == 9 else decile * 10 + 9,
+                    "count": scores.get(str(decile), 0),
+                }
+                for decile in range(10)
+            ],
+            "time_taken_percentiles": quiz_analytics.time_percentiles(counts[quiz_analytics.TIME_BUCKET]),
+        }
+
+    # Attempts started this long before the backfill's cutoff are assumed to
+    # be committed; later ones are caught up while the rollups are swapped
+    BACKFILL_SETTLE = timedelta(minutes=5)
+
+    def _replay(
+        self, db: Session, attempts: Any, *, batch_size: int, quizzes: Dict[str, Optional[Quiz]], commit: bool
+    ) -> int:
+        # Keyset-paginated replay of attempts into quiz_stat_backfills
+        replayed = 0
+        last_id = None
+        while True:
+            batch = attempts
+            if last_id is not None:
+                batch = batch.filter(UserQuizAttempt.id > last_id)
+            rows = batch.order_by(UserQuizAttempt.id).limit(batch_size).all()
+            if not rows:
+                return replayed
+            last_id = rows[-1].id
+
+            missing = {row.quiz_id for row in rows} - quizzes.keys()
+            if missing:
+                quizzes.update(dict.fromkeys(missing))
+                quizzes.update({q.id: q for q in db.query(Quiz).filter(Quiz.id.in_(missing))})
+
+            counters = Counter()
+            for row in rows:
+                quiz = quizzes[row.quiz_id]
+                if quiz is None:
+                    continue
+                answers = row.answers if isinstance(row.answers, dict) else {}
+                key = answer_key_cache.get(db, quiz)
+                result = {**key.grade(answers, quiz.passing_score), "score": row.score or 0, "passed": bool(row.passed)}
+                for (metric, stat_key), count in quiz_analytics.attempt_counters(
+                    key, answers, result, row.time_taken
+                ).items():
+                    counters[(row.quiz_id, metric, stat_key)] += count
+            self._upsert(db, [
+                {"quiz_id": attempt_quiz_id, "metric": metric, "key": stat_key, "count": count}
+                for (attempt_quiz_id, metric, stat_key), count in counters.items()
+            ], table=QuizStatBackfill.__table__)
+            replayed += len(rows)
+            if commit:
+                db.commit()
+
+    def backfill(self, db: Session, *, quiz_id: Optional[str] = None, batch_size: int = 1000) -> int:
+        """
+        Rebuild rollups from existing attempts. Stored scores are kept;
+        per-question correctness is graded against the current answer key.
+        Returns the number of attempts replayed.
+
+        Attempts are replayed into the quiz_stat_backfills staging table in
+        keyset-paginated batches, each in its own transaction, while readers
+        keep the old rollups. The staging rows are then swapped into
+        quiz_stats in one short transaction that also replays the attempts
+        submitted since the backfill started; on PostgreSQL it holds off live
+        writers (not readers) so nothing is counted twice or lost. A failed
+        run leaves quiz_stats untouched and is simply run again.
+        """
+        staging = db.query(QuizStatBackfill)
+        stats = db.query(QuizStat)
+        attempts = db.query(
+            UserQuizAttempt.id,
+            UserQuizAttempt.quiz_id,
+            UserQuizAttempt.score,
+            UserQuizAttempt.passed,
+            UserQuizAttempt.time_taken,
+            UserQuizAttempt.answers,
+        )
+        if quiz_id is not None:
+            staging = staging.filter(QuizStatBackfill.quiz_id == quiz_id)
+            stats = stats.filter(QuizStat.quiz_id == quiz_id)
+            attempts = attempts.filter(UserQuizAttempt.quiz_id == quiz_id)
+        cutoff = datetime.now(timezone.utc) - self.BACKFILL_SETTLE
+        staging.delete(synchronize_session=False)
+        db.commit()
+
+        quizzes: Dict[str, Optional[Quiz]] = {}
+        replayed = self._replay(
+            db, attempts.filter(UserQuizAttempt.started_at < cutoff),
+            batch_size=batch_size, quizzes=quizzes, commit=True,
+        )
+
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE quiz_stats IN EXCLUSIVE MODE"))
+        replayed += self._replay(
+            db, attempts.filter(or_(UserQuizAttempt.started_at >= cutoff, UserQuizAttempt.started_at.is_(None))),
+            batch_size=batch_size, quizzes=quizzes, commit=False,
+        )
+        stats.delete(synchronize_session=False)
+        db.execute(QuizStat.__table__.insert().from_select(
+            ["quiz_id", "metric", "key", "count"],
+            staging.with_entities(
+                QuizStatBackfill.quiz_id, QuizStatBackfill.metric, QuizStatBackfill.key, QuizStatBackfill.count
+            ).statement,
+        ))
+        staging.delete(synchronize_session=False)
+        db.commit()
+        return replayed
 
 
 quiz = CRUDQuiz(Quiz)
 user_quiz_attempt = CRUDUserQuizAttempt(UserQuizAttempt)
+quiz_stat = CRUDQuizStat(QuizStat)
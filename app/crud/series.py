@@ -1,14 +1,22 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
 from sqlalchemy.orm import Session
 
+from app.crud.aggregate import ContentAggregateLoader, bump_content_version
 from app.crud.base import CRUDBase
+from app.models.booklet import Booklet
 from app.models.series import Author, Series, SeriesArticle
 from app.schemas.series import (
     AuthorCreate, AuthorUpdate,
     SeriesCreate, SeriesUpdate,
-    SeriesArticleCreate, SeriesArticleUpdate
+    SeriesArticleCreate, SeriesArticleUpdate,
+    SeriesWithDetails
+)
+
+# Series with author and ordered articles: two queries on a cache miss
+series_details = ContentAggregateLoader(
+    Series, SeriesWithDetails, joined=("author_relation",), selected=("articles",)
 )
 
 
@@ -28,6 +36,14 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: Author, obj_in: Union[AuthorUpdate, Dict[str, Any]]
+    ) -> Author:
+        # Authors are embedded in series and booklet details
+        bump_content_version(db, Series, Series.author_id == db_obj.id)
+        bump_content_version(db, Booklet, Booklet.author_id == db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
 
 class CRUDSeries(CRUDBase[Series, SeriesCreate, SeriesUpdate]):
     def get_by_slug(self, db: Session, *, slug: str) -> Optional[Series]:
@@ -38,6 +54,18 @@ class CRUDSeries(CRUDBase[Series, SeriesCreate, SeriesUpdate]):
     ) -> List[Series]:
         return db.query(Series).offset(skip).limit(limit).all()
 
+    def get_details_by_slug(self, db: Session, *, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        JSON-ready ``SeriesWithDetails`` for a slug, articles in order.
+        """
+        return series_details.get_by_slug(db, slug=slug)
+
+    def update(
+        self, db: Session, *, db_obj: Series, obj_in: Union[SeriesUpdate, Dict[str, Any]]
+    ) -> Series:
+        bump_content_version(db, Series, Series.id == db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
     def get_related_series(
         self, db: Session, *, current_id: str, limit: int = 3
     ) -> List[Series]:
@@ -105,10 +133,22 @@ class CRUDSeriesArticle(CRUDBase[SeriesArticle, SeriesArticleCreate, SeriesArtic
             series_id=obj_in.series_id,
         )
         db.add(db_obj)
+        bump_content_version(db, Series, Series.id == obj_in.series_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self, db: Session, *, db_obj: SeriesArticle, obj_in: Union[SeriesArticleUpdate, Dict[str, Any]]
+    ) -> SeriesArticle:
+        bump_content_version(db, Series, Series.id == db_obj.series_id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: str) -> SeriesArticle:
+        series_id = db.query(SeriesArticle.series_id).filter(SeriesArticle.id == id).scalar()
+        bump_content_version(db, Series, Series.id == series_id)
+        return super().remove(db, id=id)
+
 
 author = CRUDAuthor(Author)
 series = CRUDSeries(Series)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import uuid
 
 from sqlalchemy.orm import Session
@@ -59,5 +59,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def is_superuser(self, user: User) -> bool:
         return user.is_superuser
 
+    def get_public_profiles(self, db: Session, *, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        Fetch username, level and experience for a set of users in one query,
+        keyed by user ID.
+        """
+        if not user_ids:
+            return {}
+        rows = db.query(User.id, User.username, User.level, User.experience).filter(
+            User.id.in_(user_ids)
+        ).all()
+        return {row.id: row for row in rows}
+
 
 user = CRUDUser(User)
@@ -1,41 +1,35 @@
-from fastapi import FastAPI, Depends
+import time
+
+# Cold-start timing starts before the heavy imports below
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import JSONResponse
 import logging
 import os
-import sys
-import datetime
+import asyncio
 from contextlib import asynccontextmanager
 
 from app.api.v1.api import api_router
 from app.api.debug import router as debug_router
+from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
 from app.core.config import settings
-from app.core.database import engine, Base, get_db
+from app.core.database import engine
+from app.core.instrumentation import MetricsMiddleware
+from app.core.query_profiler import QueryProfilerMiddleware
+from app.core.structured_logging import RequestIdMiddleware, configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# JSON logs through a background writer thread; levels and sampling come from settings
+configure_logging()
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup logic
-    logger.info("===== Starting up the application =====")
-    logger.info(f"Environment: {os.environ.get('ENVIRONMENT', 'development')}")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Current directory: {os.getcwd()}")
-
-    # Log configuration
-    logger.info(f"API Version: {settings.API_V1_STR}")
-    logger.info(f"Project Name: {settings.PROJECT_NAME}")
-
-    # Log environment variables (sanitized)
-    for key, value in os.environ.items():
-        if not any(sensitive in key.lower() for sensitive in ["secret", "password", "key", "token"]):
-            logger.info(f"ENV: {key}={value}")
+    # Startup logic; the environment and config are at /debug/environment and /debug/config
+    logger.info(f"Starting {settings.PROJECT_NAME} ({os.environ.get('ENVIRONMENT', 'development')})")
 
     # Check if database check is disabled
     if os.environ.get("DISABLE_DATABASE_CHECK_ON_STARTUP") == "true":
@@ -51,7 +45,6 @@ async def lifespan(app: FastAPI):
             logger.info(f"Attempting to connect to database: {safe_url}")
 
             # Try to connect with a timeout
-            import time
             start_time = time.time()
             with engine.connect() as conn:
                 from sqlalchemy import text
@@ -62,11 +55,37 @@ async def lifespan(app: FastAPI):
             logger.error(f"Database connection failed: {e}")
             logger.warning("Application will start, but database operations may fail")
 
-    logger.info("Application startup complete")
+    # Background tasks share one stop event, set on shutdown
+    background_stop = asyncio.Event()
+
+    # Start the drip-email dispatcher if enabled
+    dispatcher_task = None
+    if settings.DRIP_DISPATCHER_ENABLED:
+        from app.utils.drip_dispatcher import run_drip_dispatcher
+        dispatcher_task = asyncio.create_task(run_drip_dispatcher(background_stop))
+        logger.info(f"Drip dispatcher started (every {settings.DRIP_DISPATCH_INTERVAL_SECONDS}s)")
+
+    # Start the tracking event flusher
+    from app.utils.tracking_flusher import run_tracking_flusher
+    flusher_task = asyncio.create_task(run_tracking_flusher(background_stop))
+
+    # Load the leaderboard and keep it in sync with other workers
+    from app.utils.leaderboard import run_leaderboard_resync
+    leaderboard_task = asyncio.create_task(run_leaderboard_resync(background_stop))
+
+    logger.info(
+        f"Application startup complete in {time.perf_counter() - _import_started:.2f}s "
+        f"(imports {_import_finished - _import_started:.2f}s)"
+    )
     yield
 
     # Shutdown logic
     logger.info("===== Shutting down the application =====")
+    background_stop.set()
+    if dispatcher_task is not None:
+        await dispatcher_task
+    await flusher_task
+    await leaderboard_task
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -89,40 +108,30 @@ if settings.BACKEND_CORS_ORIGINS:
 # Add session middleware
 app.add_middleware(SessionMiddleware, secret_key=settings.SECRET_KEY)
 
+if settings.PROFILING_ENABLED:
+    from app.core.request_profiler import RequestProfilerMiddleware
+
+    app.add_middleware(RequestProfilerMiddleware)
+
+app.add_middleware(QueryProfilerMiddleware)
+if settings.METRICS_ENABLED:
+    # Wraps everything but the request id, so latency covers the rest of the stack;
+    # the query profiler inside it reuses its SQL counts
+    app.add_middleware(MetricsMiddleware)
+# Outermost of all, so every log line of a request carries its id
+app.add_middleware(RequestIdMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR if settings.API_V1_STR.startswith('/') else f"/{settings.API_V1_STR}")
 
-# Include debug router at root level
+# Probes, metrics and (superuser-only) diagnostics at root level
+app.include_router(health_router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 app.include_router(debug_router)
 
-# Health check router included directly
-
-# Add debug routes
-@app.get("/debug/environment")
-def debug_environment():
-    """Debug endpoint to show environment variables (sanitized)"""
-    env_vars = {}
-    for key, value in os.environ.items():
-        # Skip sensitive variables
-        if any(sensitive in key.lower() for sensitive in ["secret", "password", "key", "token"]):
-            env_vars[key] = "[REDACTED]"
-        else:
-            env_vars[key] = value
-    return {"environment": env_vars}
-
-@app.get("/debug/config")
-def debug_config():
-    """Debug endpoint to show application configuration"""
-    config_dict = {}
-    for key in dir(settings):
-        if not key.startswith("_") and not callable(getattr(settings, key)):
-            value = getattr(settings, key)
-            # Skip sensitive values
-            if any(sensitive in key.lower() for sensitive in ["secret", "password", "key", "token"]):
-                config_dict[key] = "[REDACTED]"
-            else:
-                config_dict[key] = str(value)
-    return {"config": config_dict}
+_import_finished = time.perf_counter()
+
 
 @app.get("/")
 def root():
@@ -134,89 +143,6 @@ def root():
         "health": "/health"
     })
 
-@app.get("/health")
-def health_check():
-    """Health check endpoint for the API."""
-    import platform
-    import sys
-    import os
-    import datetime
-    import traceback
-
-    # Collect system information
-    system_info = {
-        "python_version": sys.version,
-        "platform": platform.platform(),
-        "current_directory": os.getcwd(),
-        "timestamp": datetime.datetime.now().isoformat(),
-    }
-
-    # Collect environment variables (sanitized)
-    env_vars = {}
-    for key, value in os.environ.items():
-        if not any(sensitive in key.lower() for sensitive in ["secret", "password", "key", "token"]):
-            env_vars[key] = value
-
-    # Check if important files exist
-    file_checks = {
-        "main.py": os.path.exists("app/main.py"),
-        "api.py": os.path.exists("app/api/v1/api.py"),
-        "database.py": os.path.exists("app/core/database.py"),
-    }
-
-    # Try to import important modules
-    import_checks = {}
-    try:
-        import fastapi
-        import_checks["fastapi"] = "success"
-    except Exception as e:
-        import_checks["fastapi"] = f"error: {str(e)}"
-
-    try:
-        import sqlalchemy
-        import_checks["sqlalchemy"] = "success"
-    except Exception as e:
-        import_checks["sqlalchemy"] = f"error: {str(e)}"
-
-    try:
-        import starlette
-        import_checks["starlette"] = "success"
-    except Exception as e:
-        import_checks["starlette"] = f"error: {str(e)}"
-
-    # Try a simple database connection
-    db_status = "not_checked"
-    db_error = None
-
-    try:
-        # Only do a quick check to avoid blocking the health check
-        from app.core.database import engine
-        from sqlalchemy import text
-
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            db_status = "connected"
-    except Exception as e:
-        db_status = "error"
-        db_error = str(e)
-        db_traceback = traceback.format_exc()
-        logger.error(f"Health check database connection failed: {e}\n{db_traceback}")
-
-    # Always return 200 status code for health checks
-    # Railway uses this endpoint to determine if the application is healthy
-    return JSONResponse({
-        "status": "healthy",
-        "message": "CodeSnippets API is running",
-        "system": system_info,
-        "file_checks": file_checks,
-        "import_checks": import_checks,
-        "database": {
-            "status": db_status,
-            "error": db_error
-        },
-        "environment": env_vars
-    })
-
 if __name__ == "__main__":
     import uvicorn
     import os
@@ -14,11 +14,15 @@ from app.models.quiz import (
     QuizQuestion,
     QuizAnswer,
     UserQuizAttempt,
+    UserQuizBest,
+    QuizStat,
+    QuizStatBackfill,
 )
 from app.models.award import (
     Award,
     UserAward,
 )
+from app.models.points import PointsLedgerEntry
 from app.models.course import (
     CourseCategory,
     Course,
@@ -37,4 +41,5 @@ from app.models.prelaunch import (
     PrelaunchSubscriber,
     PrelaunchEmailSequence,
     PrelaunchEmail,
+    PrelaunchEmailDelivery,
 )
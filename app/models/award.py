@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey, DateTime, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func, text
 
@@ -26,6 +26,9 @@ class Award(Base):
 
 class UserAward(Base):
     __tablename__ = "user_awards"
+    __table_args__ = (
+        UniqueConstraint("user_id", "award_id", name="uq_user_awards_user_award"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -21,6 +21,8 @@ class Booklet(Base):
     tags = Column(JSON)  # Store as JSON array
     learning_outcomes = Column(JSON)  # Store as JSON array
     prerequisites = Column(JSON)  # Store as JSON array
+    # Bumped when the booklet, its author, chapters or updates change; keys the detail cache
+    version = Column(Integer, nullable=False, default=1, server_default=text('1'))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
@@ -28,8 +30,13 @@ class Booklet(Base):
 
     # Relationships
     author_relation = relationship("Author", back_populates="booklets")
-    chapters = relationship("BookletChapter", back_populates="booklet")
-    updates = relationship("BookletUpdate", back_populates="booklet")
+    chapters = relationship(
+        "BookletChapter", back_populates="booklet", order_by="[BookletChapter.created_at, BookletChapter.id]"
+    )
+    # Newest updates first
+    updates = relationship(
+        "BookletUpdate", back_populates="booklet", order_by="[BookletUpdate.created_at.desc(), BookletUpdate.id]"
+    )
 
 
 class BookletChapter(Base):
@@ -129,7 +129,7 @@ class TopicLesson(Base):
     # Relationships
     topic = relationship("CourseTopic", back_populates="lessons")
     quiz = relationship("Quiz",
-                      primaryjoin="and_(TopicLesson.id==Quiz.content_id, "
+                      primaryjoin="and_(TopicLesson.id==foreign(Quiz.content_id), "
                                  "Quiz.content_type=='lesson')",
                       backref="lesson",
                       uselist=False,
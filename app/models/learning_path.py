@@ -22,6 +22,9 @@ class LearningPath(Base):
     quiz_count = Column(Integer)
     learning_outcomes = Column(JSON)  # Store as JSON array
     prerequisites = Column(JSON)  # Store as JSON array
+    # Bumped when the path, its modules, their content items or its resources change;
+    # keys the detail cache
+    version = Column(Integer, nullable=False, default=1, server_default=text('1'))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
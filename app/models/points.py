@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import text
+
+from app.core.database import Base
+
+
+class PointsLedgerEntry(Base):
+    """
+    Append-only record of every points/experience change. User balances are
+    the sum of their entries and can be rebuilt from here.
+    """
+    __tablename__ = "points_ledger"
+    __table_args__ = (
+        # A source (quiz attempt, enrollment, award) pays out once per user and reason
+        UniqueConstraint("user_id", "reason", "source_id", name="uq_points_ledger_user_reason_source"),
+        Index("ix_points_ledger_user_created", "user_id", "created_at"),
+    )
+
+    id = Column(String, primary_key=True, index=True)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    points = Column(Integer, nullable=False, default=0)
+    experience = Column(Integer, nullable=False, default=0)
+    reason = Column(String, nullable=False)  # 'quiz_passed', 'course_completed', 'award', 'opening_balance'
+    source_type = Column(String, nullable=True)  # 'quiz_attempt', 'enrollment', 'user_award'
+    source_id = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=text('NOW()'), index=True)
+
+    # Relationships
+    user = relationship("User")
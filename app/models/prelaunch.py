@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, String, DateTime, Text, JSON, ForeignKey, Integer, Table
+from sqlalchemy import Boolean, Column, String, DateTime, Text, JSON, ForeignKey, Integer, Table, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func, text
 
@@ -88,6 +88,10 @@ class PrelaunchSubscriber(Base):
     Model for subscribers to prelaunch campaigns.
     """
     __tablename__ = "prelaunch_subscribers"
+    __table_args__ = (
+        # One subscription per email per campaign; bulk imports rely on this for ON CONFLICT
+        UniqueConstraint("campaign_id", "email", name="uq_prelaunch_subscribers_campaign_email"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     email = Column(String, nullable=False, index=True)
@@ -171,3 +175,33 @@ class PrelaunchEmail(Base):
 
     # Relationships
     sequence = relationship("PrelaunchEmailSequence", back_populates="emails")
+
+
+class PrelaunchEmailDelivery(Base):
+    """
+    Model recording the delivery of a sequence email to a subscriber.
+    The unique (email_id, subscriber_id) pair makes dispatching idempotent.
+    """
+    __tablename__ = "prelaunch_email_deliveries"
+    __table_args__ = (
+        UniqueConstraint("email_id", "subscriber_id", name="uq_prelaunch_email_deliveries_email_subscriber"),
+    )
+
+    id = Column(String, primary_key=True, index=True)
+    email_id = Column(String, ForeignKey("prelaunch_emails.id", ondelete="CASCADE"), nullable=False)
+    subscriber_id = Column(String, ForeignKey("prelaunch_subscribers.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Delivery state
+    status = Column(String, nullable=False, default="pending")  # 'pending', 'sent', 'failed'
+    attempts = Column(Integer, default=1)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
+    # When the current attempt was claimed; a pending claim older than the lease is retried
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    email = relationship("PrelaunchEmail")
+    subscriber = relationship("PrelaunchSubscriber")
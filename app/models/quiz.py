@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey, DateTime, JSON, Float
+from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey, DateTime, JSON, Float, Index, PrimaryKeyConstraint, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func, text
 
@@ -22,6 +22,9 @@ class Quiz(Base):
     randomize_questions = Column(Boolean, default=False)
     show_correct_answers = Column(Boolean, default=True)
 
+    # Bumped whenever the quiz, its questions or answers change; keys the grading and delivery caches
+    version = Column(Integer, nullable=False, default=1, server_default=text('1'))
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -33,9 +36,13 @@ class Quiz(Base):
 
 class QuizQuestion(Base):
     __tablename__ = "quiz_questions"
+    __table_args__ = (
+        UniqueConstraint("quiz_id", "client_id", name="uq_quiz_questions_quiz_client"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     quiz_id = Column(String, ForeignKey("quizzes.id"), nullable=False)
+    client_id = Column(String, nullable=True)  # Author's ID from bulk import, stable across re-imports
     question_text = Column(Text, nullable=False)
     question_type = Column(String, nullable=False)  # 'multiple_choice', 'true_false', 'short_answer'
     points = Column(Integer, default=1)
@@ -53,9 +60,13 @@ class QuizQuestion(Base):
 
 class QuizAnswer(Base):
     __tablename__ = "quiz_answers"
+    __table_args__ = (
+        UniqueConstraint("question_id", "client_id", name="uq_quiz_answers_question_client"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     question_id = Column(String, ForeignKey("quiz_questions.id"), nullable=False)
+    client_id = Column(String, nullable=True)  # Author's ID from bulk import, stable across re-imports
     answer_text = Column(Text, nullable=False)
     is_correct = Column(Boolean, default=False)
     explanation = Column(Text)  # Explanation for this specific answer
@@ -71,6 +82,11 @@ class QuizAnswer(Base):
 
 class UserQuizAttempt(Base):
     __tablename__ = "user_quiz_attempts"
+    __table_args__ = (
+        # Attempt history (newest first) and best-score lookups per user and quiz
+        Index("ix_user_quiz_attempts_user_quiz_started", "user_id", "quiz_id", "started_at"),
+        Index("ix_user_quiz_attempts_user_quiz_score", "user_id", "quiz_id", "score"),
+    )
 
     id = Column(String, primary_key=True, index=True)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
@@ -87,3 +103,57 @@ class UserQuizAttempt(Base):
     # Relationships
     user = relationship("User", back_populates="quiz_attempts")
     quiz = relationship("Quiz", back_populates="attempts")
+
+
+class UserQuizBest(Base):
+    """
+    Each user's best attempt per quiz, maintained as attempts are inserted.
+    ``passed`` is true once any attempt has passed.
+    """
+    __tablename__ = "user_quiz_best"
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "quiz_id", name="pk_user_quiz_best"),
+    )
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    quiz_id = Column(String, ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
+    attempt_id = Column(String, ForeignKey("user_quiz_attempts.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    passed = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
+
+
+class QuizStat(Base):
+    """
+    Rollup counters for quiz analytics, incremented as attempts are graded.
+
+    ``metric`` is one of 'attempts', 'passed' (key ''), 'question_answered',
+    'question_correct' (key: question ID), 'answer_selected' (key: answer ID),
+    'score_bucket' (key: decile) or 'time_bucket' (key: upper bound in seconds).
+    """
+    __tablename__ = "quiz_stats"
+    __table_args__ = (
+        PrimaryKeyConstraint("quiz_id", "metric", "key", name="pk_quiz_stats"),
+    )
+
+    quiz_id = Column(String, ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
+    metric = Column(String, nullable=False)
+    key = Column(String, nullable=False, default="")
+    count = Column(Integer, nullable=False, default=0)
+
+
+class QuizStatBackfill(Base):
+    """
+    Staging copy of ``quiz_stats`` that a backfill fills batch by batch and
+    then swaps in, so readers keep the old rollups until it is done.
+    """
+    __tablename__ = "quiz_stat_backfills"
+    __table_args__ = (
+        PrimaryKeyConstraint("quiz_id", "metric", "key", name="pk_quiz_stat_backfills"),
+    )
+
+    quiz_id = Column(String, ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False)
+    metric = Column(String, nullable=False)
+    key = Column(String, nullable=False, default="")
+    count = Column(Integer, nullable=False, default=0)
@@ -41,6 +41,8 @@ class Series(Base):
     tags = Column(JSON)  # Store as JSON array
     learning_outcomes = Column(JSON)  # Store as JSON array
     prerequisites = Column(JSON)  # Store as JSON array
+    # Bumped when the series, its author or its articles change; keys the detail cache
+    version = Column(Integer, nullable=False, default=1, server_default=text('1'))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=text('NOW()'))
@@ -48,7 +50,9 @@ class Series(Base):
 
     # Relationships
     author_relation = relationship("Author", back_populates="series")
-    articles = relationship("SeriesArticle", back_populates="series")
+    articles = relationship(
+        "SeriesArticle", back_populates="series", order_by="[SeriesArticle.created_at, SeriesArticle.id]"
+    )
 
 
 class SeriesArticle(Base):
@@ -18,7 +18,7 @@ class User(Base):
     is_superuser = Column(Boolean, default=False)
 
     # Gamification fields
-    total_points = Column(Integer, default=0)  # Total points earned
+    total_points = Column(Integer, default=0, index=True)  # Total points earned
     level = Column(Integer, default=1)  # User level
     experience = Column(Integer, default=0)  # Experience points
     streak = Column(Integer, default=0)  # Current streak (days)
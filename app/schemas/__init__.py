@@ -18,14 +18,17 @@ from app.schemas.learning_path import (
     LearningPathResource, LearningPathResourceCreate, LearningPathResourceUpdate
 )
 from app.schemas.quiz import (
-    Quiz, QuizCreate, QuizUpdate, QuizWithUserAttempt,
+    Quiz, QuizCreate, QuizUpdate, QuizWithUserAttempt, QuizSummary,
     QuizQuestion, QuizQuestionCreate, QuizQuestionUpdate,
     QuizAnswer, QuizAnswerCreate, QuizAnswerUpdate,
-    UserQuizAttempt, UserQuizAttemptCreate, UserQuizAttemptUpdate
+    UserQuizAttempt, UserQuizAttemptCreate, UserQuizAttemptUpdate, UserQuizAttemptPage,
+    QuizStat, QuizStatCreate, QuizStatUpdate,
+    QuizDocument, QuizDocumentQuestion, QuizDocumentAnswer, QuizDocumentResult,
+    QuizAnalytics, QuizQuestionStats, QuizAnswerStats, QuizScoreBucket
 )
 from app.schemas.award import (
     Award, AwardCreate, AwardUpdate, AwardWithDetails,
-    UserAward, UserAwardCreate, UserAwardUpdate, UserWithAwards
+    UserAward, UserAwardCreate, UserAwardUpdate, UserWithAwards, AwardEvaluationResult
 )
 from app.schemas.course import (
     CourseCategory, CourseCategoryCreate, CourseCategoryUpdate, CourseCategoryWithSubcategories,
@@ -38,12 +41,21 @@ from app.schemas.course import (
 )
 from app.schemas.marketing import (
     NewsletterSubscription, NewsletterSubscriptionCreate, NewsletterSubscriptionUpdate,
-    MarketingBanner, MarketingBannerCreate, MarketingBannerUpdate, BannerStatisticsUpdate
+    MarketingBanner, MarketingBannerCreate, MarketingBannerUpdate, BannerStatisticsUpdate,
+    SubscriberImportResult
 )
 from app.schemas.prelaunch import (
     CoursePrelaunchCampaign, CoursePrelaunchCampaignCreate, CoursePrelaunchCampaignUpdate, CoursePrelaunchCampaignWithRelations,
     PrelaunchSubscriber, PrelaunchSubscriberCreate, PrelaunchSubscriberUpdate,
     PrelaunchEmailSequence, PrelaunchEmailSequenceCreate, PrelaunchEmailSequenceUpdate, PrelaunchEmailSequenceWithEmails,
     PrelaunchEmail, PrelaunchEmailCreate, PrelaunchEmailUpdate,
+    PrelaunchEmailDelivery, PrelaunchEmailDeliveryCreate, PrelaunchEmailDeliveryUpdate, DripDispatchResult,
     CourseAssociation, BookletAssociation, SeriesAssociation, CampaignStatisticsUpdate
 )
+from app.schemas.catalogue import BatchGetRequest, BatchGetResult, BatchMissing
+from app.schemas.home import HomePage
+from app.schemas.leaderboard import LeaderboardEntry, LeaderboardRank
+from app.schemas.points import (
+    PointsLedgerEntry, PointsLedgerEntryCreate, PointsLedgerEntryUpdate,
+    PointsBalance, PointsBalanceMismatch, PointsRebuildResult
+)
@@ -77,3 +77,8 @@ class UserWithAwards(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Award rule evaluation
+class AwardEvaluationResult(BaseModel):
+    granted: int = 0
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 
 from app.schemas.series import Author
 
@@ -117,6 +117,8 @@ class Booklet(BookletInDBBase):
 
 
 class BookletWithDetails(Booklet):
-    author: Author
+    # Read from the model's author_relation
+    author: Author = Field(validation_alias=AliasChoices("author", "author_relation"))
     chapters: List[BookletChapter]
-    updates: List[BookletUpdate]
+    # ``BookletUpdate`` is shadowed by the booklet patch schema above
+    updates: List[BookletUpdateInDBBase]
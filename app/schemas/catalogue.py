@@ -0,0 +1,34 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.schemas.booklet import Booklet
+from app.schemas.course import Course
+from app.schemas.post import PostList
+from app.schemas.series import Series
+
+# Ids accepted per entity type in one batch request
+MAX_BATCH_IDS = 100
+
+
+class BatchGetRequest(BaseModel):
+    courses: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    posts: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    series: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+    booklets: List[str] = Field(default_factory=list, max_length=MAX_BATCH_IDS)
+
+
+class BatchMissing(BaseModel):
+    courses: List[str] = []
+    posts: List[str] = []
+    series: List[str] = []
+    booklets: List[str] = []
+
+
+class BatchGetResult(BaseModel):
+    # Each list follows the order of the requested ids
+    courses: List[Course] = []
+    posts: List[PostList] = []
+    series: List[Series] = []
+    booklets: List[Booklet] = []
+    missing: BatchMissing = BatchMissing()
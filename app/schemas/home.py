@@ -0,0 +1,20 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.category import CategoryWithPostCount
+from app.schemas.course import Course
+from app.schemas.learning_path import LearningPath
+from app.schemas.marketing import MarketingBanner
+from app.schemas.post import PostList
+
+
+class HomePage(BaseModel):
+    featured_courses: List[Course] = []
+    latest_courses: List[Course] = []
+    featured_learning_paths: List[LearningPath] = []
+    latest_posts: List[PostList] = []
+    categories: List[CategoryWithPostCount] = []
+    banners: List[MarketingBanner] = []
+    # Sections that timed out or failed and were served stale or empty
+    degraded: List[str] = []
@@ -0,0 +1,18 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: str
+    username: str
+    score: int
+    level: int = 1
+    experience: int = 0
+
+
+class LeaderboardRank(BaseModel):
+    period: str
+    rank: Optional[int] = None
+    score: int = 0
+    total_users: int = 0
@@ -1,6 +1,8 @@
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, computed_field
+
+from app.core.tracking import banner_click_url
 
 
 # Newsletter Subscription Schemas
@@ -75,6 +77,12 @@ class MarketingBanner(MarketingBannerBase):
     dismissals: int
     conversions: int
 
+    @computed_field
+    @property
+    def cta_tracking_link(self) -> Optional[str]:
+        # Signed click-tracking URL that redirects to cta_link
+        return banner_click_url(self.id, self.cta_link) if self.cta_link else None
+
     class Config:
         from_attributes = True
 
@@ -85,3 +93,12 @@ class BannerStatisticsUpdate(BaseModel):
     clicks: Optional[int] = 0
     dismissals: Optional[int] = 0
     conversions: Optional[int] = 0
+
+
+# Bulk Import Schema
+class SubscriberImportResult(BaseModel):
+    total: int = 0
+    inserted: int = 0
+    reactivated: int = 0
+    skipped: int = 0
+    invalid: int = 0
@@ -0,0 +1,51 @@
+from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel
+
+
+# Points Ledger Schemas
+class PointsLedgerEntryBase(BaseModel):
+    points: int = 0
+    experience: int = 0
+    reason: str
+    source_type: Optional[str] = None
+    source_id: Optional[str] = None
+
+
+class PointsLedgerEntryCreate(PointsLedgerEntryBase):
+    user_id: str
+
+
+class PointsLedgerEntryUpdate(BaseModel):
+    # Ledger entries are append-only; corrections are new entries
+    pass
+
+
+class PointsLedgerEntry(PointsLedgerEntryBase):
+    id: str
+    user_id: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class PointsBalance(BaseModel):
+    user_id: str
+    total_points: int = 0
+    experience: int = 0
+    level: int = 1
+
+
+class PointsBalanceMismatch(BaseModel):
+    user_id: str
+    total_points: int
+    ledger_points: int
+    experience: int
+    ledger_experience: int
+
+
+class PointsRebuildResult(BaseModel):
+    mismatched: int = 0
+    rebuilt: bool = False
+    mismatches: List[PointsBalanceMismatch] = []
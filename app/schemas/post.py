@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 
 # Table of Contents Item
@@ -62,6 +62,8 @@ class PostUpdate(PostBase):
 # Properties shared by models stored in DB
 class PostInDBBase(PostBase):
     id: str
+    # The model's ``category`` is the relationship; responses carry the id
+    category: Optional[str] = Field(default=None, validation_alias=AliasChoices("category_id", "category"))
     date: datetime
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -84,7 +86,8 @@ class PostList(BaseModel):
     cover_image: str
     date: datetime
     author: str
-    category: str
+    # The model's ``category`` is the relationship; cards carry the id
+    category: str = Field(validation_alias=AliasChoices("category_id", "category"))
     reading_time: int
 
     class Config:
@@ -167,6 +167,40 @@ class PrelaunchEmail(PrelaunchEmailBase):
         from_attributes = True
 
 
+# PrelaunchEmailDelivery Schemas
+class PrelaunchEmailDeliveryBase(BaseModel):
+    email_id: str
+    subscriber_id: str
+    status: str = "pending"  # 'pending', 'sent', 'failed'
+
+
+class PrelaunchEmailDeliveryCreate(PrelaunchEmailDeliveryBase):
+    pass
+
+
+class PrelaunchEmailDeliveryUpdate(BaseModel):
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class PrelaunchEmailDelivery(PrelaunchEmailDeliveryBase):
+    id: str
+    attempts: int
+    error: Optional[str] = None
+    created_at: datetime
+    claimed_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DripDispatchResult(BaseModel):
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+
+
 # Association Schemas
 class CourseAssociation(BaseModel):
     course_id: str
@@ -91,6 +91,7 @@ class QuizUpdate(QuizBase):
 
 class Quiz(QuizBase):
     id: str
+    version: int = 1
     created_at: datetime
     updated_at: Optional[datetime] = None
     questions: List[QuizQuestion] = []
@@ -99,6 +100,51 @@ class Quiz(QuizBase):
         from_attributes = True
 
 
+# A quiz without its questions; what learners get when listing quizzes
+class QuizSummary(QuizBase):
+    id: str
+    version: int = 1
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# Quiz Document Schemas (bulk authoring)
+class QuizDocumentAnswer(BaseModel):
+    client_id: str
+    answer_text: str
+    is_correct: bool = False
+    explanation: Optional[str] = None
+    order: Optional[int] = None  # Defaults to the position in the list
+
+
+class QuizDocumentQuestion(BaseModel):
+    client_id: str
+    question_text: str
+    question_type: str  # 'multiple_choice', 'true_false', 'short_answer'
+    points: int = 1
+    explanation: Optional[str] = None
+    order: Optional[int] = None  # Defaults to the position in the list
+    answers: List[QuizDocumentAnswer] = []
+
+
+class QuizDocument(QuizBase):
+    questions: List[QuizDocumentQuestion] = []
+
+
+class QuizDocumentResult(BaseModel):
+    quiz_id: str
+    version: int
+    questions_created: int = 0
+    questions_updated: int = 0
+    questions_deleted: int = 0
+    answers_created: int = 0
+    answers_updated: int = 0
+    answers_deleted: int = 0
+
+
 # User Quiz Attempt Schemas
 class UserQuizAttemptBase(BaseModel):
     quiz_id: str
@@ -109,7 +155,9 @@ class UserQuizAttemptBase(BaseModel):
 
 
 class UserQuizAttemptCreate(UserQuizAttemptBase):
-    pass
+    # Graded server-side; values sent by older clients are ignored
+    score: Optional[float] = None
+    passed: Optional[bool] = None
 
 
 class UserQuizAttemptUpdate(UserQuizAttemptBase):
@@ -131,9 +179,68 @@ class UserQuizAttempt(UserQuizAttemptBase):
         from_attributes = True
 
 
+class UserQuizAttemptPage(BaseModel):
+    items: List[UserQuizAttempt] = []
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
+
+
 # Quiz with User Attempt
 class QuizWithUserAttempt(Quiz):
     user_attempts: List[UserQuizAttempt] = []
 
     class Config:
         from_attributes = True
+
+
+# Quiz Analytics Schemas
+class QuizStatBase(BaseModel):
+    quiz_id: str
+    metric: str
+    key: str = ""
+    count: int = 0
+
+
+class QuizStatCreate(QuizStatBase):
+    pass
+
+
+class QuizStatUpdate(BaseModel):
+    count: Optional[int] = None
+
+
+class QuizStat(QuizStatBase):
+    class Config:
+        from_attributes = True
+
+
+class QuizAnswerStats(BaseModel):
+    answer_id: str
+    answer_text: str
+    is_correct: bool = False
+    selected: int = 0
+    selection_rate: float = 0.0
+
+
+class QuizQuestionStats(BaseModel):
+    question_id: str
+    question_text: str
+    answered: int = 0
+    correct: int = 0
+    correct_rate: Optional[float] = None  # None until someone answers
+    answers: List[QuizAnswerStats] = []
+
+
+class QuizScoreBucket(BaseModel):
+    min_score: int
+    max_score: int
+    count: int = 0
+
+
+class QuizAnalytics(BaseModel):
+    quiz_id: str
+    attempts: int = 0
+    passed: int = 0
+    pass_rate: Optional[float] = None
+    questions: List[QuizQuestionStats] = []
+    score_histogram: List[QuizScoreBucket] = []
+    time_taken_percentiles: Dict[str, Optional[int]] = {}  # seconds, bucket upper bounds
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 
 
 # Author schemas
@@ -110,5 +110,6 @@ class Series(SeriesInDBBase):
 
 
 class SeriesWithDetails(Series):
-    author: Author
+    # Read from the model's author_relation
+    author: Author = Field(validation_alias=AliasChoices("author", "author_relation"))
     articles: List[SeriesArticle]
@@ -0,0 +1,124 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.course import CourseEnrollment
+from app.models.quiz import UserQuizAttempt
+from app.models.user import User
+
+# Events that can change whether a user has earned an award
+QUIZ_PASSED = "quiz_passed"
+COURSE_COMPLETED = "course_completed"
+POINTS_CHANGED = "points_changed"
+
+
+def _completed_courses() -> Any:
+    return (
+        select(func.count(CourseEnrollment.id))
+        .where(CourseEnrollment.user_id == User.id, CourseEnrollment.is_completed == True)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+
+def _passed_quizzes() -> Any:
+    return (
+        select(func.count(func.distinct(UserQuizAttempt.quiz_id)))
+        .where(UserQuizAttempt.user_id == User.id, UserQuizAttempt.passed == True)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+
+def _completed_each(course_ids: List[str]) -> ColumnElement:
+    completed = (
+        select(func.count(func.distinct(CourseEnrollment.course_id)))
+        .where(
+            CourseEnrollment.user_id == User.id,
+            CourseEnrollment.is_completed == True,
+            CourseEnrollment.course_id.in_(course_ids),
+        )
+        .correlate(User)
+        .scalar_subquery()
+    )
+    return completed >= len(set(course_ids))
+
+
+def _passed_each(quiz_ids: List[str]) -> ColumnElement:
+    passed = (
+        select(func.count(func.distinct(UserQuizAttempt.quiz_id)))
+        .where(
+            UserQuizAttempt.user_id == User.id,
+            UserQuizAttempt.passed == True,
+            UserQuizAttempt.quiz_id.in_(quiz_ids),
+        )
+        .correlate(User)
+        .scalar_subquery()
+    )
+    return passed >= len(set(quiz_ids))
+
+
+def _min(expression: Callable[[], Any]) -> Callable[[Any], ColumnElement]:
+    def predicate(value: Any) -> ColumnElement:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError("must be a non-negative integer")
+        return func.coalesce(expression(), 0) >= value
+    return predicate
+
+
+def _min_streak(value: Any) -> ColumnElement:
+    # Either the current streak or the best one so far counts
+    return or_(_min(lambda: User.streak)(value), _min(lambda: User.longest_streak)(value))
+
+
+def _ids(build: Callable[[List[str]], ColumnElement]) -> Callable[[Any], ColumnElement]:
+    def predicate(value: Any) -> ColumnElement:
+        if not isinstance(value, list) or not value or not all(isinstance(v, str) for v in value):
+            raise ValueError("must be a non-empty list of IDs")
+        return build(value)
+    return predicate
+
+
+# Requirement key -> (predicate builder, events that can satisfy it)
+RULES: Dict[str, Any] = {
+    "min_level": (_min(lambda: User.level), (QUIZ_PASSED, COURSE_COMPLETED)),
+    "min_points": (_min(lambda: User.total_points), (QUIZ_PASSED, COURSE_COMPLETED, POINTS_CHANGED)),
+    "min_streak": (_min_streak, (QUIZ_PASSED, COURSE_COMPLETED)),
+    "min_completed_courses": (_min(_completed_courses), (COURSE_COMPLETED,)),
+    "min_passed_quizzes": (_min(_passed_quizzes), (QUIZ_PASSED,)),
+    "course_ids": (_ids(_completed_each), (COURSE_COMPLETED,)),
+    "quiz_ids": (_ids(_passed_each), (QUIZ_PASSED,)),
+}
+
+
+def compile_requirements(requirements: Optional[Dict[str, Any]]) -> Optional[ColumnElement]:
+    """
+    Compile an award's requirements into one SQL predicate over ``users``.
+
+    All requirements must hold. Returns None for awards without requirements,
+    which are only granted manually. Raises ValueError for unknown keys or
+    bad values.
+    """
+    if not requirements:
+        return None
+    predicates = []
+    for key, value in requirements.items():
+        if key not in RULES:
+            raise ValueError(f"Unknown award requirement '{key}'")
+        build, _ = RULES[key]
+        try:
+            predicates.append(build(value))
+        except ValueError as e:
+            raise ValueError(f"Award requirement '{key}' {e}")
+    return and_(*predicates)
+
+
+def triggered_by(requirements: Optional[Dict[str, Any]], event: str) -> bool:
+    """
+    Whether ``event`` can change the outcome of these requirements.
+    """
+    return any(
+        key in RULES and event in RULES[key][1]
+        for key in (requirements or {})
+    )
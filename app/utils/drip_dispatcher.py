@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from string import Template
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.email import EmailTransport, build_message, get_email_transport
+from app.core.tracking import add_email_tracking
+
+logger = logging.getLogger(__name__)
+
+
+def render_delivery(delivery: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Fill in $name and $email placeholders in a sequence email.
+
+    Uses string.Template so braces in HTML/CSS bodies are left alone.
+    """
+    context = {
+        "name": delivery.get("name") or "",
+        "email": delivery["to"],
+    }
+    return {
+        "subject": Template(delivery["subject"]).safe_substitute(context),
+        "body": Template(delivery["body"]).safe_substitute(context),
+    }
+
+
+async def send_deliveries(
+    transport: EmailTransport, deliveries: List[Dict[str, Any]], *, concurrency: int
+) -> List[Dict[str, Any]]:
+    """
+    Send claimed deliveries with at most ``concurrency`` sends in flight.
+
+    Transports are blocking, so each worker hands its send to a thread.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for delivery in deliveries:
+        queue.put_nowait(delivery)
+    results: List[Dict[str, Any]] = []
+
+    async def worker() -> None:
+        while True:
+            try:
+                delivery = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = {
+                "delivery_id": delivery["delivery_id"],
+                "email_id": delivery["email_id"],
+                "status": "sent",
+                "error": None,
+            }
+            try:
+                rendered = render_delivery(delivery)
+                message = build_message(
+                    to=delivery["to"],
+                    subject=rendered["subject"],
+                    html_body=add_email_tracking(
+                        rendered["body"],
+                        email_id=delivery["email_id"],
+                        delivery_id=delivery["delivery_id"],
+                    ),
+                    headers={"X-Delivery-ID": str(delivery["delivery_id"])},
+                )
+                await asyncio.to_thread(transport.send, message)
+            except Exception as e:
+                logger.warning(f"Failed to send delivery {delivery['delivery_id']}: {e}")
+                result["status"] = "failed"
+                result["error"] = str(e)[:1000]
+            results.append(result)
+
+    workers = min(max(concurrency, 1), len(deliveries))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return results
+
+
+async def dispatch_due_emails(
+    db: Session,
+    transport: Optional[EmailTransport] = None,
+    *,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Run one dispatcher tick: claim due deliveries, send them and record the results.
+    """
+    transport = transport or get_email_transport()
+    batch_size = batch_size or settings.DRIP_DISPATCH_BATCH_SIZE
+    concurrency = concurrency or settings.DRIP_DISPATCH_CONCURRENCY
+    max_attempts = max_attempts or settings.DRIP_MAX_ATTEMPTS
+
+    deliveries = await asyncio.to_thread(
+        crud.prelaunch_email_delivery.claim_due,
+        db,
+        limit=batch_size,
+        max_attempts=max_attempts,
+        lease_seconds=settings.DRIP_CLAIM_LEASE_SECONDS,
+    )
+    if not deliveries:
+        return {"claimed": 0, "sent": 0, "failed": 0}
+
+    results = await send_deliveries(transport, deliveries, concurrency=concurrency)
+    await asyncio.to_thread(crud.prelaunch_email_delivery.record_results, db, results=results)
+
+    sent = sum(1 for result in results if result["status"] == "sent")
+    stats = {"claimed": len(deliveries), "sent": sent, "failed": len(results) - sent}
+    logger.info(f"Drip dispatch: {stats}")
+    return stats
+
+
+async def run_drip_dispatcher(stop_event: asyncio.Event) -> None:
+    """
+    Dispatch due emails every DRIP_DISPATCH_INTERVAL_SECONDS until stopped.
+
+    A full batch means there is a backlog, so the next tick starts right away.
+    """
+    transport = get_email_transport()
+    while not stop_event.is_set():
+        stats = {"claimed": 0}
+        db = SessionLocal()
+        try:
+            stats = await dispatch_due_emails(db, transport)
+        except Exception as e:
+            logger.error(f"Drip dispatcher tick failed: {e}")
+        finally:
+            db.close()
+
+        if stats["claimed"] >= settings.DRIP_DISPATCH_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.DRIP_DISPATCH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
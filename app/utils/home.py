@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HomeSection:
+    """
+    One block of the homepage: ``load(db, logged_in)`` returns rows that are
+    serialized with ``schema`` and cached for ``ttl`` seconds.
+    """
+
+    name: str
+    ttl: float
+    load: Callable[[Session, bool], Sequence[Any]]
+    schema: Type[BaseModel]
+    # Cache separately for anonymous and logged-in visitors
+    per_audience: bool = False
+
+
+HOME_SECTIONS = (
+    HomeSection(
+        "featured_courses", 300, lambda db, _: crud.course.get_featured(db, limit=6), schemas.Course
+    ),
+    HomeSection(
+        "latest_courses", 120, lambda db, _: crud.course.get_latest(db, limit=6), schemas.Course
+    ),
+    HomeSection(
+        "featured_learning_paths",
+        300,
+        lambda db, _: crud.learning_path.get_featured(db, limit=3),
+        schemas.LearningPath,
+    ),
+    HomeSection("latest_posts", 120, lambda db, _: crud.post.get_latest(db, limit=6), schemas.PostList),
+    HomeSection(
+        "categories", 600, lambda db, _: crud.category.get_multi_with_post_count(db), schemas.CategoryWithPostCount
+    ),
+    HomeSection(
+        "banners",
+        60,
+        lambda db, logged_in: crud.marketing_banner.get_banners_for_page(db, page="home", is_logged_in=logged_in),
+        schemas.MarketingBanner,
+        per_audience=True,
+    ),
+)
+
+
+class HomeAggregator:
+    """
+    Builds the homepage payload from its sections concurrently.
+
+    Each section is loaded in a worker thread with its own session. A
+    section that misses its timeout (or fails) is served from the last good
+    copy, or empty if there is none, and listed under ``degraded``; its load
+    keeps running and refreshes the cache for the next request. Concurrent
+    misses for the same section share one load.
+    """
+
+    def __init__(self, sections: Sequence[HomeSection]):
+        self.sections = sections
+        self._fresh = TTLCache(maxsize=len(sections) * 2)
+        self._last_good: Dict[Hashable, List[Dict[str, Any]]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    @staticmethod
+    def _key(section: HomeSection, logged_in: bool) -> Tuple[str, bool]:
+        return section.name, logged_in and section.per_audience
+
+    def _load(self, section: HomeSection, logged_in: bool) -> List[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            rows = section.load(db, logged_in)
+            data = [section.schema.model_validate(row).model_dump(mode="json") for row in rows]
+        finally:
+            db.close()
+        key = self._key(section, logged_in)
+        self._fresh.set(key, data, ttl=section.ttl)
+        self._last_good[key] = data
+        return data
+
+    def _finished(self, key: Hashable, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Home section {key[0]} failed: {future.exception()}")
+
+    async def _section(
+        self, section: HomeSection, logged_in: bool, timeout: float
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        key = self._key(section, logged_in)
+        cached = self._fresh.get(key)
+        if cached is not None:
+            return cached, False
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(self._load, section, logged_in))
+            future.add_done_callback(lambda done: self._finished(key, done))
+            self._inflight[key] = future
+        try:
+            # Shielded so a timeout leaves the shared load running
+            return await asyncio.wait_for(asyncio.shield(future), timeout), False
+        except asyncio.TimeoutError:
+            logger.warning(f"Home section {section.name} exceeded {timeout}s; serving last good copy")
+        except Exception:
+            pass  # logged by _finished
+        return self._last_good.get(key, []), True
+
+    async def build(self, *, logged_in: bool, timeout: Optional[float] = None) -> Dict[str, Any]:
+        if timeout is None:
+            timeout = settings.HOME_SECTION_TIMEOUT_SECONDS
+        results = await asyncio.gather(
+            *(self._section(section, logged_in, timeout) for section in self.sections)
+        )
+        payload: Dict[str, Any] = {}
+        degraded = []
+        for section, (data, is_degraded) in zip(self.sections, results):
+            payload[section.name] = data
+            if is_degraded:
+                degraded.append(section.name)
+        payload["degraded"] = degraded
+        return payload
+
+
+def encode_payload(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    Compact JSON body and its strong ETag.
+    """
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header covers ``etag`` (weak comparison).
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+home_aggregator = HomeAggregator(HOME_SECTIONS)
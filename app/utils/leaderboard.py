@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.points import PointsLedgerEntry
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+ALL_TIME = "all_time"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+PERIODS = (ALL_TIME, WEEKLY, MONTHLY)
+
+
+def period_key(period: str, at: Optional[datetime] = None) -> str:
+    """
+    Bucket name for a point in time, e.g. "2026-W42" or "2026-10".
+    """
+    at = at or datetime.now(timezone.utc)
+    if period == WEEKLY:
+        year, week, _ = at.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == MONTHLY:
+        return f"{at.year}-{at.month:02d}"
+    return ALL_TIME
+
+
+def period_start(period: str, at: Optional[datetime] = None) -> datetime:
+    """
+    Start (UTC midnight) of the weekly or monthly bucket containing ``at``.
+    """
+    at = at or datetime.now(timezone.utc)
+    day = at.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == WEEKLY:
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+class RankIndex:
+    """
+    Scores kept in a sorted list of (-score, user_id) keys.
+
+    Rank lookups, updates and slices around a user are O(log n). Ties are
+    broken by user ID so ranks are stable.
+    """
+
+    def __init__(self):
+        self._keys = SortedList()
+        self._scores: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def set(self, user_id: str, score: int) -> None:
+        old = self._scores.get(user_id)
+        if old is not None:
+            self._keys.remove((-old, user_id))
+        self._scores[user_id] = score
+        self._keys.add((-score, user_id))
+
+    def add(self, user_id: str, delta: int) -> None:
+        self.set(user_id, self._scores.get(user_id, 0) + delta)
+
+    def remove(self, user_id: str) -> None:
+        old = self._scores.pop(user_id, None)
+        if old is not None:
+            self._keys.remove((-old, user_id))
+
+    def score(self, user_id: str) -> Optional[int]:
+        return self._scores.get(user_id)
+
+    def rank(self, user_id: str) -> Optional[int]:
+        """
+        1-based rank of a user, or None if they aren't on the board.
+        """
+        score = self._scores.get(user_id)
+        if score is None:
+            return None
+        return self._keys.index((-score, user_id)) + 1
+
+    def slice(self, start: int, stop: int) -> List[Tuple[int, str, int]]:
+        """
+        (rank, user_id, score) for ranks in [start + 1, stop].
+        """
+        start = max(start, 0)
+        return [
+            (start + offset + 1, user_id, -negative_score)
+            for offset, (negative_score, user_id) in enumerate(self._keys[start:stop])
+        ]
+
+    def around(self, user_id: str, radius: int) -> List[Tuple[int, str, int]]:
+        rank = self.rank(user_id)
+        if rank is None:
+            return []
+        return self.slice(rank - 1 - radius, rank + radius)
+
+
+class LeaderboardService:
+    """
+    In-memory global, weekly and monthly leaderboards.
+
+    Boards are loaded from ``users.total_points`` and the points ledger and
+    kept current by ``add_points`` whenever points are awarded; the periodic
+    ``load`` re-sync picks up changes made by other workers. Weekly and monthly
+    boards only keep the current bucket.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._boards: Dict[str, RankIndex] = {}
+        self._period_keys: Dict[str, str] = {}
+        self.loaded_at: Optional[datetime] = None
+
+    def load(self, db: Session) -> None:
+        """
+        Rebuild the all-time board from the users table and the weekly and
+        monthly boards from the points ledger.
+        """
+        now = datetime.now(timezone.utc)
+        boards = {ALL_TIME: RankIndex()}
+        rows = db.query(User.id, User.total_points).filter(User.is_active == True).all()
+        for user_id, points in rows:
+            boards[ALL_TIME].set(user_id, points or 0)
+
+        for period in (WEEKLY, MONTHLY):
+            boards[period] = RankIndex()
+            rows = (
+                db.query(PointsLedgerEntry.user_id, func.sum(PointsLedgerEntry.points))
+                .join(User, User.id == PointsLedgerEntry.user_id)
+                .filter(
+                    User.is_active == True,
+                    PointsLedgerEntry.reason != "opening_balance",
+                    PointsLedgerEntry.created_at >= period_start(period, now),
+                )
+                .group_by(PointsLedgerEntry.user_id)
+                .all()
+            )
+            for user_id, points in rows:
+                if points:
+                    boards[period].set(user_id, points)
+
+        with self._lock:
+            self._boards = boards
+            self._period_keys = {period: period_key(period, now) for period in (WEEKLY, MONTHLY)}
+            self.loaded_at = now
+        logger.info(f"Leaderboard loaded with {len(boards[ALL_TIME])} users")
+
+    def ensure_loaded(self, db: Session) -> None:
+        if self.loaded_at is None:
+            self.load(db)
+
+    def _board(self, period: str, at: Optional[datetime] = None) -> RankIndex:
+        # Caller holds the lock. Rolls weekly/monthly boards over to a new bucket.
+        if period == ALL_TIME:
+            return self._boards.setdefault(ALL_TIME, RankIndex())
+        key = period_key(period, at)
+        if self._period_keys.get(period) != key:
+            self._boards[period] = RankIndex()
+            self._period_keys[period] = key
+        return self._boards[period]
+
+    def add_points(self, user_id: str, delta: int, at: Optional[datetime] = None) -> None:
+        """
+        Record points a user just earned on every board.
+        """
+        if not delta:
+            return
+        with self._lock:
+            for period in PERIODS:
+                self._board(period, at).add(user_id, delta)
+
+    def remove_user(self, user_id: str) -> None:
+        with self._lock:
+            for board in self._boards.values():
+                board.remove(user_id)
+
+    def top(self, period: str, *, skip: int = 0, limit: int = 10) -> List[Tuple[int, str, int]]:
+        with self._lock:
+            return self._board(period).slice(skip, skip + limit)
+
+    def around(self, period: str, user_id: str, *, radius: int = 5) -> List[Tuple[int, str, int]]:
+        with self._lock:
+            return self._board(period).around(user_id, radius)
+
+    def rank(self, period: str, user_id: str) -> Tuple[Optional[int], int, int]:
+        """
+        (rank, score, board size) for a user.
+        """
+        with self._lock:
+            board = self._board(period)
+            return board.rank(user_id), board.score(user_id) or 0, len(board)
+
+
+leaderboard = LeaderboardService()
+
+
+async def run_leaderboard_resync(stop_event: asyncio.Event) -> None:
+    """
+    Reload the all-time board every LEADERBOARD_RESYNC_SECONDS until stopped.
+    """
+    while not stop_event.is_set():
+        db = SessionLocal()
+        try:
+            await asyncio.to_thread(leaderboard.load, db)
+        except Exception as e:
+            logger.error(f"Leaderboard resync failed: {e}")
+        finally:
+            db.close()
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.LEADERBOARD_RESYNC_SECONDS)
+        except asyncio.TimeoutError:
+            pass
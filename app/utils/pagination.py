@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Opaque keyset cursor for the sort key of the last row on a page.
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Values from ``encode_cursor``; raises ValueError for malformed cursors.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def decode_datetime(value: Any) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,82 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.quiz_grading import AnswerKey
+
+ATTEMPTS = "attempts"
+PASSED = "passed"
+QUESTION_ANSWERED = "question_answered"
+QUESTION_CORRECT = "question_correct"
+ANSWER_SELECTED = "answer_selected"
+SCORE_BUCKET = "score_bucket"
+TIME_BUCKET = "time_bucket"
+
+# Upper bounds (seconds) of the time-taken histogram; slower attempts go in "inf"
+TIME_BUCKETS = (10, 20, 30, 45, 60, 90, 120, 180, 240, 300, 420, 600, 900, 1200, 1800, 2700, 3600)
+OVERFLOW_BUCKET = "inf"
+
+
+def score_bucket(score: float) -> str:
+    """
+    Decile of a percentage score: "0" for [0, 10) ... "9" for [90, 100].
+    """
+    return str(min(max(int(score // 10), 0), 9))
+
+
+def time_bucket(seconds: int) -> str:
+    for bound in TIME_BUCKETS:
+        if seconds <= bound:
+            return str(bound)
+    return OVERFLOW_BUCKET
+
+
+def attempt_counters(
+    key: AnswerKey,
+    answers: Dict[str, Any],
+    result: Dict[str, Any],
+    time_taken: Optional[int] = None,
+) -> Counter:
+    """
+    Rollup increments for one graded attempt, as (metric, key) -> count.
+    """
+    counters = Counter()
+    counters[(ATTEMPTS, "")] += 1
+    if result["passed"]:
+        counters[(PASSED, "")] += 1
+    counters[(SCORE_BUCKET, score_bucket(result["score"]))] += 1
+    if time_taken is not None and time_taken >= 0:
+        counters[(TIME_BUCKET, time_bucket(time_taken))] += 1
+    for question_id in result["answered_questions"]:
+        counters[(QUESTION_ANSWERED, question_id)] += 1
+        for answer_id in key.questions[question_id].selected(answers[question_id]):
+            counters[(ANSWER_SELECTED, answer_id)] += 1
+    for question_id in result["correct_questions"]:
+        counters[(QUESTION_CORRECT, question_id)] += 1
+    return counters
+
+
+def time_percentiles(
+    buckets: Dict[str, int], percentiles: Tuple[int, ...] = (50, 90, 99)
+) -> Dict[str, Optional[int]]:
+    """
+    Approximate time-taken percentiles from the histogram, reported as the
+    upper bound of the bucket they fall in; None when the percentile is over
+    the last bound.
+    """
+    ordered: List[Tuple[Optional[int], int]] = [
+        (bound, buckets.get(str(bound), 0)) for bound in TIME_BUCKETS
+    ] + [(None, buckets.get(OVERFLOW_BUCKET, 0))]
+    total = sum(count for _, count in ordered)
+    result: Dict[str, Optional[int]] = {}
+    for percentile in percentiles:
+        if not total:
+            result[f"p{percentile}"] = None
+            continue
+        target = total * percentile / 100.0
+        running = 0
+        for bound, count in ordered:
+            running += count
+            if running >= target:
+                result[f"p{percentile}"] = bound
+                break
+    return result
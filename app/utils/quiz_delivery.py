@@ -0,0 +1,137 @@
+import json
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.models.quiz import Quiz
+
+TRUE_FALSE = "true_false"
+
+QUIZ_FIELDS = (
+    "id", "title", "description", "content_type", "content_id", "passing_score",
+    "time_limit", "randomize_questions", "show_correct_answers", "version",
+)
+QUESTION_FIELDS = ("id", "question_text", "question_type", "points", "order")
+ANSWER_FIELDS = ("id", "answer_text", "order")
+# Only sent to authors; explanations give the answer away
+AUTHOR_QUESTION_FIELDS = ("explanation",)
+AUTHOR_ANSWER_FIELDS = ("is_correct", "explanation")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _fields(obj: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return {field: getattr(obj, field) for field in fields}
+
+
+class QuestionBlob:
+    """
+    A question pre-serialized as a JSON prefix plus one JSON fragment per
+    answer, so answers can be reordered without re-encoding anything.
+    """
+    __slots__ = ("prefix", "answers", "shuffle_answers")
+
+    def __init__(self, prefix: str, answers: List[str], shuffle_answers: bool):
+        self.prefix = prefix
+        self.answers = answers
+        self.shuffle_answers = shuffle_answers
+
+    def render(self, rng: Optional[random.Random]) -> str:
+        answers = self.answers
+        if rng is not None and self.shuffle_answers:
+            answers = answers[:]
+            rng.shuffle(answers)
+        return f'{self.prefix},"answers":[{",".join(answers)}]}}'
+
+
+class QuizBlob:
+    """
+    A quiz pre-serialized for delivery to learners or authors.
+    """
+    __slots__ = ("version", "prefix", "questions", "randomize")
+
+    def __init__(self, version: int, prefix: str, questions: List[QuestionBlob], randomize: bool):
+        self.version = version
+        self.prefix = prefix
+        self.questions = questions
+        self.randomize = randomize
+
+    def render(self, seed: str) -> str:
+        """
+        JSON for the quiz. When the quiz randomizes, questions and their
+        answers (except true/false) are shuffled by a RNG seeded with
+        ``seed``, so the same seed always gives the same order.
+        """
+        rng = random.Random(seed) if self.randomize else None
+        questions = self.questions
+        if rng is not None:
+            questions = questions[:]
+            rng.shuffle(questions)
+        body = ",".join(question.render(rng) for question in questions)
+        return f'{self.prefix},"seed":{_dumps(seed)},"questions":[{body}]}}'
+
+
+def build_quiz_blob(quiz: Quiz, *, include_answers: bool) -> QuizBlob:
+    """
+    Serialize a quiz whose questions and answers are already loaded.
+    ``include_answers`` keeps ``is_correct`` and explanations for authors.
+    """
+    question_fields = QUESTION_FIELDS + (AUTHOR_QUESTION_FIELDS if include_answers else ())
+    answer_fields = ANSWER_FIELDS + (AUTHOR_ANSWER_FIELDS if include_answers else ())
+
+    questions = []
+    for question in sorted(quiz.questions, key=lambda q: (q.order or 0, q.id)):
+        answers = sorted(question.answers, key=lambda a: (a.order or 0, a.id))
+        questions.append(QuestionBlob(
+            _dumps(_fields(question, question_fields))[:-1],
+            [_dumps(_fields(answer, answer_fields)) for answer in answers],
+            question.question_type != TRUE_FALSE,
+        ))
+
+    quiz_data = _fields(quiz, QUIZ_FIELDS)
+    quiz_data["version"] = quiz.version or 1
+    return QuizBlob(quiz_data["version"], _dumps(quiz_data)[:-1], questions, bool(quiz.randomize_questions))
+
+
+class QuizBlobCache:
+    """
+    LRU cache of serialized quizzes keyed by quiz ID and audience, checked
+    against ``Quiz.version`` on every read.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._blobs: "OrderedDict[Tuple[str, bool], QuizBlob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, quiz_id: str, version: int, include_answers: bool) -> Optional[QuizBlob]:
+        key = (quiz_id, include_answers)
+        with self._lock:
+            blob = self._blobs.get(key)
+            if blob is None or blob.version != version:
+                return None
+            self._blobs.move_to_end(key)
+            return blob
+
+    def put(self, quiz_id: str, include_answers: bool, blob: QuizBlob) -> None:
+        key = (quiz_id, include_answers)
+        with self._lock:
+            self._blobs[key] = blob
+            self._blobs.move_to_end(key)
+            while len(self._blobs) > self.maxsize:
+                self._blobs.popitem(last=False)
+
+    def invalidate(self, quiz_id: str) -> None:
+        with self._lock:
+            for include_answers in (False, True):
+                self._blobs.pop((quiz_id, include_answers), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._blobs.clear()
+
+
+quiz_blob_cache = QuizBlobCache()
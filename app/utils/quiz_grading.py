@@ -0,0 +1,180 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.quiz import Quiz, QuizAnswer, QuizQuestion
+
+SHORT_ANSWER = "short_answer"
+
+
+def _normalize_text(value: Any) -> str:
+    return " ".join(str(value).split()).casefold()
+
+
+class QuestionKey:
+    """
+    What counts as a correct answer to one question, and what it's worth.
+
+    Choice questions store the set of correct answer IDs; short-answer
+    questions store the normalized texts of their correct answers.
+    ``choices`` holds every answer ID of a choice question.
+    """
+    __slots__ = ("points", "short_answer", "correct", "choices")
+
+    def __init__(
+        self,
+        points: int,
+        short_answer: bool,
+        correct: FrozenSet[str],
+        choices: FrozenSet[str] = frozenset(),
+    ):
+        self.points = points
+        self.short_answer = short_answer
+        self.correct = correct
+        self.choices = choices
+
+    def selected(self, submitted: Any) -> FrozenSet[str]:
+        """
+        The known answer IDs picked in a submission to a choice question.
+        """
+        if submitted is None or self.short_answer:
+            return frozenset()
+        if isinstance(submitted, (list, tuple, set)):
+            return frozenset(str(answer_id) for answer_id in submitted) & self.choices
+        return frozenset((str(submitted),)) & self.choices
+
+    def is_correct(self, submitted: Any) -> bool:
+        if submitted is None:
+            return False
+        if self.short_answer:
+            return _normalize_text(submitted) in self.correct
+        if isinstance(submitted, (list, tuple, set)):
+            chosen = frozenset(str(answer_id) for answer_id in submitted)
+        else:
+            chosen = frozenset((str(submitted),))
+        return bool(self.correct) and chosen == self.correct
+
+
+class AnswerKey:
+    """
+    A quiz compiled for grading: question ID -> QuestionKey.
+    """
+    __slots__ = ("quiz_id", "version", "questions", "total_points")
+
+    def __init__(self, quiz_id: str, version: int, questions: Dict[str, QuestionKey]):
+        self.quiz_id = quiz_id
+        self.version = version
+        self.questions = questions
+        self.total_points = sum(question.points for question in questions.values())
+
+    def grade(self, answers: Dict[str, Any], passing_score: float) -> Dict[str, Any]:
+        """
+        Grade submitted answers (question ID -> answer ID, list of answer IDs
+        or text). Runs in O(answers); unknown question IDs are ignored.
+        """
+        earned = 0
+        answered = []
+        correct = []
+        for question_id, submitted in answers.items():
+            question = self.questions.get(question_id)
+            if question is None or submitted is None:
+                continue
+            answered.append(question_id)
+            if question.is_correct(submitted):
+                earned += question.points
+                correct.append(question_id)
+        score = round(earned * 100.0 / self.total_points, 2) if self.total_points else 0.0
+        return {
+            "score": score,
+            "passed": bool(self.total_points) and score >= (passing_score or 0),
+            "earned_points": earned,
+            "total_points": self.total_points,
+            "answered_questions": answered,
+            "correct_questions": correct,
+        }
+
+
+def compile_answer_key(db: Session, quiz: Quiz) -> AnswerKey:
+    """
+    Build the answer key for a quiz with a single query over its questions
+    and answers.
+    """
+    rows = (
+        db.query(
+            QuizQuestion.id,
+            QuizQuestion.question_type,
+            QuizQuestion.points,
+            QuizAnswer.id,
+            QuizAnswer.is_correct,
+            QuizAnswer.answer_text,
+        )
+        .outerjoin(QuizAnswer, QuizAnswer.question_id == QuizQuestion.id)
+        .filter(QuizQuestion.quiz_id == quiz.id)
+        .all()
+    )
+
+    meta: Dict[str, Tuple[int, bool]] = {}
+    correct: Dict[str, set] = {}
+    choices: Dict[str, set] = {}
+    for question_id, question_type, points, answer_id, is_correct, answer_text in rows:
+        short_answer = question_type == SHORT_ANSWER
+        meta[question_id] = (points if points is not None else 1, short_answer)
+        answers = correct.setdefault(question_id, set())
+        ids = choices.setdefault(question_id, set())
+        if answer_id is None:
+            continue
+        if not short_answer:
+            ids.add(answer_id)
+        if is_correct:
+            answers.add(_normalize_text(answer_text) if short_answer else answer_id)
+
+    questions = {
+        question_id: QuestionKey(
+            points, short_answer, frozenset(correct[question_id]), frozenset(choices[question_id])
+        )
+        for question_id, (points, short_answer) in meta.items()
+    }
+    return AnswerKey(quiz.id, quiz.version or 1, questions)
+
+
+class AnswerKeyCache:
+    """
+    LRU cache of compiled answer keys keyed by (quiz ID, version).
+
+    Edits bump ``Quiz.version``, so a stale key is never used even by a
+    worker that didn't see the edit; ``invalidate`` just frees it early.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._keys: "OrderedDict[str, AnswerKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, quiz: Quiz) -> AnswerKey:
+        version = quiz.version or 1
+        with self._lock:
+            key = self._keys.get(quiz.id)
+            if key is not None and key.version == version:
+                self._keys.move_to_end(quiz.id)
+                return key
+
+        key = compile_answer_key(db, quiz)
+        with self._lock:
+            self._keys[quiz.id] = key
+            self._keys.move_to_end(quiz.id)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+        return key
+
+    def invalidate(self, quiz_id: Optional[str]) -> None:
+        with self._lock:
+            self._keys.pop(quiz_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+answer_key_cache = AnswerKeyCache()
@@ -0,0 +1,138 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from email_validator import EmailNotValidError, validate_email
+
+SUPPORTED_FORMATS = ("csv", "ndjson")
+
+
+def detect_format(
+    filename: Optional[str], content_type: Optional[str], explicit: Optional[str] = None
+) -> Optional[str]:
+    """
+    Work out whether an upload is CSV or NDJSON.
+
+    An explicit format wins, then the file extension, then the content type.
+    Returns None if the format can't be determined.
+    """
+    if explicit:
+        explicit = explicit.lower()
+        return explicit if explicit in SUPPORTED_FORMATS else None
+
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "jsonl" in content_type or "json" in content_type:
+        return "ndjson"
+    return None
+
+
+def iter_rows(fileobj: BinaryIO, fmt: str) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Stream rows out of an uploaded file without reading it into memory.
+
+    Yields one dict per record. Malformed NDJSON lines yield None so the
+    caller can count them as invalid.
+    """
+    text_stream = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            for row in csv.DictReader(text_stream):
+                yield {
+                    (key or "").strip().lower(): value
+                    for key, value in row.items()
+                    if key is not None
+                }
+        else:
+            for line in text_stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield None
+                    continue
+                yield record if isinstance(record, dict) else None
+    finally:
+        # Don't let the wrapper close the underlying upload
+        text_stream.detach()
+
+
+def normalize_email(value: Any) -> Optional[str]:
+    """
+    Return the validated email address or None if it's invalid.
+
+    Normalized the way single signups (``EmailStr``) are: surrounding spaces
+    removed and the domain lower-cased, with the local part's case kept, so
+    the unique constraint matches both paths.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError:
+        return None
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+    """
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def prepare_chunk(chunk: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Validate and de-duplicate a chunk of rows by email.
+
+    Returns the surviving ``(email, row)`` pairs in input order together with
+    the number of invalid rows and in-chunk duplicates. Duplicates must be
+    removed before the INSERT because PostgreSQL rejects an ON CONFLICT DO
+    UPDATE that touches the same row twice in one statement.
+    """
+    seen = set()
+    rows = []
+    invalid = 0
+    duplicates = 0
+    for row in chunk:
+        email = normalize_email(row.get("email")) if row else None
+        if email is None:
+            invalid += 1
+            continue
+        if email in seen:
+            duplicates += 1
+            continue
+        seen.add(email)
+        rows.append((email, row))
+    return {"rows": rows, "invalid": invalid, "duplicates": duplicates}
+
+
+def extra_fields(row: Dict[str, Any], known: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """
+    Collect the non-empty columns that don't map onto a model field.
+    """
+    known = set(known)
+    extras = {
+        key: value
+        for key, value in row.items()
+        if key not in known and value not in (None, "")
+    }
+    return extras or None
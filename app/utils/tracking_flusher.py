@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.tracking import BANNER_CLICK, EMAIL_CLICK, EMAIL_OPEN, TrackingBuffer, tracking_buffer
+
+logger = logging.getLogger(__name__)
+
+# Tracking event kind -> (CRUD object, counter column)
+COUNTER_COLUMNS = {
+    EMAIL_OPEN: (crud.prelaunch_email, "open_count"),
+    EMAIL_CLICK: (crud.prelaunch_email, "click_count"),
+    BANNER_CLICK: (crud.marketing_banner, "clicks"),
+}
+
+# Counts from a failed flush, retried on the next one
+_unflushed: Dict[str, Counter] = {}
+
+
+def flush_tracking_events(db: Session, buffer: TrackingBuffer = tracking_buffer) -> int:
+    """
+    Write buffered tracking events to the database in one transaction.
+
+    Events are aggregated per target first, so each flush issues at most one
+    executemany UPDATE per counter column. Returns the number of events written.
+    """
+    counts = buffer.drain()
+    for kind, pending in _unflushed.items():
+        counts.setdefault(kind, Counter()).update(pending)
+    _unflushed.clear()
+    if not counts:
+        return 0
+
+    try:
+        for kind, per_target in counts.items():
+            crud_obj, column = COUNTER_COLUMNS[kind]
+            crud_obj.increment_counters(db, column=column, counts=per_target)
+        db.commit()
+    except Exception:
+        db.rollback()
+        _unflushed.update(counts)
+        raise
+    return sum(sum(per_target.values()) for per_target in counts.values())
+
+
+async def run_tracking_flusher(stop_event: asyncio.Event) -> None:
+    """
+    Flush tracking events every TRACKING_FLUSH_INTERVAL_SECONDS until stopped,
+    with a final flush on shutdown.
+    """
+    while True:
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.TRACKING_FLUSH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+        db = SessionLocal()
+        try:
+            written = await asyncio.to_thread(flush_tracking_events, db)
+            if written:
+                logger.debug(f"Flushed {written} tracking events")
+        except Exception as e:
+            logger.error(f"Tracking flush failed: {e}")
+        finally:
+            db.close()
+
+        if tracking_buffer.dropped:
+            logger.warning(f"Tracking buffer overflowed, {tracking_buffer.dropped} events dropped so far")
+        if stop_event.is_set():
+            return
@@ -0,0 +1,41 @@
+"""
+One-off job: rebuild quiz analytics rollups from existing attempts.
+
+Each batch is committed to a staging table and swapped in at the end, so
+analytics keep showing the old rollups while this runs and a failed run
+can simply be started again.
+
+Usage: python backfill_quiz_analytics.py [quiz_id] [--batch-size N]
+"""
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.abspath("."))
+
+from app import crud  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild quiz analytics rollups from existing attempts.")
+    parser.add_argument("quiz_id", nargs="?", help="only rebuild this quiz")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        replayed = crud.quiz_stat.backfill(db, quiz_id=args.quiz_id, batch_size=args.batch_size)
+        print(f"Replayed {replayed} quiz attempts")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ try:
     )
     from app.models.quiz import Quiz, QuizQuestion, QuizAnswer, UserQuizAttempt
     from app.models.award import Award, UserAward
+    from app.models.points import PointsLedgerEntry
     from app.models.course import (
         CourseCategory, Course, CourseModule, CourseTopic, 
         TopicLesson, CourseEnrollment, CourseProgress
@@ -30,7 +31,7 @@ try:
     from app.models.marketing import NewsletterSubscription, MarketingBanner
     from app.models.prelaunch import (
         CoursePrelaunchCampaign, PrelaunchSubscriber, 
-        PrelaunchEmailSequence, PrelaunchEmail,
+        PrelaunchEmailSequence, PrelaunchEmail, PrelaunchEmailDelivery,
         prelaunch_course_association,
         prelaunch_booklet_association,
         prelaunch_series_association
@@ -13,7 +13,7 @@ try:
     from app.core.database import Base, engine
     from app.models import (
         Quiz, QuizQuestion, QuizAnswer, UserQuizAttempt,
-        Award, UserAward
+        Award, UserAward, PointsLedgerEntry
     )
     
     # Create the new tables
@@ -28,6 +28,9 @@ try:
     # Create Award tables
     Award.__table__.create(bind=engine, checkfirst=True)
     UserAward.__table__.create(bind=engine, checkfirst=True)
+
+    # Create the points ledger
+    PointsLedgerEntry.__table__.create(bind=engine, checkfirst=True)
     
     print("Gamification tables created successfully!")
     
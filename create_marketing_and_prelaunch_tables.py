@@ -16,7 +16,7 @@ try:
     from app.models.marketing import NewsletterSubscription, MarketingBanner
     from app.models.prelaunch import (
         CoursePrelaunchCampaign, PrelaunchSubscriber, 
-        PrelaunchEmailSequence, PrelaunchEmail,
+        PrelaunchEmailSequence, PrelaunchEmail, PrelaunchEmailDelivery,
         prelaunch_course_association,
         prelaunch_booklet_association,
         prelaunch_series_association
@@ -36,6 +36,7 @@ try:
     PrelaunchSubscriber.__table__.create(bind=engine, checkfirst=True)
     PrelaunchEmailSequence.__table__.create(bind=engine, checkfirst=True)
     PrelaunchEmail.__table__.create(bind=engine, checkfirst=True)
+    PrelaunchEmailDelivery.__table__.create(bind=engine, checkfirst=True)
     
     # Create association tables
     print("Creating association tables...")
@@ -13,7 +13,7 @@ try:
     from app.core.database import Base, engine
     from app.models import (
         CoursePrelaunchCampaign, PrelaunchSubscriber,
-        PrelaunchEmailSequence, PrelaunchEmail
+        PrelaunchEmailSequence, PrelaunchEmail, PrelaunchEmailDelivery
     )
     from app.models.prelaunch import (
         prelaunch_course_association,
@@ -29,6 +29,7 @@ try:
     PrelaunchSubscriber.__table__.create(bind=engine, checkfirst=True)
     PrelaunchEmailSequence.__table__.create(bind=engine, checkfirst=True)
     PrelaunchEmail.__table__.create(bind=engine, checkfirst=True)
+    PrelaunchEmailDelivery.__table__.create(bind=engine, checkfirst=True)
 
     # Create association tables after the main tables
     prelaunch_course_association.create(bind=engine, checkfirst=True)
@@ -23,7 +23,8 @@ try:
     engine = create_engine(db_url)
 
     # Create tables directly with SQL
-    with engine.connect() as conn:
+    # One transaction, committed at the end; a bare connect() would roll it back
+    with engine.begin() as conn:
         # Create User table if it doesn't exist
         conn.execute(text("""
         CREATE TABLE IF NOT EXISTS users (
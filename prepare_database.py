@@ -0,0 +1,48 @@
+"""
+Release step: bring the database schema up to the latest migration.
+
+The migrations start from the schema production already had, so:
+
+- an empty database gets every table from the models and is stamped at
+  the latest revision;
+- an existing database gets any missing base tables
+  (create_tables_directly.py), then ``alembic upgrade head``.
+
+Usage: python prepare_database.py
+"""
+import os
+import runpy
+import sys
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add the current directory to the Python path
+sys.path.insert(0, os.path.abspath("."))
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import inspect  # noqa: E402
+
+import app.models  # noqa: E402,F401  (registers every table on Base.metadata)
+from app.core.database import Base, engine  # noqa: E402
+
+
+def main() -> None:
+    config = Config("alembic.ini")
+    if not inspect(engine).get_table_names():
+        print("Empty database: creating all tables and stamping the latest revision")
+        Base.metadata.create_all(bind=engine)
+        command.stamp(config, "head")
+        return
+
+    print("Creating missing base tables")
+    runpy.run_path("create_tables_directly.py")
+    print("Running migrations")
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
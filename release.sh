@@ -0,0 +1,6 @@
+#!/bin/bash
+# Release step, run once per deploy before the new instances start.
+set -e
+
+echo "=== Preparing database schema ==="
+python prepare_database.py
@@ -1,19 +1,72 @@
-import uvicorn
+import inspect
+import logging
 import os
+
+import uvicorn
+
 from app.core.config import settings
+from app.core.server import pool_limits, production_worker_count
+from app.core.structured_logging import configure_logging
 
-if __name__ == "__main__":
-    # Get PORT from environment or use the default from settings
-    port_str = os.getenv("PORT")
-    port = int(port_str) if port_str else settings.PORT
+logger = logging.getLogger(__name__)
 
-    # Determine if we should enable reload based on environment
-    reload = os.getenv("ENVIRONMENT") != "production"
 
-    uvicorn.run(
-        "app.main:app",
+def serve_production(port: int) -> None:
+    """
+    One uvicorn worker per CPU, as far as the connection budget allows (see
+    app.core.server), on uvloop and httptools, recycled after
+    WEB_MAX_REQUESTS requests and drained on restart.
+    """
+    # The supervisor's own lines go through the same JSON pipeline as the workers'
+    configure_logging()
+    workers = production_worker_count()
+    # Inherited by the workers, so each sizes its connection pool for this count
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    pool_size, max_overflow = pool_limits(workers)
+    if workers * (pool_size + max_overflow) > settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS:
+        logger.warning(
+            f"{workers} workers with {pool_size}+{max_overflow} connections each exceed the database budget; "
+            f"lower WEB_CONCURRENCY or DB_MIN_POOL_SIZE"
+        )
+    logger.info(
+        f"Starting {workers} workers on port {port}; "
+        f"{pool_size}+{max_overflow} database connections per worker "
+        f"(limit {settings.DB_MAX_CONNECTIONS}, {settings.DB_RESERVED_CONNECTIONS} reserved)"
+    )
+
+    options = dict(
         host="0.0.0.0",
         port=port,
-        reload=reload,
-        log_level="info"
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        limit_max_requests=settings.WEB_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
+        timeout_keep_alive=settings.WEB_KEEPALIVE_SECONDS,
+        log_level=os.getenv("LOG_LEVEL", "info"),
+        # Logging is configured by app.core.structured_logging, not uvicorn's dictConfig
+        log_config=None,
     )
+    # Staggers recycling so workers don't all restart together; newer uvicorn only
+    if "limit_max_requests_jitter" in inspect.signature(uvicorn.Config).parameters:
+        options["limit_max_requests_jitter"] = settings.WEB_MAX_REQUESTS_JITTER
+    uvicorn.run("app.main:app", **options)
+
+
+if __name__ == "__main__":
+    # Get PORT from environment or use the default from settings
+    port_str = os.getenv("PORT")
+    port = int(port_str) if port_str else settings.PORT
+
+    if os.getenv("ENVIRONMENT") == "production":
+        serve_production(port)
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=port,
+            reload=True,
+            log_level="info"
+        )
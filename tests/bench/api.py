@@ -0,0 +1,263 @@
+"""
+Benchmark suite for the API hot paths.
+
+Seeds a throwaway database with generated data, drives each scenario through
+the app in-process (one worker, sequential requests) and writes latency
+percentiles and SQL statements per request as JSON, so runs can be compared
+across commits with ``tests.bench.compare``.
+
+    python -m tests.bench.api --output bench-sqlite.json
+    python -m tests.bench.api --database-url postgresql://localhost/bench --output bench-pg.json
+    python -m tests.bench.api --scenario course_tree --lessons 20 --requests 50
+
+The schema is created at the start and dropped at the end of the run, so
+--database-url must point at a database used for nothing else.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.api import deps
+from app.core.database import Base
+from app.main import app
+from tests.bench.data import (
+    BENCH_PASSWORD,
+    WORDS,
+    Dataset,
+    DatasetSize,
+    add_dataset_arguments,
+    create_engine_for,
+    generate,
+)
+
+API = "/api/v1"
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    # (client, dataset, headers, iteration) -> response
+    request: Callable
+    authenticated: bool = False
+
+
+def _course_tree(client, dataset, headers, i):
+    return client.get(f"{API}/courses/{dataset.course_ids[i % len(dataset.course_ids)]}")
+
+
+def _progress_write(client, dataset, headers, i):
+    # Walks the lessons so the first pass inserts progress rows and later passes update them
+    lesson_id = dataset.lesson_ids[i % len(dataset.lesson_ids)]
+    enrollment_id = dataset.enrollment_ids[dataset.bench_user_email][0]
+    return client.post(
+        f"{API}/courses/progress",
+        params={
+            "enrollment_id": enrollment_id,
+            "content_type": "lesson",
+            "content_id": lesson_id,
+            "is_completed": i % 2 == 0,
+        },
+        headers=headers,
+    )
+
+
+def _post_list_page(client, dataset, headers, i):
+    pages = max(dataset.size.posts // 20, 1)
+    return client.get(f"{API}/posts/", params={"skip": (i % pages) * 20, "limit": 20})
+
+
+def _course_search(client, dataset, headers, i):
+    return client.get(f"{API}/courses/", params={"search": WORDS[i % len(WORDS)], "limit": 20})
+
+
+def _login(client, dataset, headers, i):
+    email = dataset.user_emails[i % len(dataset.user_emails)]
+    return client.post(f"{API}/auth/login", data={"username": email, "password": BENCH_PASSWORD})
+
+
+def _banners_for_page(client, dataset, headers, i):
+    return client.get(f"{API}/marketing/banners/page/{('home', 'blog', 'courses')[i % 3]}")
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("course_tree", "GET a course with its module/topic/lesson tree", _course_tree),
+        Scenario("progress_write", "POST lesson progress for an enrollment", _progress_write, authenticated=True),
+        Scenario("post_list_page", "GET a 20-post page of the post list", _post_list_page),
+        Scenario("course_search", "GET course search results", _course_search),
+        Scenario("login", "POST the OAuth2 password login", _login),
+        Scenario("banners_for_page", "GET the banners for a page, anonymously", _banners_for_page),
+    )
+}
+
+
+class _QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _after_cursor_execute(self, *args):
+        self.count += 1
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, queries: int, elapsed: float) -> Dict[str, float]:
+    """
+    Milliseconds, rounded to microseconds.
+    """
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "queries_per_request": round(queries / len(latencies), 2),
+    }
+
+
+def run_scenario(
+    client: TestClient, scenario: Scenario, dataset: Dataset, headers: Dict[str, str],
+    counter: _QueryCounter, requests: int, warmup: int,
+) -> Dict[str, float]:
+    for i in range(warmup):
+        scenario.request(client, dataset, headers, i)
+    latencies = []
+    errors = 0
+    queries_before = counter.count
+    started = time.perf_counter()
+    for i in range(warmup, warmup + requests):
+        request_started = time.perf_counter()
+        response = scenario.request(client, dataset, headers, i)
+        latencies.append(time.perf_counter() - request_started)
+        if response.status_code >= 400:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, errors, counter.count - queries_before, elapsed)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> Dict:
+    size = DatasetSize(**{name: getattr(args, name) for name in DatasetSize().as_dict()})
+    scenarios = [SCENARIOS[name] for name in (args.scenario or SCENARIOS)]
+
+    # Budget warnings are expected on the wide course tree; queries are reported below
+    logging.getLogger("app.core.query_profiler").setLevel(logging.ERROR)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    engine = create_engine_for(args.database_url)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    try:
+        seed_started = time.perf_counter()
+        db = Session()
+        try:
+            dataset = generate(db, size, seed=args.seed)
+        finally:
+            db.close()
+        print(f"seeded {size.as_dict()} in {time.perf_counter() - seed_started:.1f}s", file=sys.stderr)
+
+        def get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = get_db
+        counter = _QueryCounter(engine)
+        client = TestClient(app, raise_server_exceptions=False)
+        headers = {}
+        if any(scenario.authenticated for scenario in scenarios):
+            token = client.post(
+                f"{API}/auth/login", data={"username": dataset.bench_user_email, "password": BENCH_PASSWORD}
+            ).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+
+        results = {}
+        for scenario in scenarios:
+            requests = args.login_requests if scenario.name == "login" else args.requests
+            results[scenario.name] = run_scenario(
+                client, scenario, dataset, headers, counter, requests, args.warmup
+            )
+            stats = results[scenario.name]
+            print(
+                f"{scenario.name:<18} p50 {stats['p50_ms']:>8.2f}ms  p95 {stats['p95_ms']:>8.2f}ms  "
+                f"{stats['queries_per_request']:>7.1f} queries  {stats['errors']} errors",
+                file=sys.stderr,
+            )
+    finally:
+        app.dependency_overrides.pop(deps.get_db, None)
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "database": engine.dialect.name,
+        "python": platform.python_version(),
+        "dataset": size.as_dict(),
+        "requests": args.requests,
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeatable; default all")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=20, help="login is bcrypt-bound, so fewer")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    add_dataset_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.database_url is None:
+            args.database_url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        result = run(args)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
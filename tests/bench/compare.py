@@ -0,0 +1,70 @@
+"""
+Compare two ``tests.bench.api`` result files.
+
+    python -m tests.bench.compare baseline.json candidate.json --threshold 10
+
+Exits non-zero when a scenario's p50 or p95 got slower by more than
+--threshold percent, or it runs more SQL statements per request.
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+METRICS = ("p50_ms", "p95_ms", "queries_per_request")
+
+
+def _change(before: float, after: float) -> float:
+    if before == 0:
+        return 0.0 if after == 0 else float("inf")
+    return (after - before) / before * 100
+
+
+def compare(baseline: Dict, candidate: Dict, threshold: float) -> Tuple[List[str], List[str]]:
+    """
+    Report lines, and the regressions among them.
+    """
+    lines = [f"{'scenario':<18} {'metric':<20} {'baseline':>10} {'candidate':>10} {'change':>8}"]
+    regressions = []
+    for name, after in candidate["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            lines.append(f"{name:<18} (new scenario)")
+            continue
+        for metric in METRICS:
+            change = _change(before[metric], after[metric])
+            line = f"{name:<18} {metric:<20} {before[metric]:>10} {after[metric]:>10} {change:>+7.1f}%"
+            lines.append(line)
+            if metric == "queries_per_request":
+                regressed = after[metric] > before[metric]
+            else:
+                regressed = change > threshold
+            if regressed:
+                regressions.append(line)
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed latency regression, percent")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+    if baseline.get("database") != candidate.get("database"):
+        print(f"warning: comparing {baseline.get('database')} with {candidate.get('database')}", file=sys.stderr)
+
+    print(f"{baseline.get('commit')} -> {candidate.get('commit')}")
+    lines, regressions = compare(baseline, candidate, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):\n" + "\n".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Deterministic data generators for the benchmarks.
+
+Rows are bulk-inserted with Core ``insert()`` so seeding tens of thousands of
+rows takes seconds; the same ``seed`` and sizes always produce the same data.
+"""
+import argparse
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.security import get_password_hash
+
+BENCH_PASSWORD = "bench-password"
+
+# Course titles are built from these, so searches have a predictable hit rate
+WORDS = (
+    "python", "data", "async", "design", "testing", "systems", "web", "cloud",
+    "security", "databases", "networks", "algorithms", "rust", "go", "linux", "ml",
+)
+
+
+@dataclass
+class DatasetSize:
+    """
+    Row counts; a course has ``modules`` x ``topics`` x ``lessons`` lessons.
+    """
+
+    courses: int = 5
+    modules: int = 6
+    topics: int = 4
+    lessons: int = 5
+    posts: int = 5000
+    categories: int = 10
+    users: int = 1000
+    subscribers: int = 10000
+    banners: int = 20
+    # Users enrolled in every course, for authenticated traffic
+    enrolled_users: int = 20
+    quizzes: int = 10
+    questions: int = 5
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class Dataset:
+    """
+    Ids and credentials the scenarios need from the generated data.
+    """
+
+    size: DatasetSize
+    course_ids: List[str] = field(default_factory=list)
+    lesson_ids: List[str] = field(default_factory=list)
+    user_emails: List[str] = field(default_factory=list)
+    # The user the authenticated scenarios run as, enrolled in every course
+    bench_user_email: str = ""
+    # Email -> that user's enrollment ids
+    enrollment_ids: Dict[str, List[str]] = field(default_factory=dict)
+    post_slugs: List[str] = field(default_factory=list)
+    banner_ids: List[str] = field(default_factory=list)
+    # Quiz id -> question id -> its answer ids
+    quiz_answers: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+
+
+def create_engine_for(database_url: str) -> Engine:
+    """
+    An engine for the benchmark database; SQLite gets a ``NOW()`` function,
+    since the models' server defaults are written for PostgreSQL.
+    """
+    if make_url(database_url).get_backend_name() != "sqlite":
+        return create_engine(database_url)
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_now(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "NOW", 0, lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+    return engine
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    One ``--<field>`` option per ``DatasetSize`` field.
+    """
+    for name, value in DatasetSize().as_dict().items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=value)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _insert(db: Session, model, rows: List[Dict[str, Any]], batch: int = 1000) -> None:
+    for start in range(0, len(rows), batch):
+        db.execute(insert(model), rows[start:start + batch])
+
+
+def generate(db: Session, size: DatasetSize, seed: int = 0) -> Dataset:
+    """
+    Seed an empty schema and return what the scenarios need to address it.
+    """
+    rng = random.Random(seed)
+    dataset = Dataset(size=size)
+    hashed_password = get_password_hash(BENCH_PASSWORD)  # bcrypt once, shared by every user
+
+    users = [
+        {
+            "id": f"user-{i}",
+            "email": f"user{i}@bench.example.com",
+            "username": f"user{i}",
+            "first_name": "Bench",
+            "last_name": str(i),
+            "hashed_password": hashed_password,
+            "is_active": True,
+            "is_superuser": i == 0,
+            "total_points": rng.randint(0, 5000),
+        }
+        for i in range(max(size.users, 1))
+    ]
+    _insert(db, models.User, users)
+    dataset.user_emails = [user["email"] for user in users]
+    dataset.bench_user_email = users[0]["email"]
+
+    _insert(db, models.Author, [{"id": "author-0", "name": "Bench Author", "bio": _text(rng, 30)}])
+    _insert(db, models.CourseCategory, [{"id": "course-category-0", "name": "Bench", "slug": "bench"}])
+
+    enrolled = users[:max(min(size.enrolled_users, len(users)), 1)]
+    courses, modules, topics, lessons, enrollments = [], [], [], [], []
+    for c in range(size.courses):
+        course_id = f"course-{c}"
+        courses.append({
+            "id": course_id,
+            "title": _text(rng, 4).title(),
+            "slug": f"course-{c}",
+            "description": _text(rng, 40),
+            "long_description": _text(rng, 200),
+            "author_id": "author-0",
+            "category_id": "course-category-0",
+            "level": rng.choice(("beginner", "intermediate", "advanced")),
+            "is_published": True,
+            "is_featured": c % 3 == 0,
+            "tags": rng.sample(WORDS, 3),
+        })
+        for user in enrolled:
+            enrollments.append({"id": f"enrollment-{c}-{user['id']}", "user_id": user["id"], "course_id": course_id})
+            dataset.enrollment_ids.setdefault(user["email"], []).append(f"enrollment-{c}-{user['id']}")
+        for m in range(size.modules):
+            module_id = f"{course_id}-module-{m}"
+            modules.append({
+                "id": module_id, "title": _text(rng, 3), "course_id": course_id, "order": m, "is_published": True
+            })
+            for t in range(size.topics):
+                topic_id = f"{module_id}-topic-{t}"
+                topics.append({
+                    "id": topic_id, "title": _text(rng, 3), "module_id": module_id, "order": t, "is_published": True
+                })
+                for n in range(size.lessons):
+                    lessons.append({
+                        "id": f"{topic_id}-lesson-{n}",
+                        "title": _text(rng, 4),
+                        "content": _text(rng, 300),
+                        "topic_id": topic_id,
+                        "order": n,
+                        "duration": rng.randint(60, 900),
+                        "is_published": True,
+                    })
+    _insert(db, models.Course, courses)
+    _insert(db, models.CourseModule, modules)
+    _insert(db, models.CourseTopic, topics)
+    _insert(db, models.TopicLesson, lessons)
+    _insert(db, models.CourseEnrollment, enrollments)
+    dataset.course_ids = [course["id"] for course in courses]
+    dataset.lesson_ids = [lesson["id"] for lesson in lessons]
+
+    quizzes, questions, answers = [], [], []
+    for q, lesson in enumerate(lessons[:size.quizzes]):
+        quiz_id = f"quiz-{q}"
+        quizzes.append({
+            "id": quiz_id, "title": lesson["title"], "content_type": "lesson", "content_id": lesson["id"],
+            "passing_score": 60.0,
+        })
+        dataset.quiz_answers[quiz_id] = {}
+        for n in range(size.questions):
+            question_id = f"{quiz_id}-question-{n}"
+            questions.append({
+                "id": question_id, "quiz_id": quiz_id, "question_text": _text(rng, 8),
+                "question_type": "multiple_choice", "points": 1, "order": n,
+            })
+            correct = rng.randrange(4)
+            answer_ids = [f"{question_id}-answer-{a}" for a in range(4)]
+            answers.extend(
+                {"id": answer_id, "question_id": question_id, "answer_text": _text(rng, 3),
+                 "is_correct": a == correct, "order": a}
+                for a, answer_id in enumerate(answer_ids)
+            )
+            dataset.quiz_answers[quiz_id][question_id] = answer_ids
+    _insert(db, models.Quiz, quizzes)
+    _insert(db, models.QuizQuestion, questions)
+    _insert(db, models.QuizAnswer, answers)
+
+    categories = [
+        {"id": f"category-{i}", "name": f"Category {i}", "slug": f"category-{i}"} for i in range(size.categories)
+    ]
+    _insert(db, models.Category, categories)
+    _insert(db, models.Post, [
+        {
+            "id": f"post-{i}",
+            "title": _text(rng, 6).title(),
+            "slug": f"post-{i}",
+            "excerpt": _text(rng, 30),
+            "cover_image": f"https://example.com/covers/{i}.jpg",
+            "content": _text(rng, 800),
+            "author": users[i % len(users)]["id"],
+            "category_id": categories[i % len(categories)]["id"] if categories else None,
+            "reading_time": rng.randint(2, 20),
+        }
+        for i in range(size.posts)
+    ])
+    dataset.post_slugs = [f"post-{i}" for i in range(size.posts)]
+
+    _insert(db, models.NewsletterSubscription, [
+        {
+            "id": f"subscriber-{i}",
+            "email": f"subscriber{i}@bench.example.com",
+            "is_active": rng.random() > 0.1,
+            "source": rng.choice(("homepage", "blog", "course")),
+        }
+        for i in range(size.subscribers)
+    ])
+    _insert(db, models.MarketingBanner, [
+        {
+            "id": f"banner-{i}",
+            "title": f"Banner {i}",
+            "content": _text(rng, 20),
+            "cta_text": "Learn more",
+            "cta_link": "https://example.com",
+            "is_active": i % 4 != 0,
+            "show_on_pages": None if i % 2 else ["home", "blog"],
+            "priority": rng.randint(0, 10),
+        }
+        for i in range(size.banners)
+    ])
+    dataset.banner_ids = [f"banner-{i}" for i in range(size.banners)]
+
+    db.commit()
+    return dataset
@@ -0,0 +1,61 @@
+"""
+Overhead of MetricsMiddleware per request.
+
+Drives a trivial ASGI app directly (no HTTP, no server) with and without the
+middleware and reports the difference per request.
+
+    python -m tests.bench.metrics_overhead --requests 200000
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.instrumentation import MetricsMiddleware
+
+
+class _Route:
+    path = "/api/v1/items/{item_id}"
+
+
+async def _endpoint(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"ok":true}'})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message):
+    pass
+
+
+async def _time(app, requests: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/items/1"}
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), _receive, _send)
+    return time.perf_counter() - started
+
+
+async def run(requests: int) -> None:
+    instrumented = MetricsMiddleware(_endpoint)
+    await _time(instrumented, 1000)  # warm up the label cache
+    bare = await _time(_endpoint, requests)
+    measured = await _time(instrumented, requests)
+    overhead_us = (measured - bare) / requests * 1e6
+    print(f"bare:         {bare / requests * 1e6:.2f}us/request")
+    print(f"instrumented: {measured / requests * 1e6:.2f}us/request")
+    print(f"overhead:     {overhead_us:.2f}us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Cold-start time of the API, with an import-time breakdown.
+
+Measures, over several fresh interpreters:
+
+- import time of ``app.main`` from ``python -X importtime``, with the
+  slowest modules and packages;
+- cold start: launching uvicorn until /livez answers.
+
+Exits non-zero when the median cold start exceeds --target-seconds, so the
+number can be tracked in CI.
+
+    python -m tests.bench.startup --runs 5 --output startup.json
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Cold-start budget for one uvicorn worker (process start to /livez)
+STARTUP_TARGET_SECONDS = 3.0
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    ``(module, self_us, cumulative_us)`` rows from ``-X importtime`` output.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def import_profile(runs: int, top: int) -> Dict:
+    wall = []
+    app_main = []
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    package_times: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            capture_output=True, text=True, check=True,
+        )
+        wall.append(time.perf_counter() - started)
+        rows = parse_importtime(result.stderr)
+        packages: Dict[str, int] = defaultdict(int)
+        for module, self_us, cumulative_us in rows:
+            self_times[module].append(self_us)
+            packages[module.split(".")[0]] += self_us
+            if module == "app.main":
+                app_main.append(cumulative_us)
+        for package, self_us in packages.items():
+            package_times[package].append(self_us)
+
+    def slowest(times: Dict[str, List[int]]) -> List[Dict]:
+        medians = sorted(((statistics.median(values), name) for name, values in times.items()), reverse=True)
+        return [{"name": name, "ms": round(us / 1000, 1)} for us, name in medians[:top]]
+
+    return {
+        "interpreter_and_import_s": round(statistics.median(wall), 3),
+        "app_main_import_s": round(statistics.median(app_main) / 1e6, 3),
+        "slowest_modules": slowest(self_times),
+        "slowest_packages": slowest(package_times),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _livez(port: int) -> bool:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=0.5)
+    try:
+        connection.request("GET", "/livez")
+        return connection.getresponse().status == 200
+    except OSError:
+        return False
+    finally:
+        connection.close()
+
+
+def cold_start(timeout: float) -> float:
+    port = _free_port()
+    env = {**os.environ, "DISABLE_DATABASE_CHECK_ON_STARTUP": "true"}
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with {server.returncode} before /livez answered")
+            if _livez(port):
+                return time.perf_counter() - started
+            time.sleep(0.01)
+        raise RuntimeError(f"/livez did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest modules/packages to report")
+    parser.add_argument("--target-seconds", type=float, default=STARTUP_TARGET_SECONDS)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="write the JSON results here")
+    args = parser.parse_args()
+
+    imports = import_profile(args.runs, args.top)
+    cold_starts = [cold_start(args.timeout) for _ in range(args.runs)]
+    result = {
+        "imports": imports,
+        "cold_start_s": round(statistics.median(cold_starts), 3),
+        "cold_start_runs_s": [round(seconds, 3) for seconds in cold_starts],
+        "target_s": args.target_seconds,
+    }
+
+    print(f"import app.main:  {imports['app_main_import_s']:.3f}s", file=sys.stderr)
+    print(f"cold start:       {result['cold_start_s']:.3f}s (target {args.target_seconds}s)", file=sys.stderr)
+    print("slowest modules:", file=sys.stderr)
+    for module in imports["slowest_modules"]:
+        print(f"  {module['ms']:>8.1f}ms  {module['name']}", file=sys.stderr)
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if result["cold_start_s"] > args.target_seconds:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
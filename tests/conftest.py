@@ -1,11 +1,13 @@
 import os
+from datetime import datetime, timezone
 from typing import Dict, Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from app.api import deps
 from app.core.config import settings
 from app.core.database import Base, get_db
 from app.main import app
@@ -13,11 +15,24 @@ from app.models.user import User
 from app.core.security import get_password_hash
 
 
+# Fail tests on query-budget and N+1 regressions instead of logging them
+settings.SQL_QUERY_BUDGET_STRICT = True
+
 # Use an in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+
+# The models' server defaults call NOW(), which SQLite lacks
+@event.listens_for(engine, "connect")
+def _sqlite_now(dbapi_connection, connection_record):
+    dbapi_connection.create_function(
+        "NOW", 0, lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -46,7 +61,9 @@ def client(db) -> Generator:
         finally:
             db.close()
 
+    # Endpoints depend on app.api.deps.get_db; a few older ones on the database module's
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[deps.get_db] = override_get_db
     
     with TestClient(app) as c:
         yield c
@@ -0,0 +1,92 @@
+"""
+Load test for the open/click tracking endpoints.
+
+Drives the tracking routes with concurrent clients for a fixed duration and
+reports sustained events/sec. By default the app runs in-process, which
+measures a single worker; pass --url to hit a running server instead.
+
+    python -m tests.load.tracking_load --duration 10 --concurrency 50
+    python -m tests.load.tracking_load --url http://localhost:8000
+
+Requires SECRET_KEY to match the server's when --url is used, since the
+tracking links are signed locally.
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.tracking import email_click_url, email_open_url, tracking_buffer
+
+
+def build_paths(emails: int) -> List[str]:
+    paths = []
+    for i in range(emails):
+        email_id = f"load-email-{i}"
+        delivery_id = f"load-delivery-{i}"
+        paths.append(email_open_url(email_id, delivery_id))
+        paths.append(email_click_url(email_id, delivery_id, f"https://example.com/post/{i}"))
+    return paths
+
+
+async def run(url: Optional[str], duration: float, concurrency: int, emails: int) -> None:
+    settings.PUBLIC_BASE_URL = None  # build root-relative paths
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    paths = build_paths(emails)
+
+    if url:
+        client = httpx.AsyncClient(base_url=url)
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest")
+
+    completed = 0
+    errors = 0
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def user(offset: int) -> None:
+        nonlocal completed, errors
+        i = offset
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(paths[i % len(paths)], follow_redirects=False)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code in (200, 302):
+                completed += 1
+            else:
+                errors += 1
+            i += concurrency
+
+    started = time.perf_counter()
+    async with client:
+        await asyncio.gather(*(user(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    print(f"target:       {url or 'in-process (1 worker)'}")
+    print(f"requests:     {completed} ok, {errors} errors in {elapsed:.1f}s")
+    print(f"throughput:   {completed / elapsed:,.0f} events/sec")
+    print(f"latency:      p50 {p50:.2f}ms, p99 {p99:.2f}ms")
+    if not url:
+        print(f"buffered:     {len(tracking_buffer)} events, {tracking_buffer.dropped} dropped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Base URL of a running server; defaults to in-process")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--emails", type=int, default=1000, help="Distinct emails to spread events over")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.duration, args.concurrency, args.emails))
+
+
+if __name__ == "__main__":
+    main()
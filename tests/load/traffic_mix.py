@@ -0,0 +1,346 @@
+"""
+Load test replaying a weighted mix of production-like traffic.
+
+Virtual users pick actions by weight: anonymous catalogue browsing,
+authenticated progress updates, quiz submissions and banner impressions.
+Each stage of the ramp runs a fixed number of concurrent users for
+--stage-duration seconds and reports p50/p95/p99 latency, throughput and
+error rate per route. The stage where a route stops gaining throughput is
+its saturation point.
+
+    python -m tests.load.traffic_mix --ramp 1,10,25,50 --stage-duration 10
+
+By default the app runs in-process (one worker) on a seeded temporary SQLite
+database. To compare uvicorn worker counts, run a server on a throwaway
+database and point both at it; the database is reseeded before the run:
+
+    DATABASE_URL=postgresql://localhost/load uvicorn app.main:app --workers 4
+    python -m tests.load.traffic_mix --url http://localhost:8000 \\
+        --database-url postgresql://localhost/load --label workers=4 --output w4.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from tests.bench.data import (
+    BENCH_PASSWORD,
+    WORDS,
+    Dataset,
+    DatasetSize,
+    add_dataset_arguments,
+    create_engine_for,
+    generate,
+)
+
+API = "/api/v1"
+
+# A stage counts as saturated for a route when it gained less than this much throughput
+SATURATION_GAIN = 0.05
+
+
+@dataclass
+class Action:
+    # Route template the results are reported under
+    route: str
+    weight: int
+    # (client, dataset, user, rng) -> request coroutine
+    request: Callable
+    authenticated: bool = False
+
+
+@dataclass
+class VirtualUser:
+    email: Optional[str]
+    headers: Dict[str, str]
+
+
+def _course_list(client, dataset, user, rng):
+    return client.get(f"{API}/courses/", params={"limit": 20})
+
+
+def _course_search(client, dataset, user, rng):
+    return client.get(f"{API}/courses/", params={"search": rng.choice(WORDS), "limit": 20})
+
+
+def _course_detail(client, dataset, user, rng):
+    return client.get(f"{API}/courses/{rng.choice(dataset.course_ids)}")
+
+
+def _post_list(client, dataset, user, rng):
+    pages = max(len(dataset.post_slugs) // 20, 1)
+    return client.get(f"{API}/posts/", params={"skip": rng.randrange(pages) * 20, "limit": 20})
+
+
+def _post_detail(client, dataset, user, rng):
+    return client.get(f"{API}/posts/{rng.choice(dataset.post_slugs)}")
+
+
+def _categories(client, dataset, user, rng):
+    return client.get(f"{API}/categories/")
+
+
+def _progress_update(client, dataset, user, rng):
+    return client.post(
+        f"{API}/courses/progress",
+        params={
+            "enrollment_id": rng.choice(dataset.enrollment_ids[user.email]),
+            "content_type": "lesson",
+            "content_id": rng.choice(dataset.lesson_ids),
+            "is_completed": rng.random() < 0.7,
+        },
+        headers=user.headers,
+    )
+
+
+def _quiz_submission(client, dataset, user, rng):
+    quiz_id = rng.choice(list(dataset.quiz_answers))
+    answers = {question_id: rng.choice(answer_ids) for question_id, answer_ids in dataset.quiz_answers[quiz_id].items()}
+    return client.post(
+        f"{API}/quizzes/{quiz_id}/attempts",
+        json={"quiz_id": quiz_id, "answers": answers, "time_taken": rng.randint(30, 600)},
+        headers=user.headers,
+    )
+
+
+def _banner_page(client, dataset, user, rng):
+    return client.get(f"{API}/marketing/banners/page/{rng.choice(('home', 'blog', 'courses'))}")
+
+
+def _banner_impression(client, dataset, user, rng):
+    return client.post(f"{API}/marketing/banners/{rng.choice(dataset.banner_ids)}/stats", json={"impressions": 1})
+
+
+# Weights approximate the production request mix; browsing dominates
+TRAFFIC_MIX = (
+    Action("GET /courses/", 12, _course_list),
+    Action("GET /courses/?search", 5, _course_search),
+    Action("GET /courses/{course_id}", 8, _course_detail),
+    Action("GET /posts/", 15, _post_list),
+    Action("GET /posts/{slug}", 15, _post_detail),
+    Action("GET /categories/", 5, _categories),
+    Action("POST /courses/progress", 10, _progress_update, authenticated=True),
+    Action("POST /quizzes/{quiz_id}/attempts", 5, _quiz_submission, authenticated=True),
+    Action("GET /marketing/banners/page/{page}", 15, _banner_page),
+    Action("POST /marketing/banners/{banner_id}/stats", 10, _banner_impression),
+)
+
+
+class RouteStats:
+    __slots__ = ("latencies", "errors")
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+
+        def percentile(fraction: float) -> float:
+            return round(ordered[min(int(fraction * count), count - 1)] * 1000, 2) if ordered else 0.0
+
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput": round((count - self.errors) / elapsed, 1),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+        }
+
+
+async def run_stage(
+    client: httpx.AsyncClient, dataset: Dataset, users: List[VirtualUser], mix: List[Action],
+    concurrency: int, duration: float, seed: int,
+) -> Dict[str, Dict[str, float]]:
+    stats: Dict[str, RouteStats] = defaultdict(RouteStats)
+    deadline = time.perf_counter() + duration
+
+    async def virtual_user(n: int) -> None:
+        rng = random.Random(seed * 100_000 + n)
+        # Even-numbered users are logged in (and browse too), odd ones are anonymous
+        logged_in = users[1:]
+        anonymous = n % 2 and any(not action.authenticated for action in mix)
+        user = users[0] if anonymous or not logged_in else logged_in[(n // 2) % len(logged_in)]
+        actions = [action for action in mix if user.headers or not action.authenticated] or mix
+        weights = [action.weight for action in actions]
+        while time.perf_counter() < deadline:
+            action = rng.choices(actions, weights)[0]
+            route = stats[action.route]
+            started = time.perf_counter()
+            try:
+                response = await action.request(client, dataset, user, rng)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            route.latencies.append(time.perf_counter() - started)
+            route.errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    total = RouteStats()
+    for route in stats.values():
+        total.latencies.extend(route.latencies)
+        total.errors += route.errors
+    summaries = {name: route.summary(elapsed) for name, route in sorted(stats.items())}
+    summaries["total"] = total.summary(elapsed)
+    return summaries
+
+
+def saturation_points(ramp: List[int], stages: List[Dict[str, Dict[str, float]]]) -> Dict[str, Optional[int]]:
+    """
+    Per route, the first concurrency whose throughput gain over the previous
+    stage fell under ``SATURATION_GAIN`` (or ``None`` if it kept scaling).
+    """
+    points = {}
+    for route in stages[-1]:
+        points[route] = None
+        for index in range(1, len(stages)):
+            before = stages[index - 1].get(route, {}).get("throughput", 0.0)
+            after = stages[index].get(route, {}).get("throughput", 0.0)
+            if before and after < before * (1 + SATURATION_GAIN):
+                points[route] = ramp[index]
+                break
+    return points
+
+
+async def _log_in(client: httpx.AsyncClient, dataset: Dataset, count: int) -> List[VirtualUser]:
+    users = [VirtualUser(email=None, headers={})]  # anonymous browsers
+    for email in list(dataset.enrollment_ids)[:count]:
+        response = await client.post(f"{API}/auth/login", data={"username": email, "password": BENCH_PASSWORD})
+        response.raise_for_status()
+        users.append(VirtualUser(email=email, headers={"Authorization": f"Bearer {response.json()['access_token']}"}))
+    return users
+
+
+def _print_stage(concurrency: int, summaries: Dict[str, Dict[str, float]]) -> None:
+    print(f"\nconcurrency {concurrency}", file=sys.stderr)
+    print(f"  {'route':<42} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}", file=sys.stderr)
+    for route, summary in summaries.items():
+        print(
+            f"  {route:<42} {summary['throughput']:>8.1f} {summary['p50_ms']:>7.1f}ms {summary['p95_ms']:>7.1f}ms "
+            f"{summary['p99_ms']:>7.1f}ms {summary['error_rate']:>6.1%}",
+            file=sys.stderr,
+        )
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("app.core.query_profiler").setLevel(logging.ERROR)
+    size = DatasetSize(**{name: getattr(args, name) for name in DatasetSize().as_dict()})
+    mix = [action for action in TRAFFIC_MIX if not args.only or action.route in args.only]
+
+    engine = create_engine_for(args.database_url)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = Session()
+    try:
+        dataset = generate(db, size, seed=args.seed)
+    finally:
+        db.close()
+
+    if args.url:
+        engine.dispose()
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    else:
+        from app.api import deps
+        from app.main import app
+
+        def get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[deps.get_db] = get_db
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://loadtest",
+            timeout=args.timeout,
+        )
+
+    stages = []
+    try:
+        async with client:
+            users = await _log_in(client, dataset, args.logged_in_users)
+            for index, concurrency in enumerate(args.ramp):
+                summaries = await run_stage(
+                    client, dataset, users, mix, concurrency, args.stage_duration, args.seed + index
+                )
+                _print_stage(concurrency, summaries)
+                stages.append(summaries)
+    finally:
+        if not args.url:
+            Base.metadata.drop_all(bind=engine)
+            engine.dispose()
+
+    saturation = saturation_points(args.ramp, stages)
+    print("\nsaturation (concurrency where throughput stopped growing):", file=sys.stderr)
+    for route, point in saturation.items():
+        print(f"  {route:<42} {point if point is not None else 'not reached'}", file=sys.stderr)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "in-process (1 worker)",
+        "label": args.label,
+        "database": engine.dialect.name,
+        "dataset": size.as_dict(),
+        "stage_duration": args.stage_duration,
+        "stages": [{"concurrency": c, "routes": s} for c, s in zip(args.ramp, stages)],
+        "saturation": saturation,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Base URL of a running server; defaults to in-process")
+    parser.add_argument("--database-url", help="Database to seed; required with --url, else a temporary SQLite file")
+    parser.add_argument(
+        "--ramp", type=lambda value: [int(n) for n in value.split(",")], default=[1, 10, 25, 50],
+        help="Comma-separated concurrency per stage",
+    )
+    parser.add_argument("--stage-duration", type=float, default=10.0)
+    parser.add_argument(
+        "--only", action="append", choices=[action.route for action in TRAFFIC_MIX], metavar="ROUTE",
+        help="Repeatable; drive only these routes, to find one endpoint's saturation point",
+    )
+    parser.add_argument("--logged-in-users", type=int, default=10, help="Users logged in for authenticated actions")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--label", help="Free-form tag stored in the results, e.g. workers=4")
+    parser.add_argument("--output", help="Write JSON results here")
+    parser.add_argument("--seed", type=int, default=0)
+    add_dataset_arguments(parser)
+    parser.set_defaults(posts=2000, users=200, subscribers=1000)
+    args = parser.parse_args()
+    if args.url and not args.database_url:
+        parser.error("--url needs --database-url: the server's (throwaway) database to seed")
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.database_url is None:
+            args.database_url = f"sqlite:///{os.path.join(directory, 'load.db')}"
+        result = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -57,7 +57,7 @@ def test_register_existing_email(client: TestClient, normal_user_token_headers)
     """
     data = {
         "email": "user@example.com",  # This email already exists
-        "username": "different_user",
+        "username": "differentuser",
         "password": "password123",
         "first_name": "Different",
         "last_name": "User",
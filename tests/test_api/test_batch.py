@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.crud.catalogue import catalogue_card_cache
+from app.models.category import Category
+from app.models.post import Post
+from app.schemas.catalogue import MAX_BATCH_IDS
+
+
+@pytest.fixture(autouse=True)
+def clear_card_cache():
+    catalogue_card_cache.clear()
+    yield
+    catalogue_card_cache.clear()
+
+
+@pytest.fixture
+def posts(db):
+    db.add(Category(id="category-1", name="Tech", slug="tech"))
+    db.add_all([
+        Post(
+            id=f"post-{i}",
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            excerpt="Excerpt",
+            cover_image="https://example.com/cover.jpg",
+            content="Content",
+            author="author-1",
+            category_id="category-1",
+            reading_time=5,
+        )
+        for i in range(3)
+    ])
+    db.commit()
+
+
+def test_batch_get_preserves_order_and_reports_missing(client: TestClient, posts) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/batch/get",
+        json={"posts": ["post-2", "nope", "post-0", "post-2"], "courses": ["no-course"]},
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert [post["id"] for post in body["posts"]] == ["post-2", "post-0"]
+    assert body["courses"] == []
+    assert body["missing"] == {"courses": ["no-course"], "posts": ["nope"], "series": [], "booklets": []}
+
+
+def test_batch_get_rejects_too_many_ids(client: TestClient) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/batch/get",
+        json={"posts": [f"post-{i}" for i in range(MAX_BATCH_IDS + 1)]},
+    )
+    assert r.status_code == 422
@@ -0,0 +1,88 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.models.quiz import Quiz, QuizAnswer, QuizQuestion
+from app.utils.quiz_delivery import quiz_blob_cache
+
+
+@pytest.fixture
+def quiz(db):
+    quiz_blob_cache.clear()
+    db.add(Quiz(id="quiz-1", title="Basics", content_type="lesson", content_id="lesson-1"))
+    db.add(QuizQuestion(
+        id="question-1", quiz_id="quiz-1", question_text="2 + 2?", question_type="multiple_choice",
+        explanation="Arithmetic", order=0,
+    ))
+    db.add_all([
+        QuizAnswer(id="answer-1", question_id="question-1", answer_text="4", is_correct=True, order=0),
+        QuizAnswer(id="answer-2", question_id="question-1", answer_text="5", is_correct=False, order=1),
+    ])
+    db.commit()
+    yield
+    quiz_blob_cache.clear()
+
+
+def _keys(value):
+    if isinstance(value, dict):
+        return set(value) | set().union(*(_keys(item) for item in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_keys(item) for item in value))
+    return set()
+
+
+def test_learner_quiz_has_no_answer_key(client: TestClient, normal_user_token_headers, quiz) -> None:
+    r = client.get(f"{settings.API_V1_STR}/quizzes/quiz-1", headers=normal_user_token_headers)
+    assert r.status_code == 200
+    body = r.json()
+    assert [answer["id"] for answer in body["questions"][0]["answers"]] == ["answer-1", "answer-2"]
+    assert not {"is_correct", "explanation"} & _keys(body)
+
+    r = client.get(f"{settings.API_V1_STR}/quizzes/", headers=normal_user_token_headers)
+    assert r.status_code == 200
+    assert [item["id"] for item in r.json()] == ["quiz-1"]
+    assert "questions" not in r.json()[0]
+
+
+def test_superuser_quiz_has_answer_key(client: TestClient, superuser_token_headers, quiz) -> None:
+    r = client.get(f"{settings.API_V1_STR}/quizzes/quiz-1", headers=superuser_token_headers)
+    assert r.status_code == 200
+    answers = r.json()["questions"][0]["answers"]
+    assert {answer["id"]: answer["is_correct"] for answer in answers} == {"answer-1": True, "answer-2": False}
+
+    r = client.get(f"{settings.API_V1_STR}/quizzes/", headers=superuser_token_headers)
+    assert r.json()[0]["questions"][0]["answers"][0]["is_correct"] is True
+
+
+def test_learners_cannot_edit_quizzes(client: TestClient, normal_user_token_headers, quiz) -> None:
+    r = client.put(f"{settings.API_V1_STR}/quizzes/quiz-1", headers=normal_user_token_headers, json={})
+    assert r.status_code == 400
+    r = client.put(
+        f"{settings.API_V1_STR}/quizzes/questions/question-1", headers=normal_user_token_headers, json={}
+    )
+    assert r.status_code == 400
+
+
+def test_quiz_documents_are_superuser_only(
+    client: TestClient, normal_user_token_headers, superuser_token_headers, quiz
+) -> None:
+    url = f"{settings.API_V1_STR}/quizzes/quiz-1/document"
+    r = client.get(url, headers=normal_user_token_headers)
+    assert r.status_code == 400
+
+    r = client.get(url, headers=superuser_token_headers)
+    assert r.status_code == 200
+    document = r.json()
+    assert document["questions"][0]["answers"][0]["is_correct"] is True
+
+    r = client.put(url, headers=normal_user_token_headers, json=document)
+    assert r.status_code == 400
+    r = client.post(f"{settings.API_V1_STR}/quizzes/import", headers=normal_user_token_headers, json=document)
+    assert r.status_code == 400
+
+    # The first put records the exported client IDs; putting it again changes nothing
+    r = client.put(url, headers=superuser_token_headers, json=document)
+    assert r.status_code == 200
+    r = client.put(url, headers=superuser_token_headers, json=document)
+    assert r.status_code == 200
+    assert (r.json()["questions_updated"], r.json()["answers_updated"]) == (0, 0)
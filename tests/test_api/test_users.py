@@ -3,7 +3,9 @@ from fastapi.testclient import TestClient
 from app.core.config import settings
 
 
-def test_get_users_superuser(client: TestClient, superuser_token_headers) -> None:
+def test_get_users_superuser(
+    client: TestClient, superuser_token_headers, normal_user_token_headers
+) -> None:
     """
     Test that a superuser can get the list of users
     """
@@ -57,7 +59,9 @@ def test_update_user_me(client: TestClient, normal_user_token_headers) -> None:
     assert updated_user["last_name"] == data["last_name"]
 
 
-def test_get_user_by_id_superuser(client: TestClient, superuser_token_headers) -> None:
+def test_get_user_by_id_superuser(
+    client: TestClient, superuser_token_headers, normal_user_token_headers
+) -> None:
     """
     Test that a superuser can get another user's information
     """
@@ -82,7 +86,9 @@ def test_get_user_by_id_normal_user(client: TestClient, normal_user_token_header
     assert r.status_code == 400  # Not enough permissions
 
 
-def test_update_user_superuser(client: TestClient, superuser_token_headers) -> None:
+def test_update_user_superuser(
+    client: TestClient, superuser_token_headers, normal_user_token_headers
+) -> None:
     """
     Test that a superuser can update another user's information
     """
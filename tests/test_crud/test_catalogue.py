@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.query_profiler import count_queries
+from app.crud.catalogue import catalogue_card_cache, get_cards
+from app.models.category import Category
+from app.models.post import Post
+
+
+@pytest.fixture(autouse=True)
+def clear_card_cache():
+    catalogue_card_cache.clear()
+    yield
+    catalogue_card_cache.clear()
+
+
+def _posts(db: Session, count: int) -> None:
+    db.add(Category(id="category-1", name="Tech", slug="tech"))
+    db.add_all([
+        Post(
+            id=f"post-{i}",
+            title=f"Post {i}",
+            slug=f"post-{i}",
+            excerpt="Excerpt",
+            cover_image="https://example.com/cover.jpg",
+            content="Content",
+            author="author-1",
+            category_id="category-1",
+            reading_time=5,
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def test_get_many_keeps_order_and_collapses_duplicates(db: Session) -> None:
+    _posts(db, 3)
+
+    with count_queries() as stats:
+        posts = crud.post.get_many(db, ["post-2", "post-0", "post-2", "missing", "post-1"])
+
+    assert [p.id for p in posts] == ["post-2", "post-0", "post-1"]
+    assert stats.queries == 1
+    assert crud.post.get_many(db, []) == []
+
+
+def test_get_cards_reports_missing_ids_in_request_order(db: Session) -> None:
+    _posts(db, 2)
+
+    cards, missing = get_cards(db, entity_type="posts", ids=["post-1", "gone", "post-0", "post-1", "gone"])
+
+    assert [card["id"] for card in cards] == ["post-1", "post-0"]
+    assert cards[0]["category"] == "category-1"
+    assert missing == ["gone"]
+
+
+def test_cached_cards_are_served_without_a_query(db: Session) -> None:
+    _posts(db, 2)
+    get_cards(db, entity_type="posts", ids=["post-0", "post-1"])
+
+    with count_queries() as stats:
+        cards, missing = get_cards(db, entity_type="posts", ids=["post-1", "post-0"])
+
+    assert stats.queries == 0
+    assert [card["id"] for card in cards] == ["post-1", "post-0"]
+    assert missing == []
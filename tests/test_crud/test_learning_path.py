@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.query_profiler import count_queries
+from app.crud.learning_path import learning_path_details
+from app.models.learning_path import LearningPath, LearningPathContentItem, LearningPathModule
+from app.schemas.learning_path import LearningPathContentItemUpdate, LearningPathResourceCreate
+
+
+@pytest.fixture(autouse=True)
+def clear_details_cache():
+    learning_path_details.cache.clear()
+    yield
+    learning_path_details.cache.clear()
+
+
+def _seed(db: Session) -> None:
+    db.add(LearningPath(id="path-1", title="Python", slug="python"))
+    db.add(LearningPathModule(id="module-1", title="Basics", learning_path_id="path-1"))
+    db.add(LearningPathContentItem(id="item-1", title="Variables", type="article", module_id="module-1"))
+    db.commit()
+
+
+def test_details_are_loaded_in_four_queries_and_cached(db: Session) -> None:
+    _seed(db)
+
+    with count_queries() as stats:
+        details = crud.learning_path.get_details_by_slug(db, slug="python")
+    assert stats.queries == 5  # version check, path, modules, content items, resources
+    assert details["modules"][0]["content_items"][0]["title"] == "Variables"
+
+    with count_queries() as stats:
+        assert crud.learning_path.get_details_by_slug(db, slug="python") == details
+    assert stats.queries == 1
+    assert crud.learning_path.get_details_by_slug(db, slug="missing") is None
+
+
+def test_child_edits_bump_the_version(db: Session) -> None:
+    _seed(db)
+    crud.learning_path.get_details_by_slug(db, slug="python")
+
+    item = crud.learning_path_content_item.get(db, id="item-1")
+    crud.learning_path_content_item.update(db, db_obj=item, obj_in=LearningPathContentItemUpdate(title="Names"))
+    details = crud.learning_path.get_details_by_slug(db, slug="python")
+    assert details["modules"][0]["content_items"][0]["title"] == "Names"
+
+    crud.learning_path_resource.create(
+        db,
+        obj_in=LearningPathResourceCreate(
+            title="Docs",
+            description="Reference",
+            type="documentation",
+            url="https://docs.python.org",
+            learning_path_id="path-1",
+        ),
+    )
+    assert [r["title"] for r in crud.learning_path.get_details_by_slug(db, slug="python")["resources"]] == ["Docs"]
+
+    crud.learning_path_module.remove(db, id="module-1")
+    assert crud.learning_path.get_details_by_slug(db, slug="python")["modules"] == []
+    assert db.get(LearningPath, "path-1").version == 4
+
+
+def test_edits_from_another_worker_are_seen(db: Session) -> None:
+    _seed(db)
+    crud.learning_path.get_details_by_slug(db, slug="python")
+
+    # Another worker's cache isn't touched; only the row's version changes
+    db.query(LearningPath).filter(LearningPath.id == "path-1").update(
+        {"title": "Python 3", "version": LearningPath.version + 1}
+    )
+    db.commit()
+    assert crud.learning_path.get_details_by_slug(db, slug="python")["title"] == "Python 3"
+
+
+def test_reused_slug_is_not_served_from_the_old_cache(db: Session) -> None:
+    _seed(db)
+    assert crud.learning_path.get_details_by_slug(db, slug="python")["title"] == "Python"
+
+    # A new path at version 1 takes over the slug of a deleted one at version 1
+    db.query(LearningPathContentItem).delete()
+    db.query(LearningPathModule).delete()
+    db.query(LearningPath).delete()
+    db.commit()
+    db.add(LearningPath(id="path-2", title="Python, again", slug="python"))
+    db.commit()
+
+    details = crud.learning_path.get_details_by_slug(db, slug="python")
+    assert (details["id"], details["title"], details["modules"]) == ("path-2", "Python, again", [])
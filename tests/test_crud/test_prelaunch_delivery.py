@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models.prelaunch import (
+    CoursePrelaunchCampaign,
+    PrelaunchEmail,
+    PrelaunchEmailDelivery,
+    PrelaunchEmailSequence,
+    PrelaunchSubscriber,
+)
+
+
+def _seed(db: Session) -> None:
+    db.add_all([
+        CoursePrelaunchCampaign(id="campaign-1", title="Launch", slug="launch"),
+        PrelaunchEmailSequence(id="sequence-1", campaign_id="campaign-1", title="Welcome"),
+        PrelaunchEmail(id="email-1", sequence_id="sequence-1", subject="Hi", body="Hello", delay_days=0),
+        PrelaunchSubscriber(
+            id="subscriber-1",
+            email="ada@example.com",
+            campaign_id="campaign-1",
+            subscribed_at=datetime.now(timezone.utc) - timedelta(days=1),
+        ),
+    ])
+    db.commit()
+
+
+def _age_claim(db: Session, seconds: int) -> None:
+    db.query(PrelaunchEmailDelivery).update(
+        {"claimed_at": datetime.now(timezone.utc) - timedelta(seconds=seconds)}
+    )
+    db.commit()
+
+
+def test_claim_is_not_reclaimed_within_lease(db: Session) -> None:
+    _seed(db)
+    delivery_crud = crud.prelaunch_email_delivery
+
+    assert len(delivery_crud.claim_due(db, lease_seconds=900)) == 1
+    assert delivery_crud.claim_due(db, lease_seconds=900) == []
+
+
+def test_crash_after_claim_is_retried_after_lease(db: Session) -> None:
+    _seed(db)
+    delivery_crud = crud.prelaunch_email_delivery
+
+    claimed = delivery_crud.claim_due(db, max_attempts=2, lease_seconds=900)
+    assert [row["subscriber_id"] for row in claimed] == ["subscriber-1"]
+    # The dispatcher dies here: nothing is sent and no result is recorded
+
+    _age_claim(db, 901)
+    reclaimed = delivery_crud.claim_due(db, max_attempts=2, lease_seconds=900)
+    assert [row["delivery_id"] for row in reclaimed] == [claimed[0]["delivery_id"]]
+    delivery = db.query(PrelaunchEmailDelivery).one()
+    db.refresh(delivery)
+    assert (delivery.status, delivery.attempts, delivery.error) == ("pending", 2, None)
+
+    # A second crash uses up the last attempt: the delivery fails for good
+    _age_claim(db, 901)
+    assert delivery_crud.claim_due(db, max_attempts=2, lease_seconds=900) == []
+    db.refresh(delivery)
+    assert (delivery.status, delivery.attempts) == ("failed", 2)
+    assert "expired" in delivery.error
+
+
+def test_record_results_stores_aware_sent_at(db: Session) -> None:
+    _seed(db)
+    delivery_crud = crud.prelaunch_email_delivery
+    claimed = delivery_crud.claim_due(db, lease_seconds=900)
+
+    before = datetime.now(timezone.utc)
+    delivery_crud.record_results(db, results=[
+        {"delivery_id": claimed[0]["delivery_id"], "email_id": "email-1", "status": "sent", "error": None}
+    ])
+
+    delivery = db.query(PrelaunchEmailDelivery).one()
+    assert delivery.status == "sent"
+    assert delivery.sent_at.replace(tzinfo=timezone.utc) >= before.replace(microsecond=0)
+    assert db.get(PrelaunchEmail, "email-1").sent_count == 1
+    assert delivery_crud.claim_due(db, lease_seconds=0) == []
@@ -0,0 +1,24 @@
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models.prelaunch import CoursePrelaunchCampaign, PrelaunchSubscriber
+from app.schemas.prelaunch import PrelaunchSubscriberCreate
+
+
+def test_import_matches_a_signup_with_the_same_address(db: Session) -> None:
+    db.add(CoursePrelaunchCampaign(id="campaign-1", title="Launch", slug="launch"))
+    db.commit()
+    crud.prelaunch_subscriber.create(
+        db, obj_in=PrelaunchSubscriberCreate(email="Jane@Example.com", campaign_id="campaign-1")
+    )
+
+    stats = crud.prelaunch_subscriber.bulk_import(
+        db,
+        campaign_id="campaign-1",
+        rows=[{"email": " Jane@example.com"}, {"email": "Jane@EXAMPLE.COM"}, {"email": "ada@example.com"}],
+    )
+
+    assert (stats["inserted"], stats["skipped"]) == (1, 2)
+    assert sorted(email for (email,) in db.query(PrelaunchSubscriber.email)) == [
+        "Jane@example.com", "ada@example.com"
+    ]
@@ -0,0 +1,121 @@
+from typing import Any, Dict
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models.quiz import Quiz, QuizAnswer, QuizQuestion
+from app.schemas.quiz import QuizDocument
+
+NO_CHANGES = {
+    "questions_created": 0,
+    "questions_updated": 0,
+    "questions_deleted": 0,
+    "answers_created": 0,
+    "answers_updated": 0,
+    "answers_deleted": 0,
+}
+
+
+def _document(**overrides: Any) -> Dict[str, Any]:
+    return {
+        "title": "Basics",
+        "content_type": "lesson",
+        "content_id": "lesson-1",
+        "questions": [
+            {
+                "client_id": "q1",
+                "question_text": "2 + 2?",
+                "question_type": "multiple_choice",
+                "answers": [
+                    {"client_id": "q1-a", "answer_text": "4", "is_correct": True},
+                    {"client_id": "q1-b", "answer_text": "5"},
+                ],
+            },
+            {
+                "client_id": "q2",
+                "question_text": "The sky is blue",
+                "question_type": "true_false",
+                "answers": [
+                    {"client_id": "q2-a", "answer_text": "True", "is_correct": True},
+                    {"client_id": "q2-b", "answer_text": "False"},
+                ],
+            },
+        ],
+        **overrides,
+    }
+
+
+def _import(db: Session, document: Dict[str, Any]) -> Dict[str, Any]:
+    return crud.quiz.import_document(db, document=QuizDocument(**document))
+
+
+def _counts(result: Dict[str, Any]) -> Dict[str, int]:
+    return {key: result[key] for key in NO_CHANGES}
+
+
+def test_import_creates_quiz(db: Session) -> None:
+    result = _import(db, _document())
+
+    assert _counts(result) == {**NO_CHANGES, "questions_created": 2, "answers_created": 4}
+    quiz = db.get(Quiz, result["quiz_id"])
+    assert quiz.content_id == "lesson-1"
+    assert [q.client_id for q in sorted(quiz.questions, key=lambda q: q.order)] == ["q1", "q2"]
+
+
+def test_reimport_is_a_no_op(db: Session) -> None:
+    first = _import(db, _document())
+    second = _import(db, _document())
+
+    assert second["quiz_id"] == first["quiz_id"]
+    assert second["version"] == first["version"]
+    assert _counts(second) == NO_CHANGES
+    assert db.query(QuizQuestion).count() == 2
+    assert db.query(QuizAnswer).count() == 4
+
+
+def test_apply_updates_inserts_and_deletes_by_client_id(db: Session) -> None:
+    first = _import(db, _document())
+    quiz = db.get(Quiz, first["quiz_id"])
+    q1_id = db.query(QuizQuestion).filter_by(client_id="q1").one().id
+    kept_answer_id = db.query(QuizAnswer).filter_by(client_id="q1-a").one().id
+
+    document = _document()
+    q1 = document["questions"][0]
+    q1["question_text"] = "Two plus two?"
+    q1["answers"] = [
+        {"client_id": "q1-a", "answer_text": "4", "is_correct": True},
+        {"client_id": "q1-c", "answer_text": "22"},
+    ]
+    document["questions"] = [
+        q1,
+        {"client_id": "q3", "question_text": "Pick one", "question_type": "multiple_choice", "answers": []},
+    ]
+    result = crud.quiz.apply_document(db, quiz=quiz, document=QuizDocument(**document))
+
+    assert _counts(result) == {
+        "questions_created": 1,
+        "questions_updated": 1,
+        "questions_deleted": 1,
+        "answers_created": 1,
+        "answers_updated": 0,
+        # q1-b, plus both answers of the deleted q2
+        "answers_deleted": 3,
+    }
+    assert result["version"] == first["version"] + 1
+    questions = {q.client_id: q for q in db.query(QuizQuestion).all()}
+    assert set(questions) == {"q1", "q3"}
+    assert questions["q1"].id == q1_id
+    assert questions["q1"].question_text == "Two plus two?"
+    assert {a.client_id: a.id for a in db.query(QuizAnswer).all()} == {
+        "q1-a": kept_answer_id,
+        "q1-c": db.query(QuizAnswer).filter_by(client_id="q1-c").one().id,
+    }
+
+
+def test_duplicate_client_ids_are_rejected(db: Session) -> None:
+    document = _document()
+    document["questions"][1]["client_id"] = "q1"
+
+    with pytest.raises(ValueError):
+        _import(db, document)
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.models.quiz import Quiz, QuizAnswer, QuizQuestion, QuizStat, QuizStatBackfill, UserQuizAttempt
+from app.schemas.quiz import UserQuizAttemptCreate
+from app.utils import quiz_analytics
+from app.utils.quiz_grading import answer_key_cache
+
+
+def _seed(db: Session) -> Quiz:
+    answer_key_cache.clear()
+    quiz = Quiz(id="quiz-1", title="Basics", content_type="lesson", content_id="lesson-1")
+    db.add(quiz)
+    db.add(QuizQuestion(id="question-1", quiz_id="quiz-1", question_text="2 + 2?", question_type="multiple_choice"))
+    db.add_all([
+        QuizAnswer(id="answer-1", question_id="question-1", answer_text="4", is_correct=True),
+        QuizAnswer(id="answer-2", question_id="question-1", answer_text="5", is_correct=False),
+    ])
+    db.commit()
+    for i, answer_id in enumerate(["answer-1", "answer-2", "answer-1", "answer-1"]):
+        crud.user_quiz_attempt.create_graded(
+            db,
+            quiz=quiz,
+            obj_in=UserQuizAttemptCreate(quiz_id="quiz-1", answers={"question-1": answer_id}, time_taken=30 + i),
+            user_id="user-1",
+        )
+    # Three attempts predate the backfill; the last one is still settling
+    attempts = db.query(UserQuizAttempt).order_by(UserQuizAttempt.id).all()
+    for attempt in attempts[:3]:
+        attempt.started_at = datetime.now(timezone.utc) - timedelta(days=1)
+    db.commit()
+    return quiz
+
+
+def _stats(db: Session):
+    return {(s.metric, s.key): s.count for s in db.query(QuizStat).filter(QuizStat.quiz_id == "quiz-1")}
+
+
+def test_backfill_rebuilds_rollups(db: Session) -> None:
+    _seed(db)
+    expected = _stats(db)
+    assert expected[(quiz_analytics.ATTEMPTS, "")] == 4
+
+    db.query(QuizStat).update({"count": 99})
+    db.commit()
+
+    assert crud.quiz_stat.backfill(db, quiz_id="quiz-1", batch_size=1) == 4
+    assert _stats(db) == expected
+    assert db.query(QuizStatBackfill).count() == 0
+
+
+def test_failed_backfill_keeps_old_rollups(db: Session, monkeypatch) -> None:
+    _seed(db)
+    expected = _stats(db)
+    attempt_counters = quiz_analytics.attempt_counters
+    calls = []
+
+    def fail_on_second_batch(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        return attempt_counters(*args, **kwargs)
+
+    monkeypatch.setattr(quiz_analytics, "attempt_counters", fail_on_second_batch)
+    with pytest.raises(RuntimeError):
+        crud.quiz_stat.backfill(db, batch_size=1)
+    db.rollback()
+
+    # The first batch was committed to staging; readers still see the old rollups
+    assert db.query(QuizStatBackfill).filter(QuizStatBackfill.metric == quiz_analytics.ATTEMPTS).one().count == 1
+    assert _stats(db) == expected
+
+    monkeypatch.setattr(quiz_analytics, "attempt_counters", attempt_counters)
+    assert crud.quiz_stat.backfill(db, batch_size=1) == 4
+    assert _stats(db) == expected
+    assert db.query(QuizStatBackfill).count() == 0
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.crud.series import series_details
+from app.models.series import Author
+from app.schemas.series import SeriesCreate, SeriesUpdate
+
+
+@pytest.fixture(autouse=True)
+def clear_details_cache():
+    series_details.cache.clear()
+    yield
+    series_details.cache.clear()
+
+
+def _series(db: Session, title: str, slug: str = "x"):
+    return crud.series.create(db, obj_in=SeriesCreate(title=title, slug=slug, author_id="author-1"))
+
+
+def test_recreated_slug_is_not_served_from_the_old_cache(db: Session) -> None:
+    db.add(Author(id="author-1", name="Ada"))
+    db.commit()
+    old = _series(db, "Old")
+    assert crud.series.get_details_by_slug(db, slug="x")["title"] == "Old"
+
+    # Both roots are at version 1; only the ID tells them apart
+    crud.series.remove(db, id=old.id)
+    _series(db, "New")
+    assert crud.series.get_details_by_slug(db, slug="x")["title"] == "New"
+
+
+def test_renamed_slug_is_not_served_from_the_old_cache(db: Session) -> None:
+    db.add(Author(id="author-1", name="Ada"))
+    db.commit()
+    old = _series(db, "Old")
+    assert crud.series.get_details_by_slug(db, slug="x")["title"] == "Old"
+
+    crud.series.update(db, db_obj=old, obj_in=SeriesUpdate(slug="old"))
+    _series(db, "New")
+    assert crud.series.get_details_by_slug(db, slug="x")["title"] == "New"
+    assert crud.series.get_details_by_slug(db, slug="old")["title"] == "Old"
@@ -20,7 +20,7 @@ def test_create_user(db: Session) -> None:
 
 def test_authenticate_user(db: Session) -> None:
     email = "test-auth@example.com"
-    username = "test-auth"
+    username = "testauth"
     password = "password"
     user_in = UserCreate(email=email, username=username, password=password)
     user = crud.user.create(db, obj_in=user_in)
@@ -31,7 +31,7 @@ def test_authenticate_user(db: Session) -> None:
 
 def test_not_authenticate_user(db: Session) -> None:
     email = "test-auth2@example.com"
-    username = "test-auth2"
+    username = "testauth2"
     password = "password"
     user_in = UserCreate(email=email, username=username, password=password)
     crud.user.create(db, obj_in=user_in)
@@ -41,7 +41,7 @@ def test_not_authenticate_user(db: Session) -> None:
 
 def test_get_user(db: Session) -> None:
     email = "test-get@example.com"
-    username = "test-get"
+    username = "testget"
     password = "password"
     user_in = UserCreate(email=email, username=username, password=password)
     user = crud.user.create(db, obj_in=user_in)
@@ -54,7 +54,7 @@ def test_get_user(db: Session) -> None:
 
 def test_update_user(db: Session) -> None:
     email = "test-update@example.com"
-    username = "test-update"
+    username = "testupdate"
     password = "password"
     user_in = UserCreate(email=email, username=username, password=password)
     user = crud.user.create(db, obj_in=user_in)
@@ -0,0 +1,26 @@
+import pytest
+
+from app.utils.award_rules import (
+    COURSE_COMPLETED, POINTS_CHANGED, QUIZ_PASSED, compile_requirements, triggered_by
+)
+
+
+def test_empty_requirements_are_manual_only():
+    assert compile_requirements({}) is None
+    assert compile_requirements(None) is None
+
+
+@pytest.mark.parametrize(
+    "requirements",
+    [{"unknown": 1}, {"min_points": -1}, {"min_level": "3"}, {"quiz_ids": []}, {"course_ids": "abc"}],
+)
+def test_invalid_requirements_are_rejected(requirements):
+    with pytest.raises(ValueError):
+        compile_requirements(requirements)
+
+
+def test_triggered_by_events():
+    assert triggered_by({"min_passed_quizzes": 1}, QUIZ_PASSED)
+    assert not triggered_by({"min_passed_quizzes": 1}, COURSE_COMPLETED)
+    assert triggered_by({"min_points": 100}, POINTS_CHANGED)
+    assert not triggered_by({}, QUIZ_PASSED)
@@ -0,0 +1,27 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_lru_eviction_and_invalidate():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_entries_expire():
+    cache = TTLCache(ttl=60)
+    cache.set("short", "value", ttl=0.01)
+    cache.set("long", "value")
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get("long") == "value"
@@ -0,0 +1,47 @@
+import asyncio
+
+from app.core.email import EmailTransport
+from app.utils.drip_dispatcher import render_delivery, send_deliveries
+
+
+class RecordingTransport(EmailTransport):
+    def __init__(self, fail_for=()):
+        self.sent = []
+        self.fail_for = set(fail_for)
+
+    def send(self, message):
+        if message["To"] in self.fail_for:
+            raise RuntimeError("rejected")
+        self.sent.append(message)
+
+
+def make_delivery(delivery_id, to, name=None):
+    return {
+        "delivery_id": delivery_id,
+        "email_id": "email-1",
+        "subscriber_id": f"sub-{delivery_id}",
+        "to": to,
+        "name": name,
+        "subject": "Welcome $name",
+        "body": "<style>p { color: red; }</style><p>Sent to $email ${unknown}</p>",
+    }
+
+
+def test_render_delivery_substitutes_placeholders():
+    rendered = render_delivery(make_delivery("d1", "ada@example.com", name="Ada"))
+    assert rendered["subject"] == "Welcome Ada"
+    assert rendered["body"] == "<style>p { color: red; }</style><p>Sent to ada@example.com ${unknown}</p>"
+
+
+def test_send_deliveries_records_failures():
+    transport = RecordingTransport(fail_for={"bad@example.com"})
+    deliveries = [
+        make_delivery("d1", "a@example.com"),
+        make_delivery("d2", "bad@example.com"),
+        make_delivery("d3", "c@example.com"),
+    ]
+    results = asyncio.run(send_deliveries(transport, deliveries, concurrency=2))
+
+    statuses = {result["delivery_id"]: result["status"] for result in results}
+    assert statuses == {"d1": "sent", "d2": "failed", "d3": "sent"}
+    assert sorted(message["To"] for message in transport.sent) == ["a@example.com", "c@example.com"]
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from app.core.health import ReadinessProbe
+
+
+def test_result_is_cached_for_ttl():
+    calls = []
+    probe = ReadinessProbe(lambda: calls.append(1), ttl=60, timeout=1)
+
+    async def probe_many():
+        return await asyncio.gather(*(probe.status() for _ in range(5)))
+
+    results = asyncio.run(probe_many())
+    assert all(result == {"status": "ready", "database": "ok"} for result in results)
+    asyncio.run(probe.status())
+    assert calls == [1]
+
+
+def test_failures_and_timeouts_are_unavailable():
+    def broken():
+        raise RuntimeError("connection refused")
+
+    assert asyncio.run(ReadinessProbe(broken, ttl=60, timeout=1).status()) == {
+        "status": "unavailable", "database": "error"
+    }
+    slow = ReadinessProbe(lambda: time.sleep(0.2), ttl=60, timeout=0.01)
+    assert asyncio.run(slow.status()) == {"status": "unavailable", "database": "timeout"}
+
+
+def test_check_reruns_after_ttl():
+    state = {"up": False}
+
+    def check():
+        if not state["up"]:
+            raise RuntimeError("down")
+
+    probe = ReadinessProbe(check, ttl=0.01, timeout=1)
+    assert asyncio.run(probe.status())["status"] == "unavailable"
+    state["up"] = True
+    time.sleep(0.02)
+    assert asyncio.run(probe.status())["status"] == "ready"
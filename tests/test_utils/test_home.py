@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from pydantic import BaseModel
+
+from app.utils.home import HomeAggregator, HomeSection, encode_payload, etag_matches
+
+
+class Item(BaseModel):
+    id: str
+
+
+def fast(db, logged_in):
+    return [{"id": "in" if logged_in else "out"}]
+
+
+def test_sections_are_cached_per_audience():
+    calls = []
+
+    def counted(db, logged_in):
+        calls.append(logged_in)
+        return fast(db, logged_in)
+
+    aggregator = HomeAggregator([HomeSection("items", 60, counted, Item, per_audience=True)])
+    assert asyncio.run(aggregator.build(logged_in=False, timeout=1)) == {"items": [{"id": "out"}], "degraded": []}
+    asyncio.run(aggregator.build(logged_in=False, timeout=1))
+    assert asyncio.run(aggregator.build(logged_in=True, timeout=1))["items"] == [{"id": "in"}]
+    assert calls == [False, True]
+
+
+def test_slow_section_degrades_to_last_good_copy():
+    delay = {"seconds": 0}
+
+    def slow(db, logged_in):
+        time.sleep(delay["seconds"])
+        return [{"id": "slow"}]
+
+    aggregator = HomeAggregator(
+        [HomeSection("fast", 60, fast, Item), HomeSection("slow", 0.01, slow, Item)]
+    )
+    assert asyncio.run(aggregator.build(logged_in=False, timeout=1))["slow"] == [{"id": "slow"}]
+
+    time.sleep(0.02)  # let the slow section expire
+    delay["seconds"] = 0.2
+    payload = asyncio.run(aggregator.build(logged_in=False, timeout=0.05))
+    assert payload["fast"] == [{"id": "out"}]
+    assert payload["slow"] == [{"id": "slow"}]
+    assert payload["degraded"] == ["slow"]
+
+
+def test_failing_section_is_empty_without_a_good_copy():
+    def broken(db, logged_in):
+        raise RuntimeError("down")
+
+    aggregator = HomeAggregator([HomeSection("broken", 60, broken, Item)])
+    assert asyncio.run(aggregator.build(logged_in=False, timeout=1)) == {"broken": [], "degraded": ["broken"]}
+
+
+def test_etag_is_stable_and_matches_if_none_match():
+    body, etag = encode_payload({"b": [1], "a": None})
+    assert body == b'{"a":null,"b":[1]}'
+    assert encode_payload({"a": None, "b": [1]})[1] == etag
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
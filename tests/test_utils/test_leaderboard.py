@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from app.utils.leaderboard import MONTHLY, WEEKLY, LeaderboardService, RankIndex, period_key
+
+
+def test_rank_index_orders_by_score_then_user():
+    board = RankIndex()
+    for user_id, score in [("c", 10), ("a", 30), ("b", 10), ("d", 20)]:
+        board.set(user_id, score)
+
+    assert board.slice(0, 10) == [(1, "a", 30), (2, "d", 20), (3, "b", 10), (4, "c", 10)]
+    assert board.rank("b") == 3
+    assert board.rank("missing") is None
+
+
+def test_rank_index_updates_and_around():
+    board = RankIndex()
+    for i in range(10):
+        board.set(f"u{i}", i)
+
+    board.add("u0", 100)
+    assert board.rank("u0") == 1
+    assert board.around("u5", 1) == [(5, "u6", 6), (6, "u5", 5), (7, "u4", 4)]
+    # Radius is clipped at the top of the board
+    assert [rank for rank, _, _ in board.around("u0", 2)] == [1, 2, 3]
+
+    board.remove("u0")
+    assert len(board) == 9
+    assert board.rank("u9") == 1
+
+
+def test_period_keys():
+    at = datetime(2026, 1, 1)
+    assert period_key(WEEKLY, at) == "2026-W01"
+    assert period_key(MONTHLY, at) == "2026-01"
+
+
+def test_service_records_points_on_all_boards():
+    service = LeaderboardService()
+    service.add_points("u1", 5)
+    service.add_points("u2", 8)
+    service.add_points("u1", 4)
+
+    for period in ("all_time", WEEKLY, MONTHLY):
+        assert service.rank(period, "u1") == (1, 9, 2)
+    assert [user_id for _, user_id, _ in service.top(WEEKLY)] == ["u1", "u2"]
@@ -0,0 +1,55 @@
+from app.core.metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_counter_and_gauge_render_with_labels():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "Requests.", ("route", "status")))
+    in_flight = registry.register(Gauge("in_flight", "In flight."))
+    pool = registry.register(Gauge("pool", "Pool.", ("state",), lambda: {("busy",): 3}))
+
+    child = requests.labels("/items/{id}", "200")
+    child.inc()
+    child.inc()
+    assert requests.labels("/items/{id}", "200") is child
+    in_flight.inc()
+    in_flight.dec()
+
+    text = registry.render()
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{route="/items/{id}",status="200"} 2' in text
+    assert "in_flight 0" in text
+    assert 'pool{state="busy"} 3' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    child = histogram.labels("/")
+    for value in (0.05, 0.1, 0.5, 2.0):
+        child.observe(value)
+
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{route="/",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/"} 2.65' in lines
+    assert 'latency_seconds_count{route="/"} 4' in lines
+
+
+def test_label_values_are_escaped():
+    counter = Counter("c", "C.", ("path",))
+    counter.labels('a"b\\c').inc()
+    assert 'c{path="a\\"b\\\\c"} 1' in counter.render()
+
+
+def test_route_template_restores_path_parameters():
+    from app.core.query_profiler import UNMATCHED_ROUTE, route_template
+
+    route = object()
+    assert route_template({"path": "/x"}) == UNMATCHED_ROUTE
+    assert route_template({"route": route, "path": "/api/v1/home/", "path_params": {}}) == "/api/v1/home/"
+    assert route_template(
+        {"route": route, "path": "/api/v1/quizzes/q1/attempts/a1", "path_params": {"quiz_id": "q1", "attempt_id": "a1"}}
+    ) == "/api/v1/quizzes/{quiz_id}/attempts/{attempt_id}"
+    assert route_template(
+        {"route": route, "path": "/api/v1/series/series", "path_params": {"slug": "series"}}
+    ) == "/api/v1/series/{slug}"
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
+
+
+def test_cursor_round_trip():
+    started_at = datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor(started_at, "attempt-1")
+    value, attempt_id = decode_cursor(cursor, 2)
+    assert decode_datetime(value) == started_at
+    assert attempt_id == "attempt-1"
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor("only-one"), encode_cursor({"a": 1}, 2)[:-2]])
+def test_bad_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.query_profiler import QueryBudgetExceeded, check_query_budget, count_queries, query_budget
+
+engine = create_engine("sqlite://")
+
+
+def run(statement: str, times: int = 1) -> None:
+    with engine.connect() as conn:
+        for i in range(times):
+            conn.execute(text(statement), {"id": i})
+
+
+def test_counts_statements_and_repeats():
+    with count_queries() as stats:
+        run("SELECT 1")
+        run("SELECT :id", times=3)
+    assert stats.queries == 4
+    assert stats.query_seconds > 0
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+
+    run("SELECT 1")  # outside the block
+    assert stats.queries == 4
+
+
+def test_budget_and_repeats_raise_in_strict_mode(monkeypatch):
+    monkeypatch.setattr(settings, "SQL_QUERY_BUDGET_STRICT", True)
+    monkeypatch.setattr(settings, "SQL_REPEATED_STATEMENT_THRESHOLD", 5)
+
+    @query_budget(2)
+    def endpoint():
+        pass
+
+    with count_queries() as stats:
+        run("SELECT 1", times=2)
+    check_query_budget("/items", endpoint, stats)
+
+    with count_queries() as stats:
+        run("SELECT 1", times=3)
+    with pytest.raises(QueryBudgetExceeded, match=r"/items: 3 queries \(budget 2\)"):
+        check_query_budget("/items", endpoint, stats)
+
+    with count_queries() as stats:
+        run("SELECT :id", times=5)
+    with pytest.raises(QueryBudgetExceeded, match="repeated 5x: SELECT ?"):
+        check_query_budget("/items", None, stats)
@@ -0,0 +1,35 @@
+from app.utils.quiz_analytics import (
+    ANSWER_SELECTED, ATTEMPTS, QUESTION_ANSWERED, QUESTION_CORRECT, SCORE_BUCKET, TIME_BUCKET,
+    attempt_counters, score_bucket, time_bucket, time_percentiles,
+)
+from app.utils.quiz_grading import AnswerKey, QuestionKey
+
+
+def test_buckets():
+    assert [score_bucket(s) for s in (0, 9.99, 10, 55, 100)] == ["0", "0", "1", "5", "9"]
+    assert [time_bucket(t) for t in (0, 10, 11, 3600, 3601)] == ["10", "10", "20", "3600", "inf"]
+
+
+def test_attempt_counters():
+    key = AnswerKey("quiz", 1, {
+        "q1": QuestionKey(1, False, frozenset({"a1"}), frozenset({"a1", "a2"})),
+        "q2": QuestionKey(1, True, frozenset({"paris"})),
+    })
+    answers = {"q1": ["a2", "bogus"], "q2": "Paris"}
+    counters = attempt_counters(key, answers, key.grade(answers, 70.0), time_taken=42)
+
+    assert counters == {
+        (ATTEMPTS, ""): 1,
+        (SCORE_BUCKET, "5"): 1,
+        (TIME_BUCKET, "45"): 1,
+        (QUESTION_ANSWERED, "q1"): 1,
+        (QUESTION_ANSWERED, "q2"): 1,
+        (QUESTION_CORRECT, "q2"): 1,
+        (ANSWER_SELECTED, "a2"): 1,
+    }
+
+
+def test_time_percentiles():
+    assert time_percentiles({}) == {"p50": None, "p90": None, "p99": None}
+    buckets = {"30": 50, "60": 40, "inf": 10}
+    assert time_percentiles(buckets) == {"p50": 30, "p90": 60, "p99": None}
@@ -0,0 +1,48 @@
+import json
+from types import SimpleNamespace
+
+from app.utils.quiz_delivery import build_quiz_blob
+
+
+def _quiz(randomize=True):
+    questions = [
+        SimpleNamespace(
+            id=f"q{i}", question_text=f"Question {i}", question_type="multiple_choice",
+            points=1, order=i, explanation="because",
+            answers=[
+                SimpleNamespace(id=f"q{i}a{j}", answer_text=str(j), order=j, is_correct=j == 0, explanation=None)
+                for j in range(4)
+            ],
+        )
+        for i in range(8)
+    ]
+    return SimpleNamespace(
+        id="quiz", title="Quiz", description=None, content_type="post", content_id="p",
+        passing_score=70.0, time_limit=None, randomize_questions=randomize,
+        show_correct_answers=True, version=3, questions=questions,
+    )
+
+
+def test_learner_payload_strips_answers():
+    payload = json.loads(build_quiz_blob(_quiz(False), include_answers=False).render("s"))
+    assert payload["version"] == 3 and payload["seed"] == "s"
+    assert [q["id"] for q in payload["questions"]] == [f"q{i}" for i in range(8)]
+    question = payload["questions"][0]
+    assert "explanation" not in question
+    assert question["answers"][0] == {"id": "q0a0", "answer_text": "0", "order": 0}
+
+    author = json.loads(build_quiz_blob(_quiz(False), include_answers=True).render("s"))
+    assert author["questions"][0]["answers"][0]["is_correct"] is True
+
+
+def test_shuffle_is_seeded():
+    blob = build_quiz_blob(_quiz(), include_answers=False)
+    first = json.loads(blob.render("attempt-1"))
+    assert json.loads(blob.render("attempt-1")) == first
+
+    orders = {
+        tuple(q["id"] for q in json.loads(blob.render(f"attempt-{n}"))["questions"])
+        for n in range(5)
+    }
+    assert len(orders) > 1
+    assert sorted(q["id"] for q in first["questions"]) == [f"q{i}" for i in range(8)]
@@ -0,0 +1,32 @@
+from app.utils.quiz_grading import AnswerKey, QuestionKey
+
+
+def _key():
+    return AnswerKey("quiz", 1, {
+        "q1": QuestionKey(1, False, frozenset({"a1"})),
+        "q2": QuestionKey(2, False, frozenset({"b1", "b3"})),
+        "q3": QuestionKey(1, True, frozenset({"paris"})),
+    })
+
+
+def test_grade_scores_by_points():
+    result = _key().grade({"q1": "a1", "q2": ["b3", "b1"], "q3": "  PARIS "}, 70.0)
+    assert result["score"] == 100.0
+    assert result["passed"] is True
+    assert result["earned_points"] == result["total_points"] == 4
+
+
+def test_grade_requires_exact_choice_set():
+    # Partial or extra selections on multi-answer questions earn nothing
+    result = _key().grade({"q1": "a1", "q2": ["b1"], "q3": "london"}, 70.0)
+    assert result["score"] == 25.0
+    assert result["passed"] is False
+    assert result["correct_questions"] == ["q1"]
+
+    assert _key().grade({"q2": ["b1", "b2", "b3"]}, 0)["earned_points"] == 0
+
+
+def test_grade_ignores_unknown_questions_and_empty_quiz():
+    assert _key().grade({"nope": "a1", "q1": None}, 50.0)["score"] == 0.0
+    empty = AnswerKey("quiz", 1, {}).grade({"q1": "a1"}, 0)
+    assert empty["score"] == 0.0 and empty["passed"] is False
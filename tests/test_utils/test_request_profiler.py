@@ -0,0 +1,41 @@
+import threading
+import time
+
+from app.core.request_profiler import ProfileStore, StackSampler
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_collapses_busy_thread_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy worker")
+    worker.start()
+    sampler = StackSampler(0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert sampler.samples > 0
+    busy = [line for line in sampler.collapsed().splitlines() if line.startswith("busy_worker;")]
+    assert busy
+    stack, count = busy[0].rsplit(" ", 1)
+    assert stack.endswith(f"{__name__}:_busy_loop")
+    assert int(count) > 0
+
+
+def test_store_rotates_oldest_and_validates_names(tmp_path):
+    store = ProfileStore(str(tmp_path), max_files=2)
+    names = [f"20260101T00000{i}Z-0000000{i}.collapsed" for i in range(3)]
+    for name in names:
+        store.save(name, "main;app:handler 1\n")
+
+    assert [profile["name"] for profile in store.list()] == [names[2], names[1]]
+    assert store.read(names[2]) == "main;app:handler 1\n"
+    assert store.read(names[0]) is None
+    assert store.read("../.env") is None
+    assert ProfileStore(str(tmp_path / "missing"), max_files=2).list() == []
@@ -0,0 +1,75 @@
+from app.core import server
+from app.core.config import settings
+from app.utils.home import HOME_SECTIONS
+
+
+def test_pool_limits_split_the_connection_budget(monkeypatch):
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(settings, "DB_RESERVED_CONNECTIONS", 10)
+    monkeypatch.setattr(settings, "DB_MIN_POOL_SIZE", 8)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", None)
+
+    assert server.pool_limits(1) == (45, 45)
+    assert server.pool_limits(4) == (11, 11)
+    assert server.pool_limits(8) == (8, 3)
+    for workers in range(1, 12):
+        pool_size, max_overflow = server.pool_limits(workers)
+        assert workers * (pool_size + max_overflow) <= 90
+
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 10)
+    assert server.pool_limits(4) == (10, 0)
+
+
+def test_pool_never_drops_below_the_floor(monkeypatch):
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(settings, "DB_RESERVED_CONNECTIONS", 10)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", None)
+
+    # Room for every /home section's session next to the request's own
+    assert settings.DB_MIN_POOL_SIZE > len(HOME_SECTIONS)
+    for workers in (1, 12, 64, 500):
+        assert server.pool_limits(workers)[0] >= settings.DB_MIN_POOL_SIZE
+
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+    assert server.pool_limits(1) == (settings.DB_MIN_POOL_SIZE, 0)
+
+
+def test_worker_count_is_one_unless_the_launcher_says_otherwise(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_WORKERS", 3)
+    monkeypatch.setattr(server, "available_cpus", lambda: 64)
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    assert server.worker_count() == 1
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "6")
+    assert server.worker_count() == 6
+
+
+def test_production_worker_count(monkeypatch):
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(settings, "DB_RESERVED_CONNECTIONS", 10)
+    monkeypatch.setattr(settings, "DB_MIN_POOL_SIZE", 8)
+    monkeypatch.setattr(settings, "WEB_WORKERS", 3)
+    monkeypatch.setenv("WEB_CONCURRENCY", "6")
+    assert server.production_worker_count() == 6
+
+    monkeypatch.delenv("WEB_CONCURRENCY")
+    assert server.production_worker_count() == 3
+
+    monkeypatch.setattr(settings, "WEB_WORKERS", None)
+    monkeypatch.setattr(server, "available_cpus", lambda: 2)
+    assert server.production_worker_count() == 2
+
+    # 64 CPUs, but the budget only has room for 90 // 8 workers
+    monkeypatch.setattr(server, "available_cpus", lambda: 64)
+    assert server.production_worker_count() == 11
+
+
+def test_available_cpus_reads_the_container_quota(tmp_path, monkeypatch):
+    cpu_max = tmp_path / "cpu.max"
+    monkeypatch.setattr(server, "_CGROUP_CPU_MAX", str(cpu_max))
+
+    cpu_max.write_text("150000 100000\n")
+    assert server.available_cpus() == 2
+
+    cpu_max.write_text("max 100000\n")
+    assert server.available_cpus() >= 1
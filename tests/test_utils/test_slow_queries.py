@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.slow_queries import (
+    SlowQueryLog,
+    attach_slow_query_log,
+    explain_command,
+    normalize_sql,
+    parameter_shape,
+    slow_query_log,
+)
+
+
+def test_normalize_sql_collapses_literals_and_in_lists():
+    assert normalize_sql(
+        "SELECT *\n  FROM posts WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s) AND title = 'it''s' LIMIT 10"
+    ) == "SELECT * FROM posts WHERE id IN (...) AND title = ? LIMIT ?"
+    assert normalize_sql("SELECT col1 FROM t WHERE a IN (?, ?)") == "SELECT col1 FROM t WHERE a IN (...)"
+
+
+def test_parameter_shape_keeps_types_not_values():
+    assert parameter_shape({"email": "a@b.c", "age": 3, "deleted": None}) == {
+        "email": "str", "age": "int", "deleted": "null"
+    }
+    assert parameter_shape(("x", 1.5)) == ["str", "float"]
+    assert parameter_shape([{"id": "a"}, {"id": "b"}], executemany=True) == {"rows": 2, "row": {"id": "str"}}
+
+
+def test_only_plain_selects_are_explain_analyzed():
+    analyze = "EXPLAIN (ANALYZE, BUFFERS)"
+    assert explain_command("SELECT * FROM posts WHERE id = %(id)s") == analyze
+    assert explain_command("  (SELECT 1) UNION (SELECT 2)") == analyze
+    assert explain_command("SELECT * FROM posts WHERE title = 'for update'") == analyze
+
+    # Run again by ANALYZE, these would write or take locks
+    assert explain_command("WITH moved AS (DELETE FROM a RETURNING *) SELECT * FROM moved") == "EXPLAIN"
+    assert explain_command("SELECT * FROM jobs LIMIT 1 FOR UPDATE SKIP LOCKED") == "EXPLAIN"
+    assert explain_command("select * from jobs for no key update") == "EXPLAIN"
+    assert explain_command("SELECT * FROM jobs FOR KEY SHARE") == "EXPLAIN"
+    assert explain_command("SELECT * INTO archive FROM jobs") == "EXPLAIN"
+    assert explain_command("UPDATE posts SET views = views + 1") == "EXPLAIN"
+
+    assert explain_command("SAVEPOINT sa_1") is None
+    assert explain_command("") is None
+
+
+def test_ring_buffer_keeps_newest():
+    log = SlowQueryLog(maxlen=2)
+    for i in range(3):
+        log.record({"n": i})
+    assert log.entries() == [{"n": 2}, {"n": 1}]
+
+
+def test_records_slow_statements(monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_SAMPLE_RATE", 1.0)
+    engine = create_engine("sqlite://")
+    attach_slow_query_log(engine)
+    slow_query_log.clear()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT :value"), {"value": 42})
+
+    entry = slow_query_log.entries()[0]
+    assert entry["statement"] == "SELECT ?"
+    assert entry["parameters"] == ["int"]
+    assert entry["route"] is None and entry["explain"] is None
+
+    monkeypatch.setattr(settings, "SLOW_QUERY_SAMPLE_RATE", 0.0)
+    slow_query_log.clear()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert slow_query_log.entries() == []
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+import queue
+import sys
+
+from app.core.structured_logging import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RequestIdFilter,
+    RequestIdMiddleware,
+    SamplingFilter,
+    current_request_id,
+)
+
+
+def _record(name="app.test", level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields_and_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app.test", logging.ERROR, __file__, 1, "failed %d", (3,), sys.exc_info())
+    record.request_id = "abc"
+    record.course_id = "course-1"
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "app.test"
+    assert entry["message"] == "failed 3"
+    assert entry["request_id"] == "abc"
+    assert entry["course_id"] == "course-1"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_request_id_filter_reads_context():
+    token = current_request_id.set("req-1")
+    try:
+        record = _record()
+        assert RequestIdFilter().filter(record)
+    finally:
+        current_request_id.reset(token)
+    assert record.request_id == "req-1"
+    assert not hasattr(_record(), "request_id")
+
+
+def test_sampling_filter_by_logger_prefix_and_level():
+    sampler = SamplingFilter({"uvicorn.access": 0.0, "app.noisy": 1.0})
+
+    assert not sampler.filter(_record("uvicorn.access"))
+    assert not sampler.filter(_record("uvicorn.access.child"))
+    assert sampler.filter(_record("uvicorn.access", level=logging.WARNING))
+    assert sampler.filter(_record("app.noisy"))
+    assert sampler.filter(_record("app.other"))
+
+
+def test_sampling_keeps_or_drops_whole_requests():
+    sampler = SamplingFilter({"app": 0.5})
+    for request_id in ("a", "b", "c", "d"):
+        decisions = {sampler.filter(_record(request_id=request_id)) for _ in range(5)}
+        assert len(decisions) == 1
+
+
+def test_queue_handler_resolves_messages_and_drops_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record())
+    handler.handle(_record())
+
+    queued = handler.queue.get_nowait()
+    assert queued.getMessage() == "hello world"
+    assert queued.args is None
+    assert handler.dropped == 1
+
+
+def test_middleware_echoes_valid_and_replaces_invalid_ids():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(current_request_id.get())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def run(headers):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await RequestIdMiddleware(app)({"type": "http", "headers": headers}, None, send)
+        return dict(sent[0]["headers"])[b"x-request-id"].decode()
+
+    assert asyncio.run(run([(b"x-request-id", b"edge-123")])) == "edge-123"
+    generated = asyncio.run(run([(b"x-request-id", b"bad id\nwith newline")]))
+    assert generated != "bad id\nwith newline" and len(generated) == 32
+    assert seen == ["edge-123", generated]
+    assert current_request_id.get() is None
@@ -0,0 +1,58 @@
+import io
+
+from app.utils.subscriber_import import chunked, detect_format, iter_rows, prepare_chunk
+
+
+def test_detect_format() -> None:
+    """
+    Test that the import format is taken from the parameter, extension or content type
+    """
+    assert detect_format("leads.csv", None) == "csv"
+    assert detect_format("leads.jsonl", None) == "ndjson"
+    assert detect_format("leads", "application/x-ndjson") == "ndjson"
+    assert detect_format("leads.csv", "text/csv", explicit="ndjson") == "ndjson"
+    assert detect_format("leads.xlsx", None) is None
+
+
+def test_iter_rows_csv() -> None:
+    """
+    Test that CSV headers are normalized and rows are streamed as dicts
+    """
+    data = io.BytesIO(b"Email,Name\nuser@example.com,User\n")
+    rows = list(iter_rows(data, "csv"))
+    assert rows == [{"email": "user@example.com", "name": "User"}]
+    assert not data.closed
+
+
+def test_iter_rows_ndjson_marks_bad_lines() -> None:
+    """
+    Test that malformed NDJSON lines are yielded as None instead of aborting the import
+    """
+    data = io.BytesIO(b'{"email": "a@example.com"}\nnot-json\n\n[1, 2]\n')
+    rows = list(iter_rows(data, "ndjson"))
+    assert rows == [{"email": "a@example.com"}, None, None]
+
+
+def test_prepare_chunk_dedupes_and_validates() -> None:
+    """
+    Test that a chunk is de-duplicated by normalized address (local part case kept) and invalid rows are counted
+    """
+    chunk = [
+        {"email": "Jane@example.com"},
+        {"email": " Jane@EXAMPLE.com "},
+        {"email": "jane@example.com"},
+        {"email": "not-an-email"},
+        None,
+        {"email": "b@example.com"},
+    ]
+    prepared = prepare_chunk(chunk)
+    assert [email for email, _ in prepared["rows"]] == ["Jane@example.com", "jane@example.com", "b@example.com"]
+    assert prepared["duplicates"] == 1
+    assert prepared["invalid"] == 2
+
+
+def test_chunked() -> None:
+    """
+    Test that iterables are split into fixed-size chunks
+    """
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
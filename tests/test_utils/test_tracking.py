@@ -0,0 +1,30 @@
+from app.core.tracking import (
+    BANNER_CLICK, EMAIL_CLICK, EMAIL_OPEN, TrackingBuffer, make_token, read_token
+)
+
+
+def test_token_round_trip():
+    token = make_token(EMAIL_OPEN, ("email-1", "delivery-1"))
+    assert read_token(EMAIL_OPEN, token) == ("email-1", "delivery-1")
+
+
+def test_token_rejects_tampering():
+    token = make_token(EMAIL_CLICK, ("email-1", "delivery-1"), "https://example.com/a")
+    # Different redirect target, kind or ids must not verify
+    assert read_token(EMAIL_CLICK, token, "https://evil.example.com") is None
+    assert read_token(BANNER_CLICK, token, "https://example.com/a") is None
+    assert read_token(EMAIL_CLICK, token.replace("email-1", "email-2"), "https://example.com/a") is None
+    assert read_token(EMAIL_OPEN, "garbage") is None
+
+
+def test_buffer_drain_aggregates_and_overwrites_oldest():
+    buffer = TrackingBuffer(maxlen=3)
+    buffer.record(EMAIL_OPEN, "a")
+    buffer.record(EMAIL_OPEN, "b")
+    buffer.record(EMAIL_OPEN, "b")
+    buffer.record(BANNER_CLICK, "x")
+
+    counts = buffer.drain()
+    assert counts == {EMAIL_OPEN: {"b": 2}, BANNER_CLICK: {"x": 1}}
+    assert buffer.dropped == 1
+    assert len(buffer) == 0